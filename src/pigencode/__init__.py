@@ -1,10 +1,30 @@
 # Expose PiGenCode submodule
-from .classes.piGermSeeds import PiGermSeeds, germinateSeeds
-from .classes.piSeeds import PiSeeds, piSeedTitelSplit, PiSeedTypes
-from .classes.piGenCode import PiGenCode, genPiPiClass
-from .classes.piGenDefCode import genPiDefCode
-from .classes.piGenClassCode import genPiGenClass
-from .defs.fileIO import piGenCodeDirs, piGCDirs, getKeyItem, setKeyItem, readJson, piLoadPiClassGCJson, getKeyItem, writeRC
-from .defs.logIt import logIt, printIt, label, getCodeFile, getCodeLine, germDbug
-from .defs.piID import getPiMD5, getPiID
-from .defs.piJsonFile import readPiStruc, writePiStruc, readPiDefault, writePiDefault, writePi, PiClassGCFiles, PiDefGCFiles, PiGenClassFiles
+# Names are imported from their submodules on first access, so the CLI entry
+# point (pigencode.main) does not load the whole package.
+from importlib import import_module
+
+_lazyExports = {
+    ".classes.piGermSeeds": ("PiGermSeeds", "germinateSeeds"),
+    ".classes.piSeeds": ("PiSeeds", "piSeedTitelSplit", "PiSeedTypes"),
+    ".classes.piGenCode": ("PiGenCode", "genPiPiClass"),
+    ".classes.piGenDefCode": ("genPiDefCode",),
+    ".classes.piGenClassCode": ("genPiGenClass",),
+    ".defs.fileIO": ("piGenCodeDirs", "piGCDirs", "getKeyItem", "setKeyItem", "readJson", "piLoadPiClassGCJson", "writeRC"),
+    ".defs.logIt": ("logIt", "printIt", "label", "getCodeFile", "getCodeLine", "germDbug"),
+    ".defs.piID": ("getPiMD5", "getPiID"),
+    ".defs.piJsonFile": ("readPiStruc", "writePiStruc", "readPiDefault", "writePiDefault", "writePi", "PiClassGCFiles", "PiDefGCFiles", "PiGenClassFiles"),
+}
+_lazyNames = {name: moduleName for moduleName, names in _lazyExports.items() for name in names}
+
+__all__ = list(_lazyNames)
+
+def __getattr__(name: str):
+    moduleName = _lazyNames.get(name)
+    if moduleName is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(moduleName, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazyNames))
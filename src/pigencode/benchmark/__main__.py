@@ -0,0 +1,65 @@
+import sys, tempfile, shutil, argparse
+from json import JSONDecodeError
+from pathlib import Path
+from .piSeedGenerator import defaultBenchConfig
+from .piBenchmark import runBenchmark, writeReport, readReport, compareReports
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m pigencode.benchmark",
+        description="Time readSeedPis, PiGermSeeds, genCodeFile and syncAllFiles on a synthetic piSeed tree.")
+    for configKey, configValue in defaultBenchConfig.items():
+        parser.add_argument(f'--{configKey}', type=int, default=configValue,
+                            help=f'default: {configValue}')
+    parser.add_argument('--repeat', type=int, default=3, help='cold runs per phase, default: 3')
+    parser.add_argument('--report', help='write the JSON report to this file')
+    parser.add_argument('--baseline', help='compare with a JSON report saved earlier')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='allowed slowdown against the baseline, default: 0.1 (10%%)')
+    parser.add_argument('--workspace', help='directory for the seed tree (kept); a temporary one by default')
+    parser.add_argument('--verbose', action='store_true', help='show pipeline output')
+    args = parser.parse_args()
+
+    config = {configKey: getattr(args, configKey) for configKey in defaultBenchConfig}
+    workspace = Path(args.workspace) if args.workspace else Path(tempfile.mkdtemp(prefix="piBench"))
+    reportFile = Path(args.report) if args.report else None
+    baselineFile = Path(args.baseline) if args.baseline else None
+    # read first so a missing baseline is reported before the runs
+    baseline = None
+    if baselineFile:
+        try:
+            baseline = readReport(baselineFile)
+        except (OSError, JSONDecodeError) as e:
+            parser.error(f'cannot read --baseline {baselineFile}: {e}')
+        if not isinstance(baseline, dict):
+            parser.error(f'--baseline {baselineFile} is not a benchmark report')
+    try:
+        report = runBenchmark(workspace, config, args.repeat, quiet=not args.verbose)
+    finally:
+        if not args.workspace:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    counts = report["counts"]
+    print(f'{counts["seedFiles"]} seed files, {counts["seeds"]} seeds, '
+          f'{counts["codeFiles"]} code files, best of {report["repeat"]}:')
+    for phase, phaseTimes in report["phases"].items():
+        print(f'  {phase:<14}{phaseTimes["min"] * 1000:10.1f}ms  (mean {phaseTimes["mean"] * 1000:.1f}ms)')
+    print(f'  {"total":<14}{report["total"] * 1000:10.1f}ms')
+    if reportFile:
+        writeReport(report, reportFile)
+        print(f'report written: {reportFile}')
+
+    regressed = False
+    if baselineFile:
+        if baseline.get("config") != report["config"]:
+            print(f'warning: baseline {baselineFile.name} was run with a different config')
+        print(f'compared with {baselineFile.name} (tolerance {args.tolerance:.0%}):')
+        for phase, phaseCompare in compareReports(report, baseline, args.tolerance).items():
+            status = "REGRESSED" if phaseCompare["regressed"] else "ok"
+            print(f'  {phase:<14}{phaseCompare["baseline"] * 1000:10.1f}ms ->{phaseCompare["current"] * 1000:10.1f}ms'
+                  f'  x{phaseCompare["ratio"]:.2f}  {status}')
+            regressed = regressed or phaseCompare["regressed"]
+    return 1 if regressed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+import os, sys, time, shutil, platform
+from contextlib import redirect_stdout
+from datetime import datetime
+from json import load, dump
+from pathlib import Path
+from .piSeedGenerator import defaultBenchConfig, writeSeedTree
+
+# timed pipeline phases in the order they run
+benchPhases = ("readSeedPis", "PiGermSeeds", "genCodeFile", "syncAllFiles")
+benchReportVersion = 1
+
+def _chkWorkspace(workspace: Path):
+    # fileIO takes the rc file name from the cwd it is first imported in
+    fileIO = sys.modules.get("pigencode.defs.fileIO")
+    if fileIO is not None and fileIO.rcFileName.parent != workspace:
+        raise RuntimeError(f'pigencode was imported outside the benchmark workspace {workspace}; '
+                           'run the benchmark in a new process (python -m pigencode.benchmark)')
+
+def _resetPipeline():
+    '''Remove every file the last run wrote and the process caches that
+       describe them, so each run starts cold.'''
+    from pigencode.defs.fileIO import getKeyItem, piGCDirs
+    from pigencode.defs import piJsonFile, piParseCache, getSeedPath
+    from pigencode.defs.piTrackingFile import trackingFileLines, trackingRegistryFileName
+    from pigencode.defs.piSyncCode import piSeedIndex
+    for piGCDir in piGCDirs:
+        shutil.rmtree(getKeyItem(piGCDir), ignore_errors=True)
+    if os.path.isfile(trackingRegistryFileName):
+        os.remove(trackingRegistryFileName)
+    trackingFileLines.clear()
+    piJsonFile.piTemplateCache.clear()
+    piJsonFile.piGermDirIndexes.clear()
+    piParseCache.clearParseCache()
+    piSeedIndex.piSeedIndex = None
+    getSeedPath.ensuredSeedPaths.clear()
+
+def _runPipeline(benchConfig: dict, runTimes: dict[str, list[float]]) -> dict:
+    from pigencode.defs.fileIO import getKeyItem, piGCDirs
+    from pigencode.defs.getSeedPath import getSeedPath
+    from pigencode.defs.piTrackingFile import flushTrackingFiles
+    from pigencode.classes.piSeeds import PiSeeds, readSeedPis
+    from pigencode.classes.piGermSeeds import PiGermSeeds
+    from pigencode.commands.genCode import genCodeFile
+    from pigencode.defs.piSyncCode.piSyncCode import syncAllFiles
+    from pigencode.commands.germSeed import seedFilePattern
+
+    _resetPipeline()
+    seedPath = getSeedPath()
+    # seeds name the directories genCode writes to so syncAllFiles finds them again
+    writeSeedTree(seedPath, benchConfig, {"piClassGC": getKeyItem(piGCDirs[2]),
+                                          "piDefGC": getKeyItem(piGCDirs[3]),
+                                          "piGenClass": getKeyItem(piGCDirs[4])})
+    seedFiles = sorted(str(seedFile) for seedFile in seedPath.iterdir()
+                       if seedFilePattern.match(seedFile.name))
+
+    startTime = time.perf_counter()
+    seedCount = 0
+    for seedFile in seedFiles:
+        seedCount += len(readSeedPis(seedFile))
+    runTimes["readSeedPis"].append(time.perf_counter() - startTime)
+
+    # PiSeeds reads the file; only germination is timed
+    germTime = 0.0
+    for seedFile in seedFiles:
+        piSeeds = PiSeeds(seedFile)
+        startTime = time.perf_counter()
+        PiGermSeeds(piSeeds)
+        germTime += time.perf_counter() - startTime
+    runTimes["PiGermSeeds"].append(germTime)
+
+    startTime = time.perf_counter()
+    codeFiles = genCodeFile()
+    flushTrackingFiles()
+    runTimes["genCodeFile"].append(time.perf_counter() - startTime)
+
+    startTime = time.perf_counter()
+    syncAllFiles({})
+    flushTrackingFiles()
+    runTimes["syncAllFiles"].append(time.perf_counter() - startTime)
+
+    return {"seedFiles": len(seedFiles), "seeds": seedCount, "codeFiles": len(codeFiles)}
+
+def runBenchmark(workspace, config: dict | None = None, repeat: int = 3, quiet: bool = True) -> dict:
+    '''
+        Write a synthetic piSeed tree to workspace and time each pipeline
+        phase over repeat cold runs. The pipeline runs with workspace as
+        the working directory, which must be set before pigencode modules
+        are imported. Returns the benchmark report.
+    '''
+    workspace = Path(workspace).absolute()
+    workspace.mkdir(parents=True, exist_ok=True)
+    startDir = os.getcwd()
+    os.chdir(workspace)
+    try:
+        _chkWorkspace(workspace)
+        benchConfig = dict(defaultBenchConfig)
+        if config: benchConfig.update(config)
+        runTimes: dict[str, list[float]] = {phase: [] for phase in benchPhases}
+        counts = {}
+        for _ in range(max(repeat, 1)):
+            if quiet:
+                with open(os.devnull, 'w') as devNull, redirect_stdout(devNull):
+                    counts = _runPipeline(benchConfig, runTimes)
+            else:
+                counts = _runPipeline(benchConfig, runTimes)
+        # written now, the workspace may be removed before exit
+        from pigencode.defs.fileIO import flushRC
+        from pigencode.defs.logIt import flushLogs
+        flushRC()
+        flushLogs()
+    finally:
+        os.chdir(startDir)
+    phases = {}
+    for phase, phaseTimes in runTimes.items():
+        phases[phase] = {"min": min(phaseTimes),
+                         "mean": sum(phaseTimes) / len(phaseTimes),
+                         "runs": phaseTimes}
+    return {
+        "version": benchReportVersion,
+        "date": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": benchConfig,
+        "repeat": len(runTimes[benchPhases[0]]),
+        "counts": counts,
+        "phases": phases,
+        "total": sum(phaseTimes["min"] for phaseTimes in phases.values())
+    }
+
+def writeReport(report: dict, reportFile):
+    with open(reportFile, 'w') as f:
+        dump(report, f, indent=2)
+
+def readReport(reportFile) -> dict:
+    with open(reportFile, 'r') as f:
+        return load(f)
+
+def compareReports(report: dict, baseline: dict, tolerance: float = 0.1) -> dict:
+    '''
+        Compare the fastest run of each phase with baseline. A phase has
+        regressed when it is more than tolerance (0.1 = 10%) slower.
+        Returns {phase: {"baseline", "current", "ratio", "regressed"}}.
+    '''
+    comparison = {}
+    for phase, phaseTimes in report["phases"].items():
+        baselineTimes = baseline.get("phases", {}).get(phase)
+        if not baselineTimes: continue
+        ratio = phaseTimes["min"] / baselineTimes["min"] if baselineTimes["min"] else 0.0
+        comparison[phase] = {"baseline": baselineTimes["min"],
+                             "current": phaseTimes["min"],
+                             "ratio": ratio,
+                             "regressed": ratio > 1 + tolerance}
+    return comparison
@@ -0,0 +1,153 @@
+from pathlib import Path
+
+# number of each piSeed type written and the size of each one
+defaultBenchConfig = {
+    "piStructs": 5,         # piStruct seed files
+    "piClassGCs": 20,       # piClassGC seed files, one class each
+    "piDefGCs": 10,         # piDefGC seed files
+    "piGenClasses": 10,     # piGenClass seed files
+    "classes": 3,           # classes in each piGenClass seed
+    "methods": 5,           # methods in each class, functions in each piDefGC seed
+    "codeLines": 10,        # code lines in each method or function body
+    "fields": 4             # piStruct fields and piClassGC init arguments
+}
+# the base piStruct seeds written by getSeedPath use piSeed000 - piSeed010
+firstSeedNumber = 11
+
+def _quote(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def _codeLines(indent: str, codeLines: int) -> list[str]:
+    lines = [f'{indent}total = count']
+    for lineNo in range(1, max(codeLines, 2) - 1):
+        lines.append(f'{indent}total = total + {lineNo} * count  # step {lineNo}')
+    lines.append(f'{indent}return total')
+    return lines
+
+def _seedHead(piType: str, piTitle: str, piSD: str) -> list[str]:
+    return [
+        f"{piType} {piTitle} '{piSD}'",
+        f"piValue {piTitle}.piProlog pi.piProlog",
+        f"piValue {piTitle}.piBase:piType {piType}",
+        f"piValue {piTitle}.piBase:piTitle {piTitle}",
+        f"piValue {piTitle}.piBase:piSD '{piSD}'"]
+
+def genPiStructSeed(piTitle: str, config: dict, fileDirectory: str | None = None) -> str:
+    lines = [f"# piStruct_{piTitle}",
+             f"piStruct {piTitle} 'Defines a synthetic data structure {piTitle}.'"]
+    for fieldNo in range(config["fields"]):
+        lines.append(f"piStructS00 field{fieldNo:03d} 'piStruct child of {piTitle} storing field {fieldNo}.'")
+    lines.append(f"piValuesSetD {piTitle} 'defines default {piTitle} values from a {piTitle} structure'")
+    for fieldNo in range(config["fields"]):
+        lines.append(f"piValue {piTitle}.field{fieldNo:03d} 'value {fieldNo}'")
+    return '\n'.join(lines) + '\n'
+
+def _fileDirectory(seedKey: str, fileDirectory: str | None, quote: str) -> list[str]:
+    # syncCode matches a code file to its seed by fileDirectory
+    if not fileDirectory: return []
+    return [f"piValue {seedKey}:fileDirectory {quote}{fileDirectory}{quote}"]
+
+def genPiClassGCSeed(piTitle: str, config: dict, fileDirectory: str | None = None) -> str:
+    seedKey = f"{piTitle}.piBody:piClassGC"
+    lines = _seedHead("piClassGC", piTitle, f"Synthetic class {piTitle}")
+    lines += _fileDirectory(seedKey, fileDirectory, "'")
+    lines += [f"piValue {seedKey}:fileName {piTitle}",
+              f"piValueA {seedKey}:headers '# {piTitle} written by the piGenCode benchmark'",
+              f"piValueA {seedKey}:imports os",
+              f"piValue {seedKey}:piClassName {piTitle[0].upper()}{piTitle[1:]}"]
+    if config["fields"]:
+        lines.append(f"piStructA00 {seedKey}:initArguments")
+        for fieldNo in range(config["fields"]):
+            lines.append(f"piStructC01 argument arg{fieldNo:03d}.")
+        for fieldNo in range(config["fields"]):
+            lines.append(f"piValue {seedKey}:initArguments:arg{fieldNo:03d}:type int")
+            lines.append(f"piValue {seedKey}:initArguments:arg{fieldNo:03d}:value {fieldNo}")
+    strCode = ['def __str__(self) -> str:',
+               f'    return f"{piTitle}({{self.json()}})"']
+    jsonCode = ['def json(self) -> dict:', '    return {']
+    jsonCode += [f'        "arg{fieldNo:03d}": self.arg{fieldNo:03d},' for fieldNo in range(config["fields"])]
+    jsonCode += ['    }']
+    for codeLine in strCode:
+        lines.append(f"piValueA {seedKey}:strCode {_quote(codeLine)}")
+    for codeLine in jsonCode:
+        lines.append(f"piValueA {seedKey}:jsonCode {_quote(codeLine)}")
+    if config["methods"]:
+        lines.append(f"piStructA00 {seedKey}:classDefCode")
+        for methodNo in range(config["methods"]):
+            lines.append(f"piStructL01 method{methodNo:03d} 'Method method{methodNo:03d} of {piTitle}'")
+        for methodNo in range(config["methods"]):
+            methodKey = f"piValueA {seedKey}:classDefCode:method{methodNo:03d}"
+            lines.append(f"{methodKey} {_quote(f'def method{methodNo:03d}(self, count: int) -> int:')}")
+            for codeLine in _codeLines('    ', config["codeLines"]):
+                lines.append(f"{methodKey} {_quote(codeLine)}")
+    return '\n'.join(lines) + '\n'
+
+def genPiDefGCSeed(piTitle: str, config: dict, fileDirectory: str | None = None) -> str:
+    seedKey = f"{piTitle}.piBody:piDefGC"
+    lines = _seedHead("piDefGC", piTitle, f"Synthetic function definitions {piTitle}")
+    # piDefGC seeds are matched on the unquoted value
+    lines += _fileDirectory(seedKey, fileDirectory, "")
+    lines += [f"piValue {seedKey}:fileName {piTitle}",
+              f"piValueA {seedKey}:headers '# {piTitle} functions written by the piGenCode benchmark'",
+              f"piValueA {seedKey}:imports os"]
+    for functionNo in range(config["methods"]):
+        codeLines = ['', f'def {piTitle}Function{functionNo:03d}(count: int) -> int:']
+        codeLines += _codeLines('    ', config["codeLines"])
+        for codeLine in codeLines:
+            lines.append(f"piValueA {seedKey}:globalCode {_quote(codeLine)}")
+    return '\n'.join(lines) + '\n'
+
+def genPiGenClassSeed(piTitle: str, config: dict, fileDirectory: str | None = None) -> str:
+    seedKey = f"{piTitle}.piBody:piGenClass"
+    lines = _seedHead("piGenClass", piTitle, f"Synthetic multi-class file {piTitle}")
+    lines += _fileDirectory(seedKey, fileDirectory, "'")
+    lines += [f"piValue {seedKey}:fileName {piTitle}",
+              f"piValueA {seedKey}:headers '# {piTitle} classes written by the piGenCode benchmark'",
+              f"piValueA {seedKey}:imports os"]
+    classNames = [f"{piTitle[0].upper()}{piTitle[1:]}Class{classNo:03d}" for classNo in range(config["classes"])]
+    if classNames:
+        lines.append(f"piStructA00 {seedKey}:classDefs")
+        for className in classNames:
+            lines.append(f"piStructL01 {className} 'Class {className}'")
+        for className in classNames:
+            classKey = f"piValueA {seedKey}:classDefs:{className}"
+            codeLines = [f'class {className}:',
+                         '    def __init__(self, count: int = 0):',
+                         '        self.count = count']
+            for methodNo in range(config["methods"]):
+                codeLines += ['', f'    def method{methodNo:03d}(self, count: int) -> int:']
+                codeLines += _codeLines('        ', config["codeLines"])
+            for codeLine in codeLines:
+                lines.append(f"{classKey} {_quote(codeLine)}")
+    return '\n'.join(lines) + '\n'
+
+seedGenerators = {
+    "piStructs": ("piStruct", "benchStruct", genPiStructSeed),
+    "piDefGCs": ("piDefGC", "benchDefs", genPiDefGCSeed),
+    "piGenClasses": ("piGenClass", "benchGenClass", genPiGenClassSeed),
+    "piClassGCs": ("piClassGC", "benchClass", genPiClassGCSeed)
+}
+
+def writeSeedTree(seedPath: Path, config: dict | None = None, fileDirectories: dict | None = None) -> list[Path]:
+    '''Write the synthetic piSeed files described by config (see
+       defaultBenchConfig) to seedPath, numbered after the base piStruct
+       seeds. fileDirectories maps a piType to the fileDirectory its seeds
+       set. Returns the seed files written.'''
+    fileDirectories = fileDirectories or {}
+    benchConfig = dict(defaultBenchConfig)
+    if config: benchConfig.update(config)
+    seedTotal = sum(benchConfig[configKey] for configKey in seedGenerators)
+    if firstSeedNumber + seedTotal > 1000:
+        raise ValueError(f'{seedTotal} seed files do not fit the three digit piSeed numbers')
+    seedPath.mkdir(parents=True, exist_ok=True)
+    seedFiles: list[Path] = []
+    seedNumber = firstSeedNumber
+    for configKey, (piType, titlePrefix, genSeed) in seedGenerators.items():
+        for titleNo in range(benchConfig[configKey]):
+            piTitle = f'{titlePrefix}{titleNo:03d}'
+            seedFile = seedPath.joinpath(f'piSeed{seedNumber:03d}_{piType}_{piTitle}.pi')
+            with open(seedFile, 'w') as f:
+                f.write(genSeed(piTitle, benchConfig, fileDirectories.get(piType)))
+            seedFiles.append(seedFile)
+            seedNumber += 1
+    return seedFiles
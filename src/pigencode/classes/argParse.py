@@ -1,9 +1,9 @@
-import os
 import sys
+import shutil
 import argparse
 import shlex
 from ..defs.logIt import color, cStr
-from ..commands.commands import Commands, cmdDescriptionTagStr
+from ..commands.commands import getCommands, cmdDescriptionTagStr
 
 
 class PiHelpFormatter(argparse.RawTextHelpFormatter):
@@ -32,6 +32,23 @@ class PiHelpFormatter(argparse.RawTextHelpFormatter):
             self._add_item(self._format_action, [action])
 
 
+class PiArgumentParser(argparse.ArgumentParser):
+    # Calls helpBuilder(parser) once, the first time help is formatted
+    def __init__(self, *args, helpBuilder=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helpBuilder = helpBuilder
+
+    def format_help(self):
+        if self.helpBuilder:
+            helpBuilder, self.helpBuilder = self.helpBuilder, None
+            helpBuilder(self)
+        return super().format_help()
+
+
+def getTerminalCols() -> int:
+    return shutil.get_terminal_size().columns
+
+
 def str_or_int(arg):
     try:
         return int(arg)  # try convert to int
@@ -54,67 +71,26 @@ class ArgParse():
             self.parser.add_argument('arguments', nargs='*')
             self.args = self.parser.parse_args(self.filtered_args)
         else:
-            _, tCols = os.popen('stty size', 'r').read().split()
-            tCols = int(tCols)
-            indentPad = 8
             def formatter_class(prog): return PiHelpFormatter(
-                prog, max_help_position=8, width=tCols)
-            commandsHelp = ""
-            argumentsHelp = ""
-            theCmds = Commands()
-            commands = theCmds.commands
+                prog, max_help_position=8, width=getTerminalCols())
+            theCmds = getCommands()
             switchFlag = theCmds.switchFlags["switcheFlags"]
-            for cmdName in commands:
-                needCmdDescription = True
-                needArgDescription = True
-                arguments = commands[cmdName]
-                argumentsHelp += cStr(cmdName, color.YELLOW) + ': \n'
-                for argName in arguments:
-                    if argName[-len(cmdDescriptionTagStr):] == cmdDescriptionTagStr:
-                        cmdHelp = cStr(cmdName, color.YELLOW) + \
-                            ': ' + f'{arguments[argName]}'
-                        if len(cmdHelp) > tCols:
-                            indentPad = len(cmdName) + 2
-                            cmdHelp = formatHelpWidth(
-                                cmdHelp, tCols, indentPad)
-                        else:
-                            cmdHelp += '\n'
-                        commandsHelp += cmdHelp
-                        needCmdDescription = False
-                    else:
-                        argHelp = cStr(
-                            f'  <{argName}> ', color.CYAN) + f'{arguments[argName]}'
-                        if len(argHelp) > tCols:
-                            indentPad = len(argName) + 5
-                            argHelp = ' ' + \
-                                formatHelpWidth(argHelp, tCols, indentPad)
-                        else:
-                            argHelp += '\n'
-                        argumentsHelp += argHelp
-                        needArgDescription = False
-                if needArgDescription:
-                    argumentsHelp = argumentsHelp[:-1]
-                    argumentsHelp += "no arguments\n"
-                if needCmdDescription:
-                    commandsHelp += cStr(cmdName, color.WHITE) + '\n'
-            #   commandsHelp = commandsHelp[:-1]
-
-            self.parser = argparse.ArgumentParser(
+
+            self.parser = PiArgumentParser(
                 description="pi pip package pip package pip package",
-                epilog="Have Fun!", formatter_class=formatter_class)
+                epilog="Have Fun!", formatter_class=formatter_class,
+                helpBuilder=lambda parser: self._setCommandsHelp(theCmds))
 
-            self.parser.add_argument("commands",
+            self.commandsAction = self.parser.add_argument("commands",
                                      type=str,
                                      nargs=1,
-                                     metavar=f'{cStr(cStr("Commands", color.YELLOW), color.UNDERLINE)}:',
-                                     help=commandsHelp)
+                                     metavar=f'{cStr(cStr("Commands", color.YELLOW), color.UNDERLINE)}:')
 
-            self.parser.add_argument("arguments",
+            self.argumentsAction = self.parser.add_argument("arguments",
                                      type=str_or_int,
                                      nargs="*",
-                                     metavar=f'{cStr(cStr("Arguments", color.CYAN), color.UNDERLINE)}:',
                                      # metavar="arguments:",
-                                     help=argumentsHelp)
+                                     metavar=f'{cStr(cStr("Arguments", color.CYAN), color.UNDERLINE)}:')
 
             for optFlag in switchFlag:
                 flagHelp = switchFlag[optFlag]
@@ -122,15 +98,60 @@ class ArgParse():
                     f'-{optFlag}', action='store_true', help=flagHelp)
             self.args = self.parser.parse_args(self.filtered_args)
 
+    def _setCommandsHelp(self, theCmds):
+        '''Build the colorized commands and arguments help (only when help is shown).'''
+        tCols = getTerminalCols()
+        indentPad = 8
+        commandsHelp = ""
+        argumentsHelp = ""
+        commands = theCmds.commands
+        for cmdName in commands:
+            needCmdDescription = True
+            needArgDescription = True
+            arguments = commands[cmdName]
+            argumentsHelp += cStr(cmdName, color.YELLOW) + ': \n'
+            for argName in arguments:
+                if argName[-len(cmdDescriptionTagStr):] == cmdDescriptionTagStr:
+                    cmdHelp = cStr(cmdName, color.YELLOW) + \
+                        ': ' + f'{arguments[argName]}'
+                    if len(cmdHelp) > tCols:
+                        indentPad = len(cmdName) + 2
+                        cmdHelp = formatHelpWidth(
+                            cmdHelp, tCols, indentPad)
+                    else:
+                        cmdHelp += '\n'
+                    commandsHelp += cmdHelp
+                    needCmdDescription = False
+                else:
+                    argHelp = cStr(
+                        f'  <{argName}> ', color.CYAN) + f'{arguments[argName]}'
+                    if len(argHelp) > tCols:
+                        indentPad = len(argName) + 5
+                        argHelp = ' ' + \
+                            formatHelpWidth(argHelp, tCols, indentPad)
+                    else:
+                        argHelp += '\n'
+                    argumentsHelp += argHelp
+                    needArgDescription = False
+            if needArgDescription:
+                argumentsHelp = argumentsHelp[:-1]
+                argumentsHelp += "no arguments\n"
+            if needCmdDescription:
+                commandsHelp += cStr(cmdName, color.WHITE) + '\n'
+        #   commandsHelp = commandsHelp[:-1]
+        self.commandsAction.help = commandsHelp
+        self.argumentsAction.help = argumentsHelp
+
     def _extract_cmd_options(self, args):
         '''Extract command-specific options(--option) from arguments'''
 
         # Define which options are flags (no value) vs options that take values
         flag_options = {
-            'dry-run', 'create-missing', 'validate', 'stats', 'force', 'help'
+            'dry-run', 'create-missing', 'validate', 'stats', 'force', 'help',
+            'incremental', 'profile'
         }
         value_options = {
-            'filter', 'exclude-pattern', 'dest-dir'
+            'filter', 'exclude-pattern', 'dest-dir', 'jobs', 'pstats'
         }
 
         filtered_args = []
@@ -3,6 +3,9 @@ from pathlib import Path
 from ..defs.fileIO import getKeyItem, piGCDirs
 from ..defs.piJsonFile import readJson
 from ..defs.logIt import logIt, printIt, label
+from ..defs.piTrackingFile import updateTrackingFile
+from ..defs.piCodeFile import writeCodeFile
+from ..defs.piProfile import profileDef
 
 class PiGenClassCode():
     def __init__(self):
@@ -141,26 +144,9 @@ class PiGenClassCode():
     def __saveTrackingFile(self, target_dir: Path, filename: str):
         """Save tracking file for rmGC cleanup"""
         tracking_file = target_dir / ".piclass"
+        updateTrackingFile(tracking_file, filename, "append")
 
-        try:
-            # Read existing tracking data
-            tracking_data = []
-            if tracking_file.exists():
-                with open(tracking_file, 'r', encoding='utf-8') as f:
-                    tracking_data = [line.strip() for line in f.readlines()]
-
-            # Add this file if not already tracked
-            if filename not in tracking_data:
-                tracking_data.append(filename)
-
-            # Write updated tracking data
-            with open(tracking_file, 'w', encoding='utf-8') as f:
-                for tracked_file in tracking_data:
-                    f.write(f"{tracked_file}\n")
-
-        except Exception as e:
-            printIt(f"Warning: Could not update tracking file: {e}", label.WARN)
-
+    @profileDef("gen", "piGenClass")
     def genPiGenClass(self, piGenClassFile: str) -> str:
         """
             Generate Python class file from piGenClass JSON
@@ -184,9 +170,8 @@ class PiGenClassCode():
             output_filename = f"{self.fileName}.py"
             output_path = target_dir / output_filename
 
-            # Write the Python file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(python_code)
+            # Write the Python file, unless it is unchanged
+            writeCodeFile(output_path, python_code, encoding='utf-8')
 
             # Save tracking file for rmGC
             self.__saveTrackingFile(target_dir, output_filename)
@@ -1,8 +1,12 @@
-import os, json, ast, traceback
+import os, re, json, ast, traceback
 import inspect
 from pathlib import Path
 from ..defs.fileIO import getKeyItem, piGCDirs, readJson, piLoadPiClassGCJson
 from ..defs.logIt import logIt, printIt, label, getCodeFile, getCodeLine
+from ..defs.piTrackingFile import updateTrackingFile
+from ..defs.piCodeFile import writeCodeFile
+from ..defs.piParseCache import parsePythonFile
+from ..defs.piProfile import profileDef, profilePhase
 
 class PiGenCode():
     def __init__(self):
@@ -56,6 +60,8 @@ class PiGenCode():
         except: self.initAppendCode = []
         try: self.genProps = self.piClassGC["genProps"]
         except: self.genProps = ""
+        try: self.slots = self.piClassGC["slots"]
+        except: self.slots = ""
         try: self.strCode = self.piClassGC["strCode"]
         except: self.strCode = []
         try: self.jsonCode = self.piClassGC["jsonCode"]
@@ -204,198 +210,75 @@ class PiGenCode():
             indent = self.indent
             rtnLines = indent*iniLevel + 'def __str__(self) -> str:\n'
             iniLevel += 1
-            printIniLevel = 1
-            removeLastComma = False
-            if self.inheritance:
-                for InheritKey in self.inheritance:
-                    if InheritKey == 'PiPi':
-                        piClassName = self.piClassName[0].lower() + self.piClassName[1:]
-                        rtnLines += f'{indent*iniLevel}""" return string of {piClassName} json """\n'
-                        rtnLines += f'{indent*iniLevel}rtnStr = super().__str__()\n'
-                        rtnLines += f'{indent*iniLevel}return rtnStr'
-                    elif InheritKey != "object" and self.uniqeParametersPiTypes:
-                        rtnLines += indent*iniLevel
-                        rtnLines += f'rtnStr = "{self.piClassName} = ' + '{\\n"\n'
-                        if InheritKey not in self.uniqeParametersPiTypes:
-                            # review why we read from an existing python file.
-                            # try:
-                            #     print('InheritKey',InheritKey)
-                            #     aPiFilePI = piLoadPiClassGCJson(InheritKey, self.piClassDir)
-                            #     if not aPiFilePI: raise Exception
-                            # except:
-                            #     printIt(' '.join((getCodeFile(), self.piClassName, f'InheritKey({getCodeLine()}):', InheritKey, str(
-                            #         self.piClassDir))), label.ERROR)
-                            #     printIt('Check title case for PiClass')
-                            #     exit()
-                            parameters = self.__getInheritClassArgs(InheritKey, self.piClassDir)
-                            # printIniLevel = 1
-                            lowerInheritKey = InheritKey[:2].lower(
-                            ) + InheritKey[2:]
-                            rtnLines += f'{indent*iniLevel}rtnStr += \'{indent*(printIniLevel)}"{lowerInheritKey}":'
-                            rtnLines += '{\\n\'\n'
-                            # "title":"{self.title}",\n'
-                            printIniLevel += 1
-                            for parameter in parameters:
-                                rtnLines += f'{indent*iniLevel}rtnStr += f\'{indent*(printIniLevel)}"{parameter}":'
-                                rtnLines += '"{self.' + parameter + '}",\\n\'\n'
-                            printIniLevel -= 1
-                            rtnLines += f'{indent*iniLevel}rtnStr += \'{indent*(printIniLevel)}'
-                            rtnLines += '}\\n\'\n'
-                        for param in self.initArguments:
-                            paramType = self.initArguments[param]["type"]
-                            # next add lines for paramaters. Taking account to ignore inhareted parameters
-                            if paramType[:2] == "Pi":
-                                lowerParamType = paramType[:2].lower() + paramType[2:]
-                                # try:
-                                #     aPiFilePI = piLoadPiClassGCJson(paramType, self.piClassDir)
-                                #     if not aPiFilePI: raise Exception
-                                # except:
-                                #     printIt(' '.join((getCodeFile(), self.piClassName, f'InheritKey({getCodeLine()}):', InheritKey, str(
-                                #         self.piClassDir))), label.ERROR)
-                                #     printIt('Check title case for PiClass')
-                                #     exit()
-                                parameters = self.__getInheritClassArgs(paramType, self.piClassDir)
-                                # parameters = aPiFilePI["piBody"]["piClassGC"]["initArguments"]
-                                if paramType not in self.inheritance:
-                                    rtnLines += f'{indent*(iniLevel)}rtnStr += \'{indent*(printIniLevel)}"{param}": '
-                                    rtnLines += '{' + '\\n\'\n'
-                                    printIniLevel += 1
-                                    parmLen = len(parameters)
-                                    parmIndex = 0
-                                    for parameter in parameters:
-                                        # print(f'parameter: {parameter}')
-                                        if parameter[:2] == 'pi':
-                                            rtnLines += f'{indent*(iniLevel)}rtnStr += f\'{indent*(printIniLevel)}"{parameter}":'
-                                            rtnLines += '"{self.' + f'{param}.{parameter}' + '}"'
-                                            if parmIndex == parmLen - 1:
-                                                rtnLines += '\\n\'\n'
-                                            else:
-                                                rtnLines += ',\\n\'\n'
-                                        parmIndex += 1
-                                    printIniLevel -= 1
-                                    rtnLines += f'{indent*(iniLevel)}rtnStr += \'{indent*(printIniLevel)}'
-                                    rtnLines += '},' + '\\n\'\n'
-                                else:
-                                    for parameter in parameters:
-                                        rtnLines += f'{indent*iniLevel}rtnStr += f\'{indent*(printIniLevel)}"{parameter}":'
-                                        rtnLines += '"{self.' + f'{param}.{parameter}' + '}",\\n\'\n'
-                            elif paramType[:2] == "pi":
-                                upperParamType = paramType[:1].upper() + paramType[1:]
-                                if upperParamType not in self.inheritance:
-                                    rtnLines += f'{indent*iniLevel}rtnStr += f\'{indent*(printIniLevel)}"{param}":'
-                                    rtnLines += '"{self.' + param + '}",\\n\'\n'
-                            else:
-                                rtnLines += f'{indent*iniLevel}rtnStr += f\'{indent*(printIniLevel)}"{param}":'
-                                rtnLines += '"{self.' + param + '}",\\n\'\n'
-                            removeLastComma = True
-                        if removeLastComma:
-                            rtnLines = rtnLines[:-5] + '\\n\'\n'
-
-                        rtnLines += indent*iniLevel + 'rtnStr += "' + '}"\n'
-                        rtnLines += indent*iniLevel + 'return rtnStr\n'
+            if 'PiPi' in self.inheritance:
+                piClassName = self.piClassName[0].lower() + self.piClassName[1:]
+                rtnLines += f'{indent*iniLevel}""" return string of {piClassName} json """\n'
+                rtnLines += f'{indent*iniLevel}rtnStr = super().__str__()\n'
+                rtnLines += f'{indent*iniLevel}return rtnStr'
+            elif self.jsonCode or self.initArguments or self.inheritance:
+                # encode the json() dict in one call
+                self.__addRawFromImport('json', 'dumps')
+                rtnLines += indent*iniLevel + defaultStrReturn.format(piClassName=self.piClassName)
+            else:
+                rtnLines += indent*iniLevel + f"return '{self.piClassName} = {{}}'"
         rtnLines += '\n'
         return rtnLines
+    def __addRawFromImport(self, fromModule: str, importName: str):
+        for fromImport in self.fromImports:
+            if self.fromImports[fromImport]["from"] == fromModule and \
+               importName in [imp.strip() for imp in self.fromImports[fromImport]["import"].split(',')]:
+                return
+        rawFromImport = f'from {fromModule} import {importName}'
+        if rawFromImport not in self.rawFromImports:
+            self.rawFromImports.append(rawFromImport)
     def _genJsonCodeLines(self, iniLevel=0):
         rtnLines = ''
-        InheritKey = ''
         if len(self.jsonCode) > 0:
             rtnLines = self.__addJsonCodeLines(iniLevel)
         elif self.initArguments or self.inheritance:
             indent = self.indent
             rtnLines = indent*iniLevel + 'def json(self) -> dict:\n'
             iniLevel += 1
-            compleatCode = False
             try:
-                if self.inheritance:
-                    # print('self.inheritance',self.piClassName)
-                    for InheritKey in self.inheritance:
-                        if InheritKey == 'PiPi':
-                            piClassName = self.piClassName[0].lower() + self.piClassName[1:]
-                            rtnLines += f'{indent*iniLevel}""" return dict of {piClassName} json """\n'
-                            rtnLines += f'{indent*iniLevel}rtnDict = super().json()\n'
-                            rtnLines += f'{indent*iniLevel}return rtnDict' + '\n'
-                        elif InheritKey != "object" and self.uniqeParametersPiTypes:
-                            rtnLines += indent*iniLevel + 'rtnDict = {\n'
-                            iniLevel += 1
-                            if InheritKey not in self.uniqeParametersPiTypes:
-                                # Get list of arguments from inherited classes
-                                # aPiFilePI = piLoadPiClassGCJson(InheritKey, self.piClassDir)
-                                # if not aPiFilePI:raise Exception
-                                # parameters = aPiFilePI["piBody"]["piClassGC"]["initArguments"]
-                                parameters = self.__getInheritClassArgs(InheritKey, self.piClassDir)
-                                iniLevel += 1
-                                for parameter, values in parameters.items():
-                                    # only parameter begining with pi are included in json
-                                    if parameter[:2] == 'pi':
-                                        if parameter in self.initArguments.keys(): chkType = self.initArguments[parameter]['type']
-                                        else: chkType = values['type']
-                                        if chkType in ['str', 'dict']:
-                                            rtnLines += f'{indent*iniLevel}"{parameter}": self.{parameter},\n'
-                                        else:
-                                            rtnLines += f'{indent*iniLevel}"{parameter}": self.{parameter}.json(),\n'
-                                iniLevel -= 1
-                            rtnLines = rtnLines[:-2] + '\n'
-                            compleatCode = True
+                if 'PiPi' in self.inheritance:
+                    piClassName = self.piClassName[0].lower() + self.piClassName[1:]
+                    rtnLines += f'{indent*iniLevel}""" return dict of {piClassName} json """\n'
+                    rtnLines += f'{indent*iniLevel}rtnDict = super().json()\n'
+                    rtnLines += f'{indent*iniLevel}return rtnDict' + '\n'
                 else:
-                    # print('not self.inheritance',self.piClassName)
+                    # one dict display: inherited values from super().json(),
+                    # Pi type values from their own json()
+                    inheritArgs = {}
+                    jsonItems = []
+                    for InheritKey in self.inheritance:
+                        if InheritKey[:2] == "Pi":
+                            parameters = self.__getInheritClassArgs(InheritKey, self.piClassDir)
+                            if parameters and not inheritArgs:
+                                jsonItems.append('**super().json()')
+                            inheritArgs.update(parameters)
                     for param in self.initArguments:
+                        if param == 'fileName' or param in inheritArgs: continue
                         paramType = self.initArguments[param]["type"]
-                        # next add lines for paramaters. Taking account to ignore inhareted parameters
                         if paramType[:2] == "Pi":
-                            # aPiFilePI = piLoadPiClassGCJson(paramType, self.piClassDir)
-                            # if not aPiFilePI:
-                            #     raise Exception
-                            # parameters = aPiFilePI["piBody"]["piClassGC"]["initArguments"]
-                            parameters = self.__getInheritClassArgs(paramType, self.piClassDir)
-                            parmLen = 0
-                            if paramType != 'PiPi':
-                                rtnLines += f'{indent*iniLevel}"{param}":' + '{\n'
-                                parmLen = len(parameters)
-                                iniLevel += 1
-                            parmIndex = 0
-                            for parameter, values in parameters.items():
-                                if parameter[:2] == 'pi':
-                                    chkType = values['type']
-                                    # print('parameter:',parameter,'chkType:',chkType)
-                                    if chkType in ['int','float','str', 'dict','list']:
-                                        rtnLines += f'{indent*iniLevel}"{parameter}": self.{param}.{parameter}'
-                                    else:
-                                        rtnLines += f'{indent*iniLevel}"{parameter}": self.{param}.{parameter}.json()'
-                                    if parmIndex == parmLen - 1:
-                                            rtnLines += '\n'
-                                    else:
-                                            rtnLines += ',\n'
-                                    parmIndex += 1
-                            if paramType != 'PiPi':
-                                iniLevel -= 1
-                                rtnLines += f'{indent*(iniLevel)}' + '},\n'
-                        elif paramType[:2] == "pi":
-                            upperParamType = paramType[:1].upper() + paramType[1:]
-                            if upperParamType not in self.inheritance:
-                                rtnLines += f'{indent*iniLevel}"{param}": self.{param},\n'
-                        elif param != 'fileName':
-                            rtnLines += f'{indent*iniLevel}"{param}": self.{param},\n'
-                    rtnLines = rtnLines[:-2] + '\n'
-                    compleatCode = True
-                if compleatCode:
-                    iniLevel -= 1
-                    if len(self.initArguments) == 1:
-                        if self.initArguments[list(self.initArguments.keys())[0]]:
-                            rtnLines = rtnLines[:-1] + '{}\n'
-                    else:
+                            if 'None' in paramType or str(self.initArguments[param]["value"]).lower() == "none":
+                                jsonItems.append(f'"{param}": self.{param}.json() if self.{param} else None')
+                            else:
+                                jsonItems.append(f'"{param}": self.{param}.json()')
+                        elif paramType[:2] == "pi" and paramType[:1].upper() + paramType[1:] in self.inheritance:
+                            continue
+                        else:
+                            jsonItems.append(f'"{param}": self.{param}')
+                    if jsonItems:
+                        rtnLines += indent*iniLevel + 'rtnDict = {\n'
+                        rtnLines += ',\n'.join(indent*(iniLevel+1) + jsonItem for jsonItem in jsonItems) + '\n'
                         rtnLines += indent*iniLevel + '}\n'
+                    else:
+                        rtnLines += indent*iniLevel + 'rtnDict = {}\n'
                     rtnLines += indent*iniLevel + 'return rtnDict\n'
-                    if rtnLines: rtnLines += '\n'
-            
-
             except Exception as e:
                 printIt('piGenCode._genJsonCodeLines()',label.ERROR)
                 tb_str = ''.join(traceback.format_exception(None, e, e.__traceback__))
                 print(tb_str)
-            # except as e:
-            #     printIt(' '.join((getCodeFile(), self.piClassName, f'InheritKey({getCodeLine()}):', InheritKey, str(self.piClassDir))),label.ERROR)
-            #     printIt('Check title case for PiClass')
-            #     exit()
 
         return rtnLines
     def _genFromPiClassesLines(self, iniLevel=0) -> str:
@@ -493,6 +376,57 @@ class PiGenCode():
             return self.genProps + '\n'
         return ""
 
+    def _genSlotsLines(self, iniLevel=0) -> str:
+        """Generate DEFAULT slots when none exist"""
+        # Classes keep their instance __dict__ unless slots is set
+        return ""
+
+    def __addSlotsLines(self, iniLevel=0) -> str:
+        """Use CUSTOM slots: declare __slots__ for the attributes this class assigns"""
+        if not isSlotsFlag(self.slots):
+            return ""
+        # one parent without __slots__ gives every instance a __dict__ again
+        for InheritKey in self.inheritance:
+            for UnslottedClassName in self.__getUnslottedInheritClasses(InheritKey, self.piClassDir):
+                printIt(f'{self.piClassName}: slots saves no memory while {UnslottedClassName} ' +
+                        'has no __slots__, set slots in its piSeed as well', label.WARN)
+        slotNames = [f'"{slotName}"' for slotName in self.__getSlotNames()]
+        if len(slotNames) == 1:
+            slotNames.append('')
+        return self.indent*iniLevel + f'__slots__ = ({", ".join(slotNames).rstrip()})\n\n'
+
+    def __getSlotNames(self) -> list[str]:
+        # attributes assigned by the generated __init__, see _genInitCodeLines
+        slotNames = {}
+        if self.genProps:
+            slotNames["_piJson"] = None
+        elif not (self.preSuperInitCode or self.postSuperInitCode):
+            inheritArgs = {}
+            if self.inheritance and not ("object" in self.inheritance or "dict" in self.inheritance):
+                for InheritKey in self.inheritance:
+                    inheritArgs.update(self.__getInheritClassArgs(InheritKey, self.piClassDir))
+            for param in self.initArguments:
+                paramType = self.initArguments[param]["type"]
+                if not self.inheritance or \
+                   (paramType[:2] != "Pi" and param != 'fileName') or \
+                   (paramType[:2] == "Pi" and param not in inheritArgs):
+                    slotNames[param] = None
+        # attributes assigned by custom code
+        codeLines = self.preSuperInitCode + self.postSuperInitCode + self.initAppendCode + \
+                    self.strCode + self.jsonCode
+        for DefCode in self.classDefCode:
+            codeLines = codeLines + self.classDefCode[DefCode]
+        for codeLine in codeLines:
+            for slotName in selfAssignRE.findall(codeLine):
+                slotNames[slotName] = None
+        # slots declared up the inheritance chain are not declared again
+        inheritSlots = set()
+        for InheritKey in self.inheritance:
+            inheritSlots.update(self.__getInheritClassSlots(InheritKey, self.piClassDir))
+        return [slotName for slotName in slotNames
+                if slotName not in inheritSlots and
+                not (self.genProps and slotName in self.initArguments)]
+
     def __addJsonCodeLines(self, iniLevel=0):
         """Use CUSTOM jsonCode"""
         indent = self.indent
@@ -507,6 +441,7 @@ class PiGenCode():
         for StrCodeLine in self.strCode:
             rtnLines += self.__appednCodeLine(StrCodeLine, iniLevel)
         return rtnLines
+    @profileDef("gen element", "classDefCode")
     def __addDefCodeLines(self, iniLevel=0):
         rtnLines = ""
         method_count = 0
@@ -524,6 +459,7 @@ class PiGenCode():
                     rtnLines += self.__appednCodeLine(DefCodeLine, iniLevel)
             method_count += 1
         return rtnLines
+    @profileDef("gen element", "init")
     def _genInitLines(self, iniLevel=0):
         indent = self.indent
         startDefLine = 'def __init__('
@@ -633,6 +569,10 @@ class PiGenCode():
         classComment = self._generateElementCode('classComment', iniLevel)
         if classComment:
             rtnLines += classComment
+
+        slotsLines = self._generateElementCode('slots', iniLevel)
+        if slotsLines:
+            rtnLines += slotsLines
         
         initLines = self._genInitLines(iniLevel)  # Init is complex, keep existing logic for now
         if initLines:
@@ -653,6 +593,7 @@ class PiGenCode():
                 rtnLines += '\n' + classDefLines  # Add blank line before custom methods
 
         return rtnLines
+    @profileDef("gen element", "above class")
     def _genAboveClassLines(self) -> str:
         indent = self.indent
         rtnLines = ''
@@ -735,6 +676,7 @@ class PiGenCode():
                     printIt(f'Incorrct type {str(globalType)} for {self.globals[aGlobal]}.',label.ERROR)
                 rtnLines += '\n'
         return rtnLines
+    @profileDef("gen element", "below class")
     def _genBellowClassLines(self) -> str:
         indent = self.indent
         rtnLines = ''
@@ -776,30 +718,7 @@ class PiGenCode():
         """Update the .piclass tracking file with generated filenames"""
         # Place tracking file in the same directory as the generated file
         trackingFile = os.path.join(self.piClassDir, ".piclass")
-        generatedFiles = set()
-
-        # Read existing tracking file if it exists
-        if os.path.isfile(trackingFile):
-            try:
-                with open(trackingFile, 'r') as f:
-                    # Skip comment lines starting with #
-                    generatedFiles = set(line.strip() for line in f if line.strip() and not line.strip().startswith('#'))
-            except Exception as e:
-                logIt(f'Warning: Could not read tracking file {trackingFile}: {e}')
-
-        # Add the new file (just the filename, not full path)
-        generatedFiles.add(os.path.basename(fileName))
-
-        # Write updated tracking file with metadata
-        try:
-            with open(trackingFile, 'w') as f:
-                # Add header comment with directory info
-                f.write(f"# piGenCode tracking file for directory: {self.piClassDir}\n")
-                f.write(f"# Generated files in this directory:\n")
-                for filename in sorted(generatedFiles):
-                    f.write(f"{filename}\n")
-        except Exception as e:
-            logIt(f'Warning: Could not update tracking file {trackingFile}: {e}')
+        updateTrackingFile(trackingFile, os.path.basename(fileName), "piclass", self.piClassDir)
 
     def __savePiClass(self, piClassLines,verbose=False):
         # Use fileName field if specified, otherwise fall back to piTitle
@@ -822,12 +741,13 @@ class PiGenCode():
 
         fileName = os.path.join(self.piClassDir, f"{baseFileName}.py")
 
-        if os.path.isfile(fileName):
+        fileExists = os.path.isfile(fileName)
+        if not writeCodeFile(fileName, piClassLines):
+            if verbose: printIt(f'{fileName}',label.EXISTS)
+        elif fileExists:
             if verbose: printIt(f'{fileName}',label.REPLACED)
         else:
             if verbose: printIt(f'{fileName}',label.SAVED)
-        with open(fileName, 'w') as f:
-            f.write(piClassLines)
 
         # Update tracking file
         self.__updatePiClassTrackingFile(fileName)
@@ -835,6 +755,7 @@ class PiGenCode():
         # Use the base filename for the saved files dictionary
         self.savedCodeFiles[fileName] = fileName
 
+    @profileDef("gen", "piClassGC")
     def _genPiClass(self, piJsonFileName, verbose = False) -> None:
         self.pi_piClassGC = readJson(piJsonFileName)
         self.PiFileName = piJsonFileName
@@ -861,32 +782,33 @@ class PiGenCode():
 ##### Public Functions
     def _generateElementCode(self, elementName: str, iniLevel: int = 0) -> str:
         """Unified element code generation - determines if custom or default code should be used"""
-        elementData = getattr(self, elementName, None)
-
-        # Check if custom code exists and has content
-        hasCustomCode = False
-        if elementData:
-            if isinstance(elementData, list) and len(elementData) > 0:
-                hasCustomCode = True
-            elif isinstance(elementData, dict) and len(elementData) > 0:
-                hasCustomCode = True
-            elif isinstance(elementData, str) and elementData.strip():
-                hasCustomCode = True
-
-        if hasCustomCode:
-            # Custom code exists - use it
-            methodName = f'_{self.__class__.__name__}__add{elementName[0].capitalize()+elementName[1:]}Lines'
-            if hasattr(self, methodName):
-                return getattr(self, methodName)(iniLevel)
-        else:
-            # No custom code - generate default
-            #print('her:',f'_gen{elementName[0].capitalize()+elementName[1:]}Lines')
-            methodName = f'_gen{elementName[0].capitalize()+elementName[1:]}Lines'
-            # print('methodName',methodName)
-            #print('\n'.join(dir(self)))
-            if hasattr(self, methodName):
-                return getattr(self, methodName)(iniLevel)
-        return ""
+        with profilePhase("gen element", elementName):
+            elementData = getattr(self, elementName, None)
+
+            # Check if custom code exists and has content
+            hasCustomCode = False
+            if elementData:
+                if isinstance(elementData, list) and len(elementData) > 0:
+                    hasCustomCode = True
+                elif isinstance(elementData, dict) and len(elementData) > 0:
+                    hasCustomCode = True
+                elif isinstance(elementData, str) and elementData.strip():
+                    hasCustomCode = True
+
+            if hasCustomCode:
+                # Custom code exists - use it
+                methodName = f'_{self.__class__.__name__}__add{elementName[0].capitalize()+elementName[1:]}Lines'
+                if hasattr(self, methodName):
+                    return getattr(self, methodName)(iniLevel)
+            else:
+                # No custom code - generate default
+                #print('her:',f'_gen{elementName[0].capitalize()+elementName[1:]}Lines')
+                methodName = f'_gen{elementName[0].capitalize()+elementName[1:]}Lines'
+                # print('methodName',methodName)
+                #print('\n'.join(dir(self)))
+                if hasattr(self, methodName):
+                    return getattr(self, methodName)(iniLevel)
+            return ""
 
     def getDefaultElementCode(self, elementName: str, iniLevel: int = 0) -> str:
         """Get what the default code should be for a given element - used by syncCode for comparison"""
@@ -896,39 +818,96 @@ class PiGenCode():
         return ""
 
     def __getInheritClassArgs(self, PiClassName, piClassGCDir) -> dict[str, dict]:
+        return getInheritClassArgs(PiClassName, piClassGCDir)
+
+    def __getInheritClassSlots(self, PiClassName, piClassGCDir, checked=None) -> set[str]:
+        '''Attribute names PiClassName and the Pi classes it inherits
+           assign, read from their python files in piClassGCDir.'''
+        if checked is None: checked = set()
+        if PiClassName in checked: return set()
+        checked.add(PiClassName)
+        inheritSlots = set(self.__getInheritClassArgs(PiClassName, piClassGCDir))
         lowerPiClassName = PiClassName[:2].lower() + PiClassName[2:]
-        # look in class file for listm of parametersm being inharited as children of paramType
         pythonFile = Path(piClassGCDir).joinpath(lowerPiClassName + '.py')
-        #printIt(f'piLoadPiClassGCJson fileName: {str(pythonFile)}', label.DEBUG)
-        init_args = {}
         if pythonFile.is_file():
-            with open(pythonFile, 'r', encoding='utf-8') as f:
-                content = f.read()
-            #print(pythonFile)
-            tree = ast.parse(content)
-
+            tree = parsePythonFile(pythonFile)
             for node in tree.body:
-                if isinstance(node, ast.ClassDef):
+                if isinstance(node, ast.ClassDef) and node.name == PiClassName:
                     for item in node.body:
-                        if isinstance(item, ast.FunctionDef):
-                            method_name = item.name
-                            if method_name == '__init__':
-                                # Special handling for __init__ method
-                                for arg in item.args.args:
-                                    if arg.arg != 'self':
-                                        arg_info = {
-                                            'type': 'str',  # Default type
-                                            'value': '""'   # Default value
-                                        }
-                                        # Try to infer type from annotation
-                                        if arg.annotation:
-                                            if isinstance(arg.annotation, ast.Name):
-                                                arg_info['type'] = arg.annotation.id
-                                            elif isinstance(arg.annotation, ast.Constant):
-                                                arg_info['type'] = str(
-                                                    arg.annotation.value)
-                                        init_args[arg.arg] = arg_info
-        return init_args
+                        if isinstance(item, ast.Assign) and \
+                           any(isinstance(target, ast.Name) and target.id == '__slots__' for target in item.targets):
+                            try: inheritSlots.update(ast.literal_eval(item.value))
+                            except (ValueError, TypeError): pass
+                    for base in node.bases:
+                        if isinstance(base, ast.Name) and base.id[:2] == "Pi":
+                            inheritSlots.update(self.__getInheritClassSlots(base.id, piClassGCDir, checked))
+        return inheritSlots
+
+    def __getUnslottedInheritClasses(self, PiClassName, piClassGCDir, checked=None) -> list[str]:
+        '''Pi classes up the inheritance chain of PiClassName whose python
+           files in piClassGCDir declare no __slots__.'''
+        if checked is None: checked = set()
+        if PiClassName in checked: return []
+        checked.add(PiClassName)
+        unslottedClasses = []
+        lowerPiClassName = PiClassName[:2].lower() + PiClassName[2:]
+        pythonFile = Path(piClassGCDir).joinpath(lowerPiClassName + '.py')
+        if pythonFile.is_file():
+            tree = parsePythonFile(pythonFile)
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef) and node.name == PiClassName:
+                    if not any(isinstance(item, ast.Assign) and
+                               any(isinstance(target, ast.Name) and target.id == '__slots__' for target in item.targets)
+                               for item in node.body):
+                        unslottedClasses.append(PiClassName)
+                    for base in node.bases:
+                        if isinstance(base, ast.Name) and base.id[:2] == "Pi":
+                            unslottedClasses += self.__getUnslottedInheritClasses(base.id, piClassGCDir, checked)
+        return unslottedClasses
+
+def getInheritClassArgs(PiClassName, piClassGCDir) -> dict[str, dict]:
+    '''__init__ arguments of PiClassName read from its python file in piClassGCDir.'''
+    lowerPiClassName = PiClassName[:2].lower() + PiClassName[2:]
+    # look in class file for listm of parametersm being inharited as children of paramType
+    pythonFile = Path(piClassGCDir).joinpath(lowerPiClassName + '.py')
+    #printIt(f'piLoadPiClassGCJson fileName: {str(pythonFile)}', label.DEBUG)
+    init_args = {}
+    if pythonFile.is_file():
+        #print(pythonFile)
+        tree = parsePythonFile(pythonFile)
+
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                for item in node.body:
+                    if isinstance(item, ast.FunctionDef):
+                        method_name = item.name
+                        if method_name == '__init__':
+                            # Special handling for __init__ method
+                            for arg in item.args.args:
+                                if arg.arg != 'self':
+                                    arg_info = {
+                                        'type': 'str',  # Default type
+                                        'value': '""'   # Default value
+                                    }
+                                    # Try to infer type from annotation
+                                    if arg.annotation:
+                                        if isinstance(arg.annotation, ast.Name):
+                                            arg_info['type'] = arg.annotation.id
+                                        elif isinstance(arg.annotation, ast.Constant):
+                                            arg_info['type'] = str(
+                                                arg.annotation.value)
+                                    init_args[arg.arg] = arg_info
+    return init_args
+
+# return line of the default __str__: the json() dict encoded in one call
+defaultStrReturn = "return f'{piClassName} = {{dumps(self.json(), indent=4, default=str)}}'"
+
+# self.<name> = or self.<name>: <type> = in a line of code
+selfAssignRE = re.compile(r'\bself\.(\w+)\s*(?::[^=]+)?=(?!=)')
+
+def isSlotsFlag(slots) -> bool:
+    '''True when a piClassGC slots value turns __slots__ on.'''
+    return str(slots).strip().lower() not in ("", "false", "none", "no", "0")
 
 def genPiPiClass(genFileName='', verbose = False) -> dict:
     '''Generate python file with genFileName piClassGC file.
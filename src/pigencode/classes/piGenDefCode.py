@@ -3,6 +3,9 @@ from pathlib import Path
 from ..defs.fileIO import getKeyItem, piGCDirs
 from ..defs.piJsonFile import readJson
 from ..defs.logIt import logIt, printIt, label
+from ..defs.piTrackingFile import updateTrackingFile
+from ..defs.piCodeFile import writeCodeFile
+from ..defs.piProfile import profileDef
 
 class PiGenDefCode():
     def __init__(self):
@@ -75,6 +78,7 @@ class PiGenDefCode():
             rtnLines += '"""\n\n'
         return rtnLines
 
+    @profileDef("gen element", "imports")
     def __genImportLines(self) -> str:
         """Generate import statements"""
         rtnLines = ''
@@ -121,6 +125,7 @@ class PiGenDefCode():
 
         return rtnLines
 
+    @profileDef("gen element", "constants")
     def __genConstantLines(self) -> str:
         """Generate module-level constants"""
         rtnLines = ''
@@ -185,6 +190,7 @@ class PiGenDefCode():
 
         return rtnLines
 
+    @profileDef("gen element", "functionDefs")
     def __genFunctionLines(self) -> str:
         """Generate function definitions"""
         rtnLines = ''
@@ -210,6 +216,7 @@ class PiGenDefCode():
 
         return rtnLines
 
+    @profileDef("gen element", "globalCode")
     def __genGlobalCodeLines(self) -> str:
         """Generate global code at end of file"""
         rtnLines = ''
@@ -243,48 +250,28 @@ class PiGenDefCode():
         """Update the .pidefs tracking file with generated filenames"""
         # Place tracking file in the same directory as the generated file
         trackingFile = os.path.join(self.piDefDir, ".pidefs")
-        generatedFiles = set()
-
-        # Read existing tracking file if it exists
-        if os.path.isfile(trackingFile):
-            try:
-                with open(trackingFile, 'r') as f:
-                    generatedFiles = set(line.strip() for line in f if line.strip())
-            except Exception as e:
-                logIt(f'Warning: Could not read tracking file {trackingFile}: {e}')
-
-        # Add the new file (just the filename, not full path)
-        generatedFiles.add(os.path.basename(fileName))
-
-        # Write updated tracking file with metadata
-        try:
-            with open(trackingFile, 'w') as f:
-                # Add header comment with directory info
-                f.write(f"# piGenCode tracking file for directory: {self.piDefDir}\n")
-                f.write(f"# Generated files in this directory:\n")
-                for filename in sorted(generatedFiles):
-                    f.write(f"{filename}\n")
-        except Exception as e:
-            logIt(f'Warning: Could not update tracking file {trackingFile}: {e}')
+        updateTrackingFile(trackingFile, os.path.basename(fileName), "pidefs", self.piDefDir)
 
     def __savePiDefFile(self, piDefLines, verbose=False):
         """Save the generated Python file"""
         fileName = os.path.join(self.piDefDir, f"{self.fileName}.py")
-        if os.path.isfile(fileName):
+        fileExists = os.path.isfile(fileName)
+        if not writeCodeFile(fileName, piDefLines):
+            if verbose:
+                printIt(f'{fileName}', label.EXISTS)
+        elif fileExists:
             if verbose:
                 printIt(f'{fileName}', label.REPLACED)
         else:
             if verbose:
                 printIt(f'{fileName}', label.SAVED)
 
-        with open(fileName, 'w') as f:
-            f.write(piDefLines)
-
         # Update tracking file
         self.__updatePiDefTrackingFile(fileName)
 
         self.savedCodeFiles[fileName] = fileName
 
+    @profileDef("gen", "piDefGC")
     def __genPiDefFile(self, piJsonFileName, verbose=False) -> None:
         """Generate a Python function definition file from piDefGC JSON"""
         self.pi_piDefGC = readJson(piJsonFileName)
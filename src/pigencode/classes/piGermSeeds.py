@@ -1,6 +1,8 @@
-import os, datetime, copy, json, re, traceback
+import os, datetime, json, re, traceback
 from ..defs.fileIO import readRC, writeRC
-from ..defs.piJsonFile import readPiStruc, writePiStruc, readPiDefault, writePiDefault, writePi, PiClassGCFiles, PiDefGCFiles, PiGenClassFiles
+from ..defs.piJsonFile import readPiStruc, writePiStruc, readPiDefault, writePiDefault, writePi, PiClassGCFiles, PiDefGCFiles, PiGenClassFiles, \
+    getPiStrucFileName, getPiDefaultFileName, getPiFileName
+from ..defs.piGermManifest import getFileMD5
 from ..defs.piID import getPiMD5, getPiID
 from ..defs.logIt import logIt, printIt, germDbug, label, cStr, color
 from .piSeeds import PiSeeds, PiSeedTypes, piSeedTitelSplit
@@ -24,6 +26,9 @@ class PiGermSeeds():
         self.piDefGCFiles = PiDefGCFiles()
         self.piGenClassFiles = PiGenClassFiles()
         self.classDefCodeDescrtion = {}
+        # piStruct/piDefault files read from disk (with md5 when first read) and germ files written
+        self.piReadFiles: dict[str, str] = {}
+        self.piWriteFiles: list[str] = []
 
         # find and write structures to files
         try:
@@ -106,6 +111,7 @@ class PiGermSeeds():
             targetPi["piID"] = getPiID()
             self.piStructs[self.seeds.currPi.piTitle] = targetPi
             writePi(targetPi, verbose = False)
+            self._recordPiWrite(getPiFileName(targetPi))
             self.seeds.next()
     def germinate_any(self):
         if self.seeds.currPi.piType:
@@ -121,6 +127,7 @@ class PiGermSeeds():
             targetPi["piID"] = getPiID()
             self.piStructs[self.seeds.currPi.piTitle] = targetPi
             writePi(targetPi, verbose=False)
+            self._recordPiWrite(getPiFileName(targetPi))
             self.seeds.next()
     def germinate_piClassGC(self):
         try:
@@ -344,6 +351,7 @@ class PiGermSeeds():
                         self.piStructs[piTitle] = targetPi
                         self.seeds.next()
                     writePiDefault(piTitle, self.piStructs[piTitle], False)
+                    self._recordPiWrite(getPiDefaultFileName(piTitle))
                 else:
                     assert self.seeds.currPi.piType == PiSeedTypes[2]
                     # populate with provided defaults
@@ -422,9 +430,11 @@ class PiGermSeeds():
             try: targetStruc = self.piStructs[piTitle]
             except: pass
             if not targetStruc:  # check if PiDefault
+                self._recordPiRead(getPiDefaultFileName(piTitle))
                 targetStruc = readPiDefault(piTitle, verbose=False)
                 debugTxt = f"{piTitle} from readPiDefault"
             if not targetStruc:  # check if PiStruc
+                self._recordPiRead(getPiStrucFileName(piTitle))
                 targetStruc = readPiStruc(piTitle, verbose=False)
                 debugTxt = f"{piTitle} from readPiStruc01: {targetStruc}"
         else:
@@ -432,9 +442,11 @@ class PiGermSeeds():
                 try: targetStruc = self.piStructs[piTitle]
                 except: pass
             elif source == self.piDictSourceTypes[1]:
+                self._recordPiRead(getPiDefaultFileName(piTitle))
                 targetStruc = readPiDefault(piTitle, verbose=False)
                 debugTxt = f"{piTitle} from readPiDefault"
             elif source == self.piDictSourceTypes[2]:
+                self._recordPiRead(getPiStrucFileName(piTitle))
                 targetStruc = readPiStruc(piTitle, verbose=False)
                 debugTxt = f"{piTitle} from readPiStruc02: {targetStruc}"
             else: pass
@@ -542,6 +554,7 @@ class PiGermSeeds():
                     #print(baseType)
                     #fix clone copy to base name dict element.
                     _ = writePiStruc(baseName, self.piStructs[baseName], False)
+                    self._recordPiWrite(getPiStrucFileName(baseName))
                 else:
                     # print(self.seeds.currPi.piSeedType, self.seeds.currPi.piSeedKeyType)
                     if self.seeds.currPi.piSeedType == PiSeedTypes[0] and \
@@ -839,16 +852,33 @@ class PiGermSeeds():
             tb_str = ''.join(traceback.format_exception(None, e, e.__traceback__))
             printIt(tb_str,label.ERROR)
             exit()
+    def _recordPiRead(self, fileName: str):
+        '''Record the md5 of a piStruct/piDefault file the first time it is read,
+           unless it was written by this seed file.'''
+        if fileName not in self.piReadFiles and fileName not in self.piWriteFiles:
+            self.piReadFiles[fileName] = getFileMD5(fileName)
+    def _recordPiWrite(self, fileName: str):
+        if fileName not in self.piWriteFiles:
+            self.piWriteFiles.append(fileName)
+    @property
+    def germFilePaths(self) -> list[str]:
+        '''All germ files written while germinating this seed file.'''
+        rtnList = list(self.piWriteFiles)
+        rtnList += self.piClassGCFiles.classGCFilePaths
+        rtnList += self.piDefGCFiles.defGCFilePaths
+        rtnList += self.piGenClassFiles.genClassFilePaths
+        return rtnList
     def cloneDict(self, theDict: dict):
+        self._recordPiRead(getPiStrucFileName(self.seeds.currPi.piTitle))
+        # readPiStruc hands out a private copy of the cached template
         cloneFromDisk = readPiStruc(self.seeds.currPi.piTitle)
         if cloneFromDisk:
-            dictClone = copy.deepcopy(cloneFromDisk)
             if self.seeds.currPi.piSD[-1] == ".":
                 for aKey in cloneFromDisk.keys():
-                    theDict[aKey] = copy.deepcopy(cloneFromDisk[aKey])
+                    theDict[aKey] = cloneFromDisk[aKey]
                 # print(f'theDict: {theDict}')
             else:
-                theDict[self.seeds.currPi.piSD] = dictClone
+                theDict[self.seeds.currPi.piSD] = cloneFromDisk
         else: raise piPiStrucNotFound
         # print(theDict)
 ##### Public Functions
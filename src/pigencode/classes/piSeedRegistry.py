@@ -5,6 +5,7 @@ Replaces exec() calls with a cleaner, more maintainable approach.
 
 from typing import Dict, Any, Protocol
 from ..defs.logIt import printIt, label
+from ..defs.piProfile import profilePhase
 
 
 class PiSeedHandler(Protocol):
@@ -52,7 +53,8 @@ class PiSeedTypeRegistry:
         """Process a piSeed using the appropriate handler"""
         try:
             handler = self.get_handler(seed_type)
-            handler(germ_seeds_instance)
+            with profilePhase("germinate", seed_type):
+                handler(germ_seeds_instance)
         except ValueError as e:
             printIt(f"Handler error: {e}", label.ERROR)
             raise
@@ -1,10 +1,14 @@
 import shlex
+from sys import intern
+from functools import lru_cache
 from traceback import format_exception
 from ..defs.logIt import logIt, printIt, label
-from re import Pattern, compile as reCompile, match, Match
+from ..defs.piProfile import profileDef, profiling, addBytesRead
+from re import Pattern, compile as reCompile, Match
 from typing import Any
 
 class PiSeed():
+    __slots__ = ("lineNumber", "piType", "piTitle", "piSD", "piSeedType", "piSeedKeyType", "piSeedKeyDepth")
     def __init__(self, aPi: tuple | None, lineNumber):
         self.lineNumber: int = lineNumber
         if aPi:
@@ -34,35 +38,21 @@ class PiSeed():
         return rtnDict
 
 
+emptyPiSeed = PiSeed(None, 0)
+
 class PiSeeds():
 
     def __init__(self, fileName: str = ''):
         self.seedFile = fileName
         self._piSeeds: list[PiSeed] = []
         if self.seedFile:
-            seedPiList = readSeedPis(fileName)
-            #printIt(f'seedList: {len(seedPiList)}')
-            for anFilePi in seedPiList:
-                lineNumber = anFilePi[0]
-                aPi = (anFilePi[1], anFilePi[2], anFilePi[3])
-                theSeed = PiSeed(aPi, lineNumber)
-                try:
-                    theMatchGroups = piSeedTokenMatch(theSeed.piType, PiSeedTypeREs)
-                    theSeed.piSeedType = theMatchGroups[0]
-                    theMatchLen = len(theMatchGroups)
-                except Exception as e:
-                    # tb_str = ''.join(traceback.format_exception(None, e, e.__traceback__))
-                    # printIt(f'piGerminator.py\n{tb_str}',label.ERROR)
-                    # exit()
-                    theMatchLen = 0
-                    theMatchGroups = {}
-
-                if theMatchLen > 1:
-                    theSeed.piSeedKeyType = theMatchGroups[1]
-                    if theMatchLen > 2:
-                        assert theMatchGroups[2].isnumeric()
-                        theSeed.piSeedKeyDepth = int(theMatchGroups[2])
-
+            for lineNumber, piType, piTitle, piSD, piSeedType, piSeedKeyType, piSeedKeyDepth \
+                    in tokenizeSeedFile(fileName):
+                # piTypes and piTitles repeat on most lines of a seed file
+                theSeed = PiSeed((intern(piType), intern(piTitle), piSD), lineNumber)
+                theSeed.piSeedType = intern(piSeedType)
+                theSeed.piSeedKeyType = intern(piSeedKeyType)
+                theSeed.piSeedKeyDepth = piSeedKeyDepth
                 self._piSeeds.append(theSeed)
         self._currIndex = 0
         self._seedCount = len(self._piSeeds)
@@ -71,25 +61,23 @@ class PiSeeds():
     @property
     def piSeeds(self) -> list[PiSeed]:
         return self._piSeeds
+    # prevPi/currPi/nextPi/next return the shared emptyPiSeed past either end;
+    # it must not be modified.
     @property
     def prevPi(self) -> PiSeed:
-        rtnPi = PiSeed(None, 0)
         if self._currIndex > 0:
-            rtnPi = self.piSeeds[self._currIndex - 1]
-        #print(f'rtnPi: {rtnPi}')
-        return rtnPi
+            return self._piSeeds[self._currIndex - 1]
+        return emptyPiSeed
     @property
     def currPi(self) -> PiSeed:
-        rtnPi = PiSeed(None,0)
         if self._currIndex >= 0 and self._currIndex < self._seedCount:
-            rtnPi = self.piSeeds[self._currIndex]
-        return rtnPi
+            return self._piSeeds[self._currIndex]
+        return emptyPiSeed
     @property
     def nextPi(self) -> PiSeed:
-        rtnPi = PiSeed(None,0)
-        if self._currIndex + 1 < len(self.piSeeds):
-            rtnPi = self.piSeeds[self._currIndex + 1]
-        return rtnPi
+        if self._currIndex + 1 < self._seedCount:
+            return self._piSeeds[self._currIndex + 1]
+        return emptyPiSeed
     @property
     def currIndex(self) -> int:
         return self._currIndex
@@ -98,8 +86,8 @@ class PiSeeds():
         return self._seedCount
 
     def next(self) -> PiSeed:
-        rtnPi = PiSeed(None, 0)
-        if self._currIndex + 1 < len(self.piSeeds):
+        rtnPi = emptyPiSeed
+        if self._currIndex + 1 < self._seedCount:
             self._currIndex += 1
             rtnPi = self.piSeeds[self._currIndex]
         else:
@@ -131,6 +119,10 @@ PiSeedTypeREs = {
     PiSeedTypes[8]: reCompile('(piGenClass)'),
     'default': reCompile('(.+)') # this last one returns the input string
 } # example piStrucD00
+piCommentRE = reCompile('\\s*#.*')
+piSeedSplitRE = reCompile(r'^(\S+)\s+(\S+)\s+(?:["\'])(.*)(?:["\'])$')
+piShlexSpecialRE = reCompile(r'[\'"\\]')
+piShlexSplitRE = reCompile(r'[ \t\r\n]+')
 PiFunctionsTokens = ["getPiIDMD5", "getPiMD5", "getMD5"]
 PiFunctionsTokenREs = {
     PiFunctionsTokens[0]: reCompile('(getPiIDMD5)\\((.+)\\)'),
@@ -169,51 +161,77 @@ def piSeedTokenMatch(seed: str, piSeedTokenREs: dict[str, Pattern[str]]) -> tupl
             break
     return theMatchGroups
 
-def readSeedPis(piFileName) -> list[tuple]:
-    piBaseList: list[tuple] = []
-    __chkReg = reCompile('\\s*#.*')
+@lru_cache(maxsize=None)
+def classifyPiType(piType: str) -> tuple[str, str, int]:
+    '''Return (piSeedType, piSeedKeyType, piSeedKeyDepth) for a piType.
+       Memoized: a seed file uses only a handful of distinct piTypes.'''
+    piSeedType, piSeedKeyType, piSeedKeyDepth = "", "", -1
+    try:
+        theMatchGroups = piSeedTokenMatch(piType, PiSeedTypeREs)
+        piSeedType = theMatchGroups[0]
+        theMatchLen = len(theMatchGroups)
+    except Exception:
+        theMatchLen = 0
+    if theMatchLen > 1:
+        piSeedKeyType = theMatchGroups[1]
+        if theMatchLen > 2:
+            assert theMatchGroups[2].isnumeric()
+            piSeedKeyDepth = int(theMatchGroups[2])
+    return piSeedType, piSeedKeyType, piSeedKeyDepth
+
+@profileDef("parse")
+def tokenizeSeedFile(piFileName) -> list[tuple]:
+    '''Read a piSeed file in one pass returning
+       (lineNumber, piType, piTitle, piSD, piSeedType, piSeedKeyType, piSeedKeyDepth)
+       records for every seed line.'''
+    piSeedRecords: list[tuple] = []
     with open(piFileName, 'r') as f:
-        inLineNumber = 1
-        while True:
-            currLine = f.readline()
-            if not currLine:
-                break
-            if not __chkReg.match(currLine) and len(currLine) > 1: # > 1 because blank lines contain \n char.
-                try:
-                    piType, piTitle, piSD = extractPiSeed(currLine)
-                    piBaseList.append((inLineNumber, piType, piTitle, piSD))
-                except ValueError as ve:
-                    # Handle shlex parsing errors (like unclosed quotes)
-                    if "No closing quotation" in str(ve):
-                        # Try to parse manually by splitting on spaces but preserving quoted sections
-                        try:
-                            # Simple fallback: split on first two spaces, treat rest as description
-                            parts = currLine.strip().split(None, 2)
-                            if len(parts) >= 2:
-                                piType = parts[0]
-                                piTitle = parts[1]
-                                piSD = parts[2] if len(parts) > 2 else ""
-                                # Clean up quotes if they exist
-                                if piSD.startswith('"') and not piSD.endswith('"'):
-                                    piSD = piSD[1:]  # Remove starting quote
-                                elif piSD.endswith('"') and not piSD.startswith('"'):
-                                    piSD = piSD[:-1]  # Remove ending quote
-                                piBaseList.append((inLineNumber,piType, piTitle, piSD))
-                            else:
-                                raise Exception("Could not parse line with quote issues")
-                        except Exception as fallback_e:
-                            tb_str = ''.join(format_exception(None, fallback_e, fallback_e.__traceback__))
-                            printIt(f'{__file__}, line:{inLineNumber}\n{tb_str}', label.ERROR)
-                            printIt(f'current line: {currLine}', label.ERROR)
-                    else:
-                        # Re-raise other ValueError types
-                        raise ve
-                except Exception as e:
-                    tb_str = ''.join(format_exception(None, e, e.__traceback__))
-                    printIt(f'{piFileName}, line:{inLineNumber}\n{tb_str}',label.ERROR)
-                    printIt(f'current line: {currLine}\n{tb_str}',label.ERROR)
-            inLineNumber += 1
-    return piBaseList
+        seedLines = f.readlines()
+        if profiling(): addBytesRead(f.buffer.tell())
+    for inLineNumber, currLine in enumerate(seedLines, 1):
+        if len(currLine) > 1 and not piCommentRE.match(currLine): # > 1 because blank lines contain \n char.
+            piSeed = _extractPiSeedLine(piFileName, inLineNumber, currLine)
+            if piSeed:
+                piSeedRecords.append((inLineNumber, *piSeed, *classifyPiType(piSeed[0])))
+    return piSeedRecords
+
+def readSeedPis(piFileName) -> list[tuple]:
+    return [piSeedRecord[:4] for piSeedRecord in tokenizeSeedFile(piFileName)]
+
+def _extractPiSeedLine(piFileName, inLineNumber: int, currLine: str) -> tuple | None:
+    try:
+        return extractPiSeed(currLine)
+    except ValueError as ve:
+        # Handle shlex parsing errors (like unclosed quotes)
+        if "No closing quotation" in str(ve):
+            # Try to parse manually by splitting on spaces but preserving quoted sections
+            try:
+                # Simple fallback: split on first two spaces, treat rest as description
+                parts = currLine.strip().split(None, 2)
+                if len(parts) >= 2:
+                    piType = parts[0]
+                    piTitle = parts[1]
+                    piSD = parts[2] if len(parts) > 2 else ""
+                    # Clean up quotes if they exist
+                    if piSD.startswith('"') and not piSD.endswith('"'):
+                        piSD = piSD[1:]  # Remove starting quote
+                    elif piSD.endswith('"') and not piSD.startswith('"'):
+                        piSD = piSD[:-1]  # Remove ending quote
+                    return (piType, piTitle, piSD)
+                else:
+                    raise Exception("Could not parse line with quote issues")
+            except Exception as fallback_e:
+                tb_str = ''.join(format_exception(None, fallback_e, fallback_e.__traceback__))
+                printIt(f'{__file__}, line:{inLineNumber}\n{tb_str}', label.ERROR)
+                printIt(f'current line: {currLine}', label.ERROR)
+        else:
+            # Re-raise other ValueError types
+            raise ve
+    except Exception as e:
+        tb_str = ''.join(format_exception(None, e, e.__traceback__))
+        printIt(f'{piFileName}, line:{inLineNumber}\n{tb_str}',label.ERROR)
+        printIt(f'current line: {currLine}\n{tb_str}',label.ERROR)
+    return None
 
 
 def extractPiSeed(currLine) -> tuple[str, str, str]:
@@ -223,13 +241,15 @@ def extractPiSeed(currLine) -> tuple[str, str, str]:
     # #splitPattern = r"^(\S+)\s+(\S+)\s+['\"]*(.+)['\"]*$"
     # print(currLine)
     # #splitPattern = r"^(\S+)\s+(\S+)\s+['\"]*(.*?)['\"]*$"
-    splitPattern = r'^(\S+)\s+(\S+)\s+(?:["\'])(.*)(?:["\'])$'
-    matchTokens: Match[str] | None = match(
-        splitPattern, currLine)
+    matchTokens: Match[str] | None = piSeedSplitRE.match(currLine)
     if matchTokens:
         # print('match')
         # print('matchTokens:', len(matchTokens.groups()))
         tokens = list(matchTokens.groups())
+    elif not piShlexSpecialRE.search(currLine):
+        # no quotes or escapes: shlex.split would only split on whitespace
+        tokens = piShlexSplitRE.split(currLine.strip(' \t\r\n'))
+        if tokens == ['']: tokens = []
     else:
         # print('shlex')
         # preserve singel quote strings if present.
@@ -1,19 +1,18 @@
 import sys, traceback
 from argparse import Namespace
 from pigencode.defs.logIt import printIt, label
-from .commands import Commands
+from pigencode.defs.piProfile import startProfile, stopProfile, printProfile
+from .commands import getCommands
 from .cmdOptSwitchbord import cmdOptSwitchbord
 from pigencode.classes.argParse import ArgParse
 from pigencode.classes.piSeedRegistry import command_registry
 
-cmdObj = Commands()
-commands = cmdObj.commands
-switchFlags = cmdObj.switchFlags["switcheFlags"]
-
 def cmdSwitchbord(argParse: ArgParse):
-    global commands
     theCmd = 'notSet'
     try:
+        cmdObj = getCommands()
+        commands = cmdObj.commands
+        switchFlags = cmdObj.switchFlags["switcheFlags"]
         if len(sys.argv) > 1:
             if len(sys.argv) > 2:
                 switchFlagChk = sys.argv[2]
@@ -30,13 +29,20 @@ def cmdSwitchbord(argParse: ArgParse):
             args: Namespace = argParse.args
             theCmd = args.commands[0]
             if theCmd in commands.keys():
-                # Use registry pattern instead of exec()
+                pstatsFile = argParse.cmd_options.get('pstats', '')
+                profile = 'profile' in argParse.cmd_options or bool(pstatsFile)
+                if profile:
+                    startProfile(theCmd, pstatsFile if isinstance(pstatsFile, str) else f'{theCmd}.pstats')
                 try:
-                    command_registry.execute_command(theCmd, argParse)
-                except ValueError:
-                    # Fallback to old exec() method if command not in registry
-                    exec(f'from pigencode.commands.{theCmd} import {theCmd}')
-                    exec(f'{theCmd}(argParse)')
+                    # Use registry pattern instead of exec()
+                    try:
+                        command_registry.execute_command(theCmd, argParse)
+                    except ValueError:
+                        # Fallback to old exec() method if command not in registry
+                        exec(f'from pigencode.commands.{theCmd} import {theCmd}')
+                        exec(f'{theCmd}(argParse)')
+                finally:
+                    if profile: printProfile(stopProfile())
             else:
                 print(args)
                 printIt(f'Command "{theCmd}" not present.\n',label.ERROR)
@@ -61,6 +67,7 @@ def _register_commands():
     command_registry.register_lazy("genCode", "genCode")
     command_registry.register_lazy("syncCode", "syncCode")
     command_registry.register_lazy("reorderSeeds", "reorderSeeds")
+    command_registry.register_lazy("watch", "watch")
 
 # Initialize command registration
 _register_commands()
@@ -1,12 +1,11 @@
 import json, os
 from copy import copy
-import inspect
 
 cmdDescriptionTagStr = "_description"
 
 class Commands(object):
     def __init__(self) -> None:
-        self.cmdFileDir = os.path.dirname(inspect.getfile(self.__class__))
+        self.cmdFileDir = os.path.dirname(__file__)
         self.cmdFileName = os.path.join(self.cmdFileDir, "commands.json" )
         with open(self.cmdFileName, "r") as fr:
             rawJson = json.load(fr)
@@ -50,3 +49,21 @@ class Commands(object):
                 chkName = aFile[:-3]
                 if chkName not in self.commands and chkName != "commands":
                     self.commands[chkName] = [" - No argument"]
+
+# Command table shared within a process, reloaded when commands.json or the
+# commands directory changes.
+cmdTableCache: dict = {}
+
+def getCommands() -> Commands:
+    '''Return the shared Commands table.'''
+    cmdFileDir = os.path.dirname(__file__)
+    try:
+        cmdFileStat = os.stat(os.path.join(cmdFileDir, "commands.json"))
+        cmdTableKey = (cmdFileStat.st_mtime_ns, cmdFileStat.st_size,
+                       os.stat(cmdFileDir).st_mtime_ns)
+    except OSError:
+        cmdTableKey = None
+    if cmdTableCache.get("key") != cmdTableKey or "commands" not in cmdTableCache:
+        cmdTableCache["commands"] = Commands()
+        cmdTableCache["key"] = cmdTableKey
+    return cmdTableCache["commands"]
@@ -3,18 +3,23 @@ from pathlib import Path
 from json import dumps
 from pigencode.classes.argParse import ArgParse
 from pigencode.defs.logIt import printIt, label
-from pigencode.defs.fileIO import getKeyItem, piGCDirs
+from pigencode.defs.fileIO import getKeyItem, piGCDirs, readJson, flushRC
+from pigencode.defs.piProfile import profiling, runProfiledJob, mergeProfile
+from pigencode.defs.piTrackingFile import deferTrackingUpdates, popTrackingUpdates, mergeTrackingUpdates, \
+    flushTrackingFiles
 from pigencode.classes.piGenCode import genPiPiClass
 from pigencode.classes.piGenDefCode import genPiDefCode
 from pigencode.classes.piGenClassCode import genPiGenClass
+from .reorderSeeds import recoverReorderJournal
 
 def genCode(argParse: ArgParse):
     # Use the already parsed arguments from ArgParse.__init__
     args = argParse.args
     theArgs = args.arguments
+    if not recoverReorderJournal(Path(getKeyItem(piGCDirs[0]))): return
     if not theArgs:
         # No arguments - process all files
-        savedCodeFiles = genCodeFile("")
+        savedCodeFiles = genCodeFile("", jobs=getJobsOption(argParse))
     elif len(theArgs) == 1:
         # Single argument - could be filename, number shortcut, or old syntax
         arg = theArgs[0]
@@ -29,11 +34,20 @@ def genCode(argParse: ArgParse):
     else:
         # Multiple arguments - new shortcut syntax
         savedCodeFiles = processShortcutSyntax(theArgs)
+    flushTrackingFiles()
 
     for savedCodeFile in savedCodeFiles.values():
         fileName = Path(savedCodeFile).resolve().relative_to(Path.cwd().resolve())
         printIt(f'generated: {fileName} ', label.INFO)
 
+def getJobsOption(argParse: ArgParse) -> int:
+    jobs = argParse.cmd_options.get('jobs', 1)
+    try: jobs = int(jobs)
+    except (TypeError, ValueError):
+        printIt(f'--jobs requires an integer: {jobs}', label.WARN)
+        jobs = 1
+    return max(jobs, 1)
+
 def processNumberShortcut(number: int) -> dict:
     """
     Process number-only shortcut like 'genCode 31'
@@ -235,10 +249,12 @@ def findGermFile(fileType: str, number: int) -> str:
         printIt(f"Error finding germ file for {fileType} {number}: {e}", label.ERROR)
         return ""
 
-def genCodeFile(fileName="", verbose=False) -> dict:
+def genCodeFile(fileName="", verbose=False, jobs=1) -> dict:
     savedCodeFiles: dict = {}
     try:
-        if fileName:
+        if not fileName and jobs > 1:
+            savedCodeFiles = genCodeFilesParallel(jobs, verbose)
+        elif fileName:
             if os.path.isfile(fileName):
                 # Determine file type based on filename pattern
                 if "piClassGC" in fileName:
@@ -306,4 +322,96 @@ def processAllPiGenClassFiles(verbose=False) -> dict:
     except Exception as e:
         printIt(f"Error processing piGenClass files: {e}", label.ERROR)
 
-    return savedCodeFiles
\ No newline at end of file
+    return savedCodeFiles
+def _genCodeJob(genKind: str, fileName: str, verbose=False) -> tuple[dict, list]:
+    """Generate code from one germ file in a worker process. Tracking file
+       updates are returned for the parent to merge."""
+    deferTrackingUpdates()
+    savedCodeFiles = {}
+    if genKind == "piDefGC":
+        savedCodeFiles = genPiDefCode(fileName, verbose)
+    elif genKind == "piGenClass":
+        outFileName = genPiGenClass(fileName)
+        if outFileName:
+            savedCodeFiles[outFileName] = outFileName
+    else:
+        savedCodeFiles = genPiPiClass(fileName, verbose)
+    return savedCodeFiles, popTrackingUpdates()
+
+def _getGenCodeJobFiles(genKind: str, fileName: str) -> tuple[str, set]:
+    """Return the .py file a germ file generates and the .py files it reads
+       (the piClassGC files of the classes it inherits from)."""
+    defaultDirs = {"piDefGC": (piGCDirs[3], "functions"),
+                   "piGenClass": (piGCDirs[4], "classes"),
+                   "piClassGC": (piGCDirs[2], "")}
+    dirKey, defaultFileName = defaultDirs[genKind]
+    germJson = readJson(fileName, False)
+    genBody = germJson.get("piBody", {}).get(genKind, {})
+    fileDirectory = Path(genBody.get("fileDirectory") or getKeyItem(dirKey))
+    if not fileDirectory.is_absolute():
+        fileDirectory = Path.cwd().joinpath(fileDirectory)
+    outFileName = genBody.get("fileName") or defaultFileName or \
+        germJson.get("piBase", {}).get("piTitle", "")
+    readFileNames = set()
+    if genKind == "piClassGC":
+        for inheritClassName in genBody.get("inheritance", []):
+            if inheritClassName not in ("object", "dict"):
+                lowerClassName = inheritClassName[:2].lower() + inheritClassName[2:]
+                readFileNames.add(str(fileDirectory.joinpath(f"{lowerClassName}.py")))
+    return str(fileDirectory.joinpath(f"{outFileName}.py")), readFileNames
+
+def genCodeFilesParallel(jobs=2, verbose=False) -> dict:
+    """Generate all germ files across a process pool. Jobs keep the serial
+       order (piDefGC, piGenClass, piClassGC) only where one writes a .py file
+       another writes or reads through inheritance. Tracking files are merged
+       once at the end in serial order."""
+    piGermDir = Path(getKeyItem(piGCDirs[1]))
+    genJobs: list[tuple[str, str]] = []
+    defGCDir = piGermDir.joinpath(getKeyItem(piGCDirs[3]))
+    if defGCDir.is_dir():
+        genJobs += [("piDefGC", str(defGCDir.joinpath(f))) for f in sorted(os.listdir(defGCDir)) if f.endswith('.json')]
+    genClassDir = piGermDir.joinpath("piGenClass")
+    if genClassDir.is_dir():
+        genJobs += [("piGenClass", str(f)) for f in genClassDir.glob("piGenClass*.json")]
+    classGCDir = piGermDir.joinpath(getKeyItem(piGCDirs[2]))
+    if classGCDir.is_dir():
+        genJobs += [("piClassGC", str(classGCDir.joinpath(f))) for f in sorted(os.listdir(classGCDir))]
+
+    jobFiles = [_getGenCodeJobFiles(genKind, fileName) for genKind, fileName in genJobs]
+    jobDeps: list[set[int]] = []
+    for jobIndex, (outFileName, readFileNames) in enumerate(jobFiles):
+        jobDeps.append(set(prevIndex for prevIndex, (prevOutFileName, prevReadFileNames) \
+            in enumerate(jobFiles[:jobIndex]) if prevOutFileName == outFileName or \
+            prevOutFileName in readFileNames or outFileName in prevReadFileNames))
+
+    jobResults: dict[int, tuple[dict, list]] = {}
+    flushRC()  # workers read the rc file
+    # imported here: loading multiprocessing slows every CLI start
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        waitingJobs = list(range(len(genJobs)))
+        runningJobs = {}
+        while waitingJobs or runningJobs:
+            for jobIndex in list(waitingJobs):
+                if jobDeps[jobIndex] <= jobResults.keys():
+                    waitingJobs.remove(jobIndex)
+                    genKind, fileName = genJobs[jobIndex]
+                    runningJobs[executor.submit(runProfiledJob, profiling(), _genCodeJob,
+                                                genKind, fileName, verbose)] = jobIndex
+            doneJobs, _ = wait(runningJobs, return_when=FIRST_COMPLETED)
+            for doneJob in doneJobs:
+                jobResults[runningJobs.pop(doneJob)], jobPhase = doneJob.result()
+                mergeProfile(jobPhase)
+
+    trackingUpdates = []
+    savedFilesByKind: dict[str, dict] = {"piDefGC": {}, "piGenClass": {}, "piClassGC": {}}
+    for jobIndex, (genKind, fileName) in enumerate(genJobs):
+        jobSavedFiles, jobTrackingUpdates = jobResults[jobIndex]
+        savedFilesByKind[genKind].update(jobSavedFiles)
+        trackingUpdates += jobTrackingUpdates
+    mergeTrackingUpdates(trackingUpdates)
+    savedCodeFiles = {}
+    savedCodeFiles.update(savedFilesByKind["piClassGC"])
+    savedCodeFiles.update(savedFilesByKind["piDefGC"])
+    savedCodeFiles.update(savedFilesByKind["piGenClass"])
+    return savedCodeFiles
@@ -1,24 +1,34 @@
 import os, traceback
+from io import StringIO
+from contextlib import redirect_stdout
 from re import compile as reCompile
 from pathlib import Path
 from pigencode.classes.argParse import ArgParse
 from pigencode.defs.logIt import printIt, label
-from pigencode.defs.fileIO import getKeyItem, writeRC, piGCDirs
+from pigencode.defs.fileIO import getKeyItem, writeRC, piGCDirs, flushRC, readJson
 from pigencode.defs.getSeedPath import getSeedPath
 from pigencode.classes.piGermSeeds import PiGermSeeds, germinateSeeds
 from pigencode.classes.piSeeds import PiSeeds
-from .genCode import genCodeFile
+from pigencode.defs.piGermManifest import PiGermManifest
+from pigencode.defs.piProfile import profiling, runProfiledJob, mergeProfile
+from pigencode.defs.piGermDAG import buildSeedDAG
+from .genCode import genCodeFile, getJobsOption
+from .reorderSeeds import recoverReorderJournal
 
 seedFilePattern = reCompile(
     r'(piSeed)([0-9]{3})(?:_.*)?(.pi)')  # piSeed000_name.pi
 
 def germSeed(argParse: ArgParse):
-    args = argParse.parser.parse_args()
+    # options such as --incremental are already filtered out of argParse.args
+    args = argParse.args
     theArgs = args.arguments
     argIndex = 0
     piGermSeeds: PiGermSeeds
+    if not recoverReorderJournal(Path(getKeyItem(piGCDirs[0]))): return
     if len(theArgs) == 0:
-        piGermSeeds = germAllSeedFiles()
+        incremental = argParse.cmd_options.get('incremental', False)
+        jobs = getJobsOption(argParse)
+        piGermSeeds = germAllSeedFiles(incremental=incremental, jobs=jobs)
     else:
         try: chkArg = int(theArgs[0])
         except: chkArg = theArgs[0]
@@ -74,23 +84,214 @@ def getSeedFileName(fileIntStr) -> str:
                 fileName = ''
     return str(fileName)
 
-def germAllSeedFiles(verbose=True) -> PiGermSeeds:
+def germAllSeedFiles(verbose=True, incremental=False, jobs=1, writeFiles: list | None = None) -> PiGermSeeds:
+    '''Germinate the piSeed files; writeFiles, when given, is extended by
+       the files written, including generated code.'''
     seedPath = getSeedPath()
     piSeeds = PiSeeds()
     piGermSeeds = PiGermSeeds(piSeeds)
     if seedPath:
         seedFiles = [str(p.name) for p in seedPath.iterdir() if p.is_file()]
         seedFiles.sort()
-        for fileName in seedFiles:
-            theMatch = seedFilePattern.match(fileName)
-            #print('theMatch', fileName, theMatch)
-            if theMatch:
-                seedFile = str(seedPath.joinpath(fileName))
-                piGermSeeds = germSeedFile(seedFile, verbose)
+        seedFiles = [str(seedPath.joinpath(fileName)) for fileName in seedFiles \
+                     if seedFilePattern.match(fileName)]
+        if incremental:
+            return germChangedSeedFiles(seedFiles, verbose, jobs, writeFiles) or piGermSeeds
+        if jobs > 1:
+            germedSeeds = germSeedFilesParallel(seedFiles, verbose, jobs)
+            if germedSeeds:
+                piGermSeeds = list(germedSeeds.values())[-1]
+        else:
+            germedSeeds = {}
+            for seedFile in seedFiles:
+                piGermSeeds = germedSeeds[seedFile] = germSeedFile(seedFile, verbose)
+        if writeFiles is not None:
+            for seedGerm in germedSeeds.values():
+                if seedGerm: writeFiles += seedGerm.piWriteFiles
     else:
         printIt(f'No piSeed Directory founc: {seedPath}',label.FileNotFound)
     return piGermSeeds
 
+def germSeedFilesParallel(seedFiles: list, verbose=True, jobs=2) -> dict[str, PiGermSeeds]:
+    '''Germinate seed files across a process pool. A seed file is submitted once
+       all earlier seed files it depends on (see buildSeedDAG) have finished, so
+       the germ files match a serial run.'''
+    seedDeps = buildSeedDAG(seedFiles)
+    germedSeeds: dict[str, PiGermSeeds] = {}
+    flushRC()  # workers read the rc file
+    # imported here: loading multiprocessing slows every CLI start
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        waitingSeeds = list(seedFiles)
+        runningSeeds = {}
+        seedOutputs: dict[str, tuple[str, bool]] = {}
+        printedCount = 0
+        while waitingSeeds or runningSeeds:
+            for seedFile in list(waitingSeeds):
+                if seedDeps[seedFile] <= germedSeeds.keys():
+                    waitingSeeds.remove(seedFile)
+                    runningSeeds[executor.submit(runProfiledJob, profiling(), _germSeedJob,
+                                                 seedFile, verbose)] = seedFile
+            doneSeeds, _ = wait(runningSeeds, return_when=FIRST_COMPLETED)
+            for doneSeed in doneSeeds:
+                seedFile = runningSeeds.pop(doneSeed)
+                (germedSeeds[seedFile], *seedOutputs[seedFile]), seedPhase = doneSeed.result()
+                mergeProfile(seedPhase)
+            # messages in seed order, each seed's once all earlier seeds printed theirs
+            while printedCount < len(seedFiles) and seedFiles[printedCount] in seedOutputs:
+                seedOutput, seedExited = seedOutputs.pop(seedFiles[printedCount])
+                print(seedOutput, end='')
+                if seedExited:
+                    # stop at the failed seed, as a serial run does
+                    executor.shutdown(cancel_futures=True)
+                    exit()
+                printedCount += 1
+    return {seedFile: germedSeeds[seedFile] for seedFile in seedFiles}
+
+def _germSeedJob(seedFile: str, verbose=True) -> tuple[PiGermSeeds | None, str, bool]:
+    '''germSeedFile in a worker process. Its messages are returned rather
+       than printed, for the parent to print in seed order, and whether it
+       exited on an error.'''
+    seedOutput = StringIO()
+    try:
+        with redirect_stdout(seedOutput):
+            piGermSeeds = germSeedFile(seedFile, verbose)
+    except SystemExit:
+        return None, seedOutput.getvalue(), True
+    return piGermSeeds, seedOutput.getvalue(), False
+
+def germChangedSeedFiles(seedFiles: list, verbose=True, jobs=1, writeFiles: list | None = None) -> PiGermSeeds | None:
+    '''Germinate only seed files whose content or piStruct/piDefault inputs changed
+       since the last incremental run, or whose classes inherit from a class
+       generated again, then generate code from their germ files. writeFiles,
+       when given, is extended by the germ and code files written.'''
+    manifest = PiGermManifest()
+    manifest.pruneSeeds(seedFiles)
+    piGermSeeds = None
+    # classes generated again; their child classes pass the parent's arguments on
+    changedClasses: set[str] = set()
+    germedSeeds: dict[str, PiGermSeeds] = {}
+    staleSeeds = []
+    seedDeps = {}
+    if jobs > 1:
+        # a seed depending on a changed seed is germinated again as well
+        seedDeps = buildSeedDAG(seedFiles)
+        for seedFile in seedFiles:
+            if seedDeps[seedFile] & set(staleSeeds) or not manifest.isSeedCurrent(seedFile):
+                staleSeeds.append(seedFile)
+                changedClasses |= manifest.getSeedClasses(seedFile)
+    else:
+        # checked in order so seeds reading files rewritten by an earlier seed are caught
+        for seedFile in seedFiles:
+            if not manifest.isSeedCurrent(seedFile):
+                staleSeeds.append(seedFile)
+                germedSeeds[seedFile] = germSeedFile(seedFile, verbose)
+                changedClasses |= manifest.getSeedClasses(seedFile)
+                if germedSeeds[seedFile]:
+                    changedClasses |= getSeedClassNames(germedSeeds[seedFile])[0]
+    # child classes may come before or after their parent in seed order, so the
+    # stale seeds are expanded until no seed inherits from a changed class
+    while True:
+        staleSeeds += getInheritingSeeds(seedFiles, staleSeeds, changedClasses, manifest, seedDeps)
+        waitingSeeds = [seedFile for seedFile in staleSeeds if seedFile not in germedSeeds]
+        if not waitingSeeds: break
+        if jobs > 1:
+            germedSeeds.update(germSeedFilesParallel(waitingSeeds, verbose, jobs))
+        else:
+            for seedFile in waitingSeeds:
+                germedSeeds[seedFile] = germSeedFile(seedFile, verbose)
+        for seedFile in waitingSeeds:
+            # a germinated seed may generate classes the manifest does not know yet
+            if germedSeeds[seedFile]:
+                changedClasses |= getSeedClassNames(germedSeeds[seedFile])[0]
+    skipCount = len(seedFiles) - len(germedSeeds)
+    germedSeeds = {seedFile: germedSeeds[seedFile] for seedFile in seedFiles
+                   if germedSeeds.get(seedFile)}
+    if germedSeeds:
+        piGermSeeds = list(germedSeeds.values())[-1]
+    # generate code in the same order as genCodeFile(""): piDefGC, piGenClass, then piClassGC
+    for seedGerm in germedSeeds.values():
+        for defGCFile in seedGerm.piDefGCFiles.defGCFilePaths:
+            seedGerm.piWriteFiles += [str(f) for f in genCodeFile(str(defGCFile))]
+    for seedGerm in germedSeeds.values():
+        for genClassFile in seedGerm.piGenClassFiles.genClassFilePaths:
+            seedGerm.piWriteFiles += [str(f) for f in genCodeFile(str(genClassFile))]
+    # genCode reads the python file of a parent class, so parents are generated first
+    classGCGerms = {}
+    for seedGerm in germedSeeds.values():
+        for classGCFile in seedGerm.piClassGCFiles.classGCFilePaths:
+            classGCGerms[str(classGCFile)] = seedGerm
+    for classGCFile in sortParentsFirst(list(classGCGerms)):
+        classGCGerms[classGCFile].piWriteFiles += [str(f) for f in genCodeFile(classGCFile)]
+    for seedFile, seedGerm in germedSeeds.items():
+        if writeFiles is not None: writeFiles += seedGerm.piWriteFiles
+        classNames, inheritNames = getSeedClassNames(seedGerm)
+        manifest.recordSeed(seedFile, seedGerm.piReadFiles,
+                            [str(germFile) for germFile in seedGerm.germFilePaths],
+                            classNames, inheritNames)
+    manifest.save()
+    if verbose:
+        printIt(f'{len(germedSeeds)} seed files germinated, {skipCount} unchanged', label.INFO)
+    return piGermSeeds
+
+def getInheritingSeeds(seedFiles: list, staleSeeds: list, changedClasses: set[str],
+                       manifest: PiGermManifest, seedDeps: dict = {}) -> list:
+    '''Seed files, in seed order, not in staleSeeds that inherit from a class in
+       changedClasses or depend on a stale seed in seedDeps, repeated until none
+       is added. changedClasses grows by the classes of the added seeds.'''
+    addedSeeds: list = []
+    while True:
+        checkedSeeds = set(staleSeeds) | set(addedSeeds)
+        newSeeds = [seedFile for seedFile in seedFiles if seedFile not in checkedSeeds and
+                    (manifest.inheritsFrom(seedFile, changedClasses) or
+                     seedDeps.get(seedFile, set()) & checkedSeeds)]
+        if not newSeeds: break
+        for seedFile in newSeeds:
+            changedClasses |= manifest.getSeedClasses(seedFile)
+        addedSeeds += newSeeds
+    return [seedFile for seedFile in seedFiles if seedFile in addedSeeds]
+
+def sortParentsFirst(classGCFiles: list[str]) -> list[str]:
+    '''classGC germ files ordered so each follows the germ files of the classes
+       it inherits from, in the given order otherwise.'''
+    classGCNames = {classGCFile: getClassGCNames(classGCFile) for classGCFile in classGCFiles}
+    genClasses = set(className for className, _ in classGCNames.values())
+    sortedFiles: list[str] = []
+    doneClasses: set[str] = set()
+    while classGCNames:
+        readyFiles = [classGCFile for classGCFile, (_, inheritNames) in classGCNames.items()
+                      if inheritNames & genClasses <= doneClasses]
+        # an inheritance cycle keeps the given order
+        if not readyFiles: readyFiles = list(classGCNames)
+        for classGCFile in readyFiles:
+            doneClasses.add(classGCNames.pop(classGCFile)[0])
+        sortedFiles += readyFiles
+    return sortedFiles
+
+def getClassGCNames(classGCFile) -> tuple[str, set[str]]:
+    '''Base name of the .py file a piClassGC germ file generates, and of the
+       .py files of the classes it inherits from (named as genCode reads them).'''
+    germJson = readJson(str(classGCFile), False)
+    genBody = germJson.get("piBody", {}).get("piClassGC", {})
+    className = genBody.get("fileName") or germJson.get("piBase", {}).get("piTitle", "")
+    inheritNames: set[str] = set()
+    for inheritClassName in genBody.get("inheritance", []):
+        if inheritClassName not in ("object", "dict"):
+            inheritNames.add(inheritClassName[:2].lower() + inheritClassName[2:])
+    return className, inheritNames
+
+def getSeedClassNames(seedGerm: PiGermSeeds) -> tuple[set[str], set[str]]:
+    '''Base names of the piClassGC .py files a germinated seed generates, and of
+       the .py files of the classes they inherit from.'''
+    classNames: set[str] = set()
+    inheritNames: set[str] = set()
+    for classGCFile in seedGerm.piClassGCFiles.classGCFilePaths:
+        className, classInheritNames = getClassGCNames(classGCFile)
+        classNames.add(className)
+        inheritNames |= classInheritNames
+    classNames.discard("")
+    return classNames, inheritNames
+
 def germSeedFile(fileName: str, verbose=True) -> PiGermSeeds:
     piGermSeeds: PiGermSeeds
     seedFilePath = Path(fileName)
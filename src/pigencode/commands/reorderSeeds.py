@@ -1,13 +1,46 @@
 import os
-import shutil
 from pathlib import Path
 from re import compile as reCompile
 from pigencode.classes.argParse import ArgParse
 from pigencode.defs.logIt import printIt, label
+from pigencode.defs.fileIO import getKeyItem, piGCDirs
 from pigencode.defs.getSeedPath import getSeedPath
+from pigencode.defs.piJsonFile import PiDefGCFiles, PiGenClassFiles, PiClassGCFiles
+from pigencode.defs.piGermManifest import PiGermManifest, manifestVersion
+from pigencode.defs.piRenameJournal import PiRenameJournal, recoverRenameJournal
 
 # Pattern to match piSeed files: piSeed000_name.pi
 seedFilePattern = reCompile(r'piSeed(\d{3})_(.+)\.pi')
+# piSeed types germinated to numbered germ files (piDefGC001_name.json)
+germFileTypes = ("piClassGC", "piDefGC", "piGenClass")
+# Journal of the renames in progress, finished or undone by the next reorderSeeds
+reorderJournalFileName = ".piReorderJournal.json"
+
+def getReorderJournalFile(seeds_dir: Path) -> Path:
+    return seeds_dir / reorderJournalFileName
+
+def recoverReorderJournal(seeds_dir: Path) -> bool:
+    """
+    Finish or undo a reorder interrupted earlier. Until then some piSeed and germ
+    files carry hidden temporary names, so germSeed and genCode would skip them.
+    Returns False when the journal is left in place.
+    """
+    journal_file = getReorderJournalFile(seeds_dir)
+    try:
+        if recoverRenameJournal(journal_file):
+            return True
+    except OSError as e:
+        printIt(f"Could not recover the interrupted reorder: {e}", label.ERROR)
+    printIt(f"Resolve {journal_file} first: files renamed by reorderSeeds keep hidden .piRenaming. names until then", label.ERROR)
+    return False
+
+def reportReorderError(seeds_dir: Path, error: OSError, action: str):
+    """Report a failed renumbering, undoing the renames it left half done"""
+    printIt(f"Error during {action}: {error}", label.ERROR)
+    if not getReorderJournalFile(seeds_dir).exists():
+        printIt("No files were renamed", label.INFO)
+    else:
+        recoverReorderJournal(seeds_dir)
 
 def reorderSeeds(argParse: ArgParse):
     """
@@ -38,6 +71,10 @@ def reorderSeeds(argParse: ArgParse):
         printIt("Could not find piSeeds directory", label.ERROR)
         return
 
+    # Finish or undo a reorder interrupted earlier before numbering anything
+    if not recoverReorderJournal(seeds_dir):
+        return
+
     # Get all piSeed files for reference
     all_seed_files = getAllSeedFiles(seeds_dir)
 
@@ -120,12 +157,16 @@ def reorderSeeds(argParse: ArgParse):
         return
 
     # Perform the reordering
-    if source_num > target_num:
-        # Moving backwards (e.g., 044 -> 009)
-        moveBackwards(seeds_dir, all_seed_files, source_num, target_num, source_name, target_name)
-    else:
-        # Moving forwards (e.g., 009 -> 044)
-        moveForwards(seeds_dir, all_seed_files, source_num, target_num, source_name, target_name)
+    try:
+        if source_num > target_num:
+            # Moving backwards (e.g., 044 -> 009)
+            moveBackwards(seeds_dir, all_seed_files, source_num, target_num, source_name, target_name)
+        else:
+            # Moving forwards (e.g., 009 -> 044)
+            moveForwards(seeds_dir, all_seed_files, source_num, target_num, source_name, target_name)
+    except OSError as e:
+        reportReorderError(seeds_dir, e, "reordering")
+        return
 
     # Validate the reordering
     if validateReorder(seeds_dir):
@@ -171,6 +212,97 @@ def getAllSeedFiles(seeds_dir: Path) -> dict:
 
     return seed_files
 
+def getSeedGermTitles(seedFile: Path) -> list[tuple[str, str]]:
+    """(piType, piTitle) of each numbered germ file a piSeed file germinates, in seed order"""
+    germTitles = []
+    with open(seedFile, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line[:1].isspace(): continue
+            lineParts = line.split(None, 2)
+            if len(lineParts) > 1 and lineParts[0] in germFileTypes:
+                germTitles.append((lineParts[0], lineParts[1]))
+    return germTitles
+
+def getGermFileDirs() -> dict:
+    """{piType: (directory, file name pattern)} of the numbered germ files"""
+    germDir = Path(getKeyItem(piGCDirs[1]))
+    return {
+        "piDefGC": (germDir.joinpath(getKeyItem(piGCDirs[3])), PiDefGCFiles.fileRE),
+        "piGenClass": (germDir.joinpath("piGenClass"), PiGenClassFiles.fileRE),
+        "piClassGC": (germDir.joinpath("piClassGC"), PiClassGCFiles.fileRE)
+    }
+
+def planGermRenames(all_files: dict, new_numbers: dict) -> list[tuple[Path, Path]]:
+    """
+    Renumber the germ files of each type so they follow the new piSeed order,
+    as germinating every piSeed again would. The n-th germ file of a title
+    belongs to the n-th piSeed file germinating that title; germ files no
+    piSeed file germinates keep their numbers.
+    """
+    germRenames = []
+    for piType, (germDir, fileRE) in getGermFileDirs().items():
+        if not germDir.is_dir(): continue
+        titleGerms: dict[str, list[tuple[int, str]]] = {}
+        for germFile in germDir.iterdir():
+            match = fileRE.match(germFile.name)
+            if match:
+                titleGerms.setdefault(match.group(2), []).append((int(match.group(1)), germFile.name))
+        for germs in titleGerms.values(): germs.sort()
+        ownedGerms = []
+        for old_num in sorted(all_files):
+            for germType, piTitle in all_files[old_num]['germTitles']:
+                if germType == piType and titleGerms.get(piTitle):
+                    germNum, germName = titleGerms[piTitle].pop(0)
+                    ownedGerms.append((new_numbers.get(old_num, old_num), germNum, piTitle, germName))
+        germNums = sorted(germNum for _, germNum, _, _ in ownedGerms)
+        for new_germ_num, (_, _, piTitle, germName) in zip(germNums, sorted(ownedGerms)):
+            newName = f"{piType}{new_germ_num:03d}_{piTitle}.json"
+            if newName != germName:
+                germRenames.append((germDir.joinpath(germName), germDir.joinpath(newName)))
+    return germRenames
+
+def planManifest(seedRenames: dict[str, str], germRenames: list[tuple[Path, Path]]) -> tuple[Path, dict] | None:
+    """Germ manifest (see germSeed --incremental) with the new piSeed and germ file names"""
+    manifest = PiGermManifest()
+    if not manifest.seeds: return None
+    germNames = {os.path.normpath(oldPath): str(newPath) for oldPath, newPath in germRenames}
+    seeds = {}
+    for seedName, seedEntry in manifest.seeds.items():
+        seedEntry = dict(seedEntry)
+        seedEntry["outputs"] = sorted(germNames.get(os.path.normpath(outputFile), outputFile)
+                                      for outputFile in seedEntry.get("outputs", []))
+        seeds[seedRenames.get(seedName, seedName)] = seedEntry
+    return manifest.fileName, {"version": manifestVersion, "seeds": seeds}
+
+def renumberSeeds(seeds_dir: Path, all_files: dict, new_numbers: dict, new_names: dict | None = None) -> int:
+    """
+    Give each piSeed file in new_numbers ({old number: new number}) its new
+    number, and its new name from new_names, and renumber the germ files to
+    match, as one journaled transaction. Returns the number of files renamed.
+    """
+    new_names = new_names or {}
+    journal = PiRenameJournal(getReorderJournalFile(seeds_dir))
+    seedRenames = {}
+    for old_num, new_num in new_numbers.items():
+        file_info = all_files[old_num]
+        new_name = f"piSeed{new_num:03d}_{new_names.get(old_num, file_info['name'])}.pi"
+        journal.addRename(file_info['path'], seeds_dir / new_name)
+        seedRenames[file_info['full_name']] = new_name
+        printIt(f"Renamed {file_info['full_name']} -> {new_name}", label.DEBUG)
+    for file_info in all_files.values():
+        file_info['germTitles'] = getSeedGermTitles(file_info['path'])
+    germRenames = planGermRenames(all_files, new_numbers)
+    for oldPath, newPath in germRenames:
+        journal.addRename(oldPath, newPath)
+        printIt(f"Renamed {oldPath.name} -> {newPath.name}", label.DEBUG)
+    manifest = planManifest(seedRenames, germRenames)
+    if manifest:
+        journal.addJsonFile(*manifest)
+    renameCount = journal.apply()
+    if germRenames:
+        printIt(f"Renumbered {len(germRenames)} germ files", label.INFO)
+    return renameCount
+
 def moveBackwards(seeds_dir: Path, all_files: dict, source_num: int, target_num: int, source_name: str, target_name: str):
     """
     Move a file backwards in the sequence (higher number to lower number)
@@ -178,45 +310,11 @@ def moveBackwards(seeds_dir: Path, all_files: dict, source_num: int, target_num:
     """
     printIt(f"Moving backwards: {source_num} -> {target_num}", label.DEBUG)
 
-    # Create a temporary directory for safe operations
-    temp_dir = seeds_dir / "temp_reorder"
-    temp_dir.mkdir(exist_ok=True)
-
-    try:
-        # Step 1: Move source file to temp location
-        source_file = all_files[source_num]['path']
-        temp_source = temp_dir / f"temp_source_{source_name}.pi"
-        shutil.move(str(source_file), str(temp_source))
-        printIt(f"Moved {source_file.name} to temporary location", label.DEBUG)
-
-        # Step 2: Shift files from target_num to source_num-1 up by 1
-        files_to_shift = []
-        for num in range(target_num, source_num):
-            if num in all_files:
-                files_to_shift.append((num, all_files[num]))
-
-        # Sort in reverse order to avoid conflicts
-        files_to_shift.sort(reverse=True)
-
-        for old_num, file_info in files_to_shift:
-            new_num = old_num + 1
-            old_path = file_info['path']
-            new_name = f"piSeed{new_num:03d}_{file_info['name']}.pi"
-            new_path = seeds_dir / new_name
-
-            shutil.move(str(old_path), str(new_path))
-            printIt(f"Renamed {old_path.name} -> {new_name}", label.DEBUG)
-
-        # Step 3: Move source file to target position
-        final_name = f"piSeed{target_num:03d}_{target_name}.pi"
-        final_path = seeds_dir / final_name
-        shutil.move(str(temp_source), str(final_path))
-        printIt(f"Moved source file to {final_name}", label.INFO)
-
-    finally:
-        # Clean up temp directory
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+    # Shift files from target_num to source_num-1 up by 1, source file to target position
+    new_numbers = {num: num + 1 for num in range(target_num, source_num) if num in all_files}
+    new_numbers[source_num] = target_num
+    renumberSeeds(seeds_dir, all_files, new_numbers, {source_num: target_name})
+    printIt(f"Moved source file to piSeed{target_num:03d}_{target_name}.pi", label.INFO)
 
 def moveForwards(seeds_dir: Path, all_files: dict, source_num: int, target_num: int, source_name: str, target_name: str):
     """
@@ -225,45 +323,11 @@ def moveForwards(seeds_dir: Path, all_files: dict, source_num: int, target_num:
     """
     printIt(f"Moving forwards: {source_num} -> {target_num}", label.DEBUG)
 
-    # Create a temporary directory for safe operations
-    temp_dir = seeds_dir / "temp_reorder"
-    temp_dir.mkdir(exist_ok=True)
-
-    try:
-        # Step 1: Move source file to temp location
-        source_file = all_files[source_num]['path']
-        temp_source = temp_dir / f"temp_source_{source_name}.pi"
-        shutil.move(str(source_file), str(temp_source))
-        printIt(f"Moved {source_file.name} to temporary location", label.DEBUG)
-
-        # Step 2: Shift files from source_num+1 to target_num down by 1
-        files_to_shift = []
-        for num in range(source_num + 1, target_num + 1):
-            if num in all_files:
-                files_to_shift.append((num, all_files[num]))
-
-        # Sort in forward order to avoid conflicts
-        files_to_shift.sort()
-
-        for old_num, file_info in files_to_shift:
-            new_num = old_num - 1
-            old_path = file_info['path']
-            new_name = f"piSeed{new_num:03d}_{file_info['name']}.pi"
-            new_path = seeds_dir / new_name
-
-            shutil.move(str(old_path), str(new_path))
-            printIt(f"Renamed {old_path.name} -> {new_name}", label.DEBUG)
-
-        # Step 3: Move source file to target position
-        final_name = f"piSeed{target_num:03d}_{target_name}.pi"
-        final_path = seeds_dir / final_name
-        shutil.move(str(temp_source), str(final_path))
-        printIt(f"Moved source file to {final_name}", label.INFO)
-
-    finally:
-        # Clean up temp directory
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+    # Shift files from source_num+1 to target_num down by 1, source file to target position
+    new_numbers = {num: num - 1 for num in range(source_num + 1, target_num + 1) if num in all_files}
+    new_numbers[source_num] = target_num
+    renumberSeeds(seeds_dir, all_files, new_numbers, {source_num: target_name})
+    printIt(f"Moved source file to piSeed{target_num:03d}_{target_name}.pi", label.INFO)
 
 def showPreview(all_files: dict, source_num: int, target_num: int):
     """Show a preview of what changes will be made"""
@@ -380,39 +444,12 @@ def autoCompactSeeds(seeds_dir: Path, all_seed_files: dict) -> None:
     # Confirm with user (in a real implementation, you might want user confirmation)
     # For now, proceed automatically
 
-    # Create temporary directory for safe renaming
-    temp_dir = seeds_dir / ".temp_reorder"
-    temp_dir.mkdir(exist_ok=True)
-
     try:
-        # Step 1: Move all files to temporary directory
-        temp_files = []
-        for item in renaming_plan:
-            temp_file = temp_dir / item['old_path'].name
-            shutil.move(str(item['old_path']), str(temp_file))
-            temp_files.append((temp_file, item['new_path']))
-            printIt(f"Moved {item['old_path'].name} to temporary location", label.DEBUG)
-
-        # Step 2: Move files back with new names
-        for temp_file, new_path in temp_files:
-            shutil.move(str(temp_file), str(new_path))
-            printIt(f"Renamed to {new_path.name}", label.DEBUG)
-
-        # Clean up temporary directory
-        temp_dir.rmdir()
+        renumberSeeds(seeds_dir, all_seed_files,
+                      {item['old_number']: item['new_number'] for item in renaming_plan})
 
         printIt(f"Successfully compacted {len(renaming_plan)} piSeed files", label.INFO)
         printIt(f"piSeed files now numbered: {min_num:03d} to {min_num + len(existing_numbers) - 1:03d}", label.INFO)
 
-    except Exception as e:
-        printIt(f"Error during compacting: {e}", label.ERROR)
-        # Try to restore files from temp directory
-        try:
-            for temp_file in temp_dir.glob("*.pi"):
-                original_path = seeds_dir / temp_file.name
-                if not original_path.exists():
-                    shutil.move(str(temp_file), str(original_path))
-            temp_dir.rmdir()
-            printIt("Restored files from temporary directory", label.INFO)
-        except:
-            printIt(f"Manual cleanup may be needed in {temp_dir}", label.WARN)
+    except OSError as e:
+        reportReorderError(seeds_dir, e, "compacting")
@@ -4,16 +4,26 @@ from pathlib import Path
 from pigencode.classes.argParse import ArgParse
 from pigencode.defs.logIt import printIt, label
 from pigencode.defs.fileIO import getKeyItem, piGCDirs
+from pigencode.defs.piTrackingFile import readTrackedDirs, writeTrackedDirs, readOutputManifest, \
+    writeOutputManifest, outputManifestFileName
+from pigencode.defs.piGermManifest import getFileMD5
 
 # Global variable to track empty directories removed
 empty_dirs_removed = []
 
+# Tracking files are always removed, whatever their content
+tracking_file_names = (".piclass", ".pidefs")
+
 def rmGC(argParse: ArgParse):
     """
     Remove generated files to clean up for a fresh start.
     - piGerms (piGermDir): Removes entire directory (volatile temp files)
-    - piClasses (piClassGCDir): Recursively searches for .piclass tracking files and removes tracked files
-    - piDefs (piDefGCDir): Recursively searches for .pidefs tracking files and removes tracked files
+    - Generated files: Removes the files recorded by genCode in the root output
+      manifest, skipping files edited by hand since they were generated (--force
+      removes them too)
+    - piClasses/piDefs: Tracking files (.piclass/.pidefs) left by genCode runs that
+      predate the manifest are read from the tracked directory registry, or searched
+      for under piClassGCDir and piDefGCDir, and their tracked files removed
 
     This approach supports distributed file placement via fileDirectory and preserves user files.
     Empty directories are removed after cleanup, including parent directories that become empty.
@@ -24,6 +34,7 @@ def rmGC(argParse: ArgParse):
         removed_dirs = []
         not_found_items = []
         preserved_files = []
+        force = argParse.cmd_options.get('force', False)
 
         # Reset global tracking of empty directories
         global empty_dirs_removed
@@ -41,27 +52,35 @@ def rmGC(argParse: ArgParse):
         else:
             not_found_items.append(f"piGerms ({piGermsDir})")
 
-        # 2. Handle piClasses (piClassGCDir) - Recursive search for .piclass files
-        piClassesDir = Path(getKeyItem(piGCDirs[1]))
+        # 2. Handle files recorded in the output manifest
+        has_manifest = Path.cwd().joinpath(outputManifestFileName).is_file()
+        removed_count, edited_count, dirs_count = removeManifestFiles(force)
+        if removed_count > 0:
+            removed_files.append(f"{removed_count} generated files from {dirs_count} locations")
+        if edited_count > 0:
+            preserved_files.append(f"{edited_count} generated files edited by hand (--force removes them)")
+
+        # 3. Handle piClasses (piClassGCDir) - tracking files not covered by the manifest
+        piClassesDir = Path(getKeyItem(piGCDirs[2]))
         removed_count, preserved_count, tracking_files_found = removeTrackedFilesRecursive(
-            piClassesDir, ".piclass", "piClasses"
+            piClassesDir, ".piclass", "piClasses", not has_manifest
         )
         if removed_count > 0:
             removed_files.append(f"{removed_count} piClass files from {tracking_files_found} locations under {piClassesDir}")
         if preserved_count > 0:
             preserved_files.append(f"{preserved_count} user files preserved under {piClassesDir}")
 
-        # 3. Handle piDefs (piDefGCDir) - Recursive search for .pidefs files
-        piDefsDir = Path(getKeyItem(piGCDirs[1]))
+        # 4. Handle piDefs (piDefGCDir) - tracking files not covered by the manifest
+        piDefsDir = Path(getKeyItem(piGCDirs[3]))
         removed_count, preserved_count, tracking_files_found = removeTrackedFilesRecursive(
-            piDefsDir, ".pidefs", "piDefs"
+            piDefsDir, ".pidefs", "piDefs", not has_manifest
         )
         if removed_count > 0:
             removed_files.append(f"{removed_count} piDef files from {tracking_files_found} locations under {piDefsDir}")
         if preserved_count > 0:
             preserved_files.append(f"{preserved_count} user files preserved under {piDefsDir}")
 
-        # 4. Handle piSeeds (piSeedsDir) - Remove entire directory (volatile)
+        # 5. Handle piSeeds (piSeedsDir) - Remove entire directory (volatile)
         piSeedsDir = Path(getKeyItem(piGCDirs[0]))
         if piSeedsDir.exists() and piSeedsDir.is_dir():
             try:
@@ -110,16 +129,67 @@ def rmGC(argParse: ArgParse):
         printIt(f"Error in rmGC command: {e}", label.ERROR)
 
 
-def removeTrackedFilesRecursive(rootDirectory: Path, trackingFileName: str, displayName: str) -> tuple:
+def removeManifestFiles(force=False) -> tuple:
+    """
+    Remove the generated files and tracking files recorded in the root output
+    manifest. Only the recorded paths are visited; a file whose md5 no longer
+    matches the one recorded by genCode was edited by hand and is kept (and
+    stays in the manifest) unless force is set. Directories left empty are
+    removed afterwards, deepest first.
+
+    Returns:
+        tuple: (removed_count, edited_count, directories_count)
+    """
+    output_files = readOutputManifest()
+    if not output_files:
+        return 0, 0, 0
+
+    removed_count = 0
+    missing_count = 0
+    edited_files = {}
+    output_dirs = set()
+    for output_file, output_md5 in output_files.items():
+        file_path = Path(output_file)
+        file_md5 = getFileMD5(output_file)
+        if not file_md5:
+            missing_count += 1
+            continue
+        if file_md5 != output_md5 and not force and file_path.name not in tracking_file_names:
+            edited_files[output_file] = output_md5
+            printIt(f"Preserved file edited by hand: {file_path}", label.WARN)
+            continue
+        try:
+            file_path.unlink()
+            if file_path.name not in tracking_file_names:
+                removed_count += 1
+            output_dirs.add(file_path.parent)
+        except OSError as e:
+            edited_files[output_file] = output_md5
+            printIt(f"Error removing file {file_path}: {e}", label.ERROR)
+
+    if missing_count > 0:
+        printIt(f"{missing_count} recorded files were already removed", label.INFO)
+    writeOutputManifest(edited_files)
+
+    for directory in sorted(output_dirs, key=lambda d: len(d.absolute().parts), reverse=True):
+        check_and_remove_directory(directory)
+
+    return removed_count, len(edited_files), len(output_dirs)
+
+
+def removeTrackedFilesRecursive(rootDirectory: Path, trackingFileName: str, displayName: str,
+                                reportUntracked=True) -> tuple:
     """
-    Recursively search for tracking files and remove tracked files throughout directory tree.
-    If no tracking files are found in the configured directory, expand search to find
-    files placed via custom fileDirectory paths.
+    Remove the files listed by tracking files that genCode left outside the output
+    manifest (runs that predate it). When genCode has written the root registry of
+    tracked directories, only those directories are visited. Otherwise tracking
+    files are searched for under the configured directory.
 
     Args:
         rootDirectory: Root directory to search recursively
         trackingFileName: Name of tracking file (.piclass or .pidefs)
         displayName: Display name for logging
+        reportUntracked: Report the Python files kept when no tracking file is found
 
     Returns:
         tuple: (total_removed_count, total_preserved_count, tracking_files_found)
@@ -130,33 +200,23 @@ def removeTrackedFilesRecursive(rootDirectory: Path, trackingFileName: str, disp
 
     tracking_files = []
 
-    # First, try to find tracking files in the configured directory (if it exists)
-    if rootDirectory.exists():
+    # Use the registry of tracked directories when there is one
+    tracked_dirs = readTrackedDirs()
+    if tracked_dirs is not None:
+        for tracked_dir in tracked_dirs.get(trackingFileName, []):
+            tracking_file = Path(tracked_dir) / trackingFileName
+            if tracking_file.is_file():
+                tracking_files.append(tracking_file)
+        tracked_dirs[trackingFileName] = []
+        writeTrackedDirs(tracked_dirs)
+
+    # Otherwise search the configured directory (if it exists)
+    elif rootDirectory.exists():
         tracking_files = list(rootDirectory.rglob(trackingFileName))
-    else:
-        pass
-
-    # If no tracking files found in configured directory, expand search scope
-    if not tracking_files:
-        # Search from current working directory to catch custom fileDirectory placements
-        expanded_search_root = Path.cwd()
-
-        # Find all tracking files of this type in the entire project
-        all_tracking_files = list(expanded_search_root.rglob(trackingFileName))
-
-        # Filter to only include tracking files that are relevant to this file type
-        # by checking if they're in directories that could contain the expected files
-        for tracking_file in all_tracking_files:
-            # Skip tracking files that are clearly in the wrong configured directory
-            # (e.g., don't process .piclass files when looking for piDef files)
-            if trackingFileName == ".pidefs" and "piClasses" in str(tracking_file):
-                continue
-            if trackingFileName == ".piclass" and "piDefs" in str(tracking_file):
-                continue
-
-            tracking_files.append(tracking_file)
 
     if not tracking_files:
+        if not reportUntracked:
+            return 0, 0, 0
         # No tracking files found anywhere
         if rootDirectory.exists():
             # Count all Python files as preserved user files
@@ -166,7 +226,7 @@ def removeTrackedFilesRecursive(rootDirectory: Path, trackingFileName: str, disp
                 printIt(f"No tracking files found in {displayName} ({rootDirectory})", label.INFO)
                 printIt(f"Preserved {total_preserved_count} existing Python files", label.INFO)
         else:
-            printIt(f"No tracking files found for {displayName} anywhere in project", label.INFO)
+            printIt(f"No tracking files found for {displayName}", label.INFO)
         return 0, total_preserved_count, 0
 
     tracking_files_found = len(tracking_files)
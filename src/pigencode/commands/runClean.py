@@ -6,6 +6,7 @@ from .syncCode import syncDirectory
 from .germSeed import germAllSeedFiles
 from .genCode import genCodeFile
 from .fileDiff import compare_python_files
+from ..defs.piSyncCode.piSyncPythonClassToSeed import checkSyncRoundTrip
 
 import black
 from black import FileMode
@@ -23,6 +24,7 @@ def runClean(argParse):
     germAllSeedFiles()
     savedCodeFiles = genCodeFile()
     #print(dumps(savedCodeFiles,indent=2))
+    checkSyncRoundTrip(savedCodeFiles.values())
 
     for file_path in savedCodeFiles.values():
         newFileName: str = file_path
@@ -1,5 +1,5 @@
 from pigencode.defs.logIt import printIt, label, cStr, color
-from pigencode.defs.fileIO import rcFileName, setKeyItem, readJson
+from pigencode.defs.fileIO import rcFileName, setKeyItem, readAllRC
 from json import dumps
 
 def setDir(argParse):
@@ -7,7 +7,7 @@ def setDir(argParse):
     theArgs = args.arguments
     lenArgs = len(theArgs)
     fileName = str(rcFileName)
-    rcJson = readJson(fileName)
+    rcJson = readAllRC()
     rcKeys = list(rcJson.keys())
     if lenArgs == 0:
         printIt(f"Valid dirKey include:\n{dumps(rcJson,indent=2)}", label.INFO)
@@ -0,0 +1,136 @@
+import os, time, traceback
+from pathlib import Path
+from pigencode.classes.argParse import ArgParse
+from pigencode.defs.logIt import printIt, label
+from pigencode.defs.fileIO import getKeyItem, piGCDirs
+from pigencode.defs.getSeedPath import getSeedPath
+from pigencode.defs.piTrackingFile import readTrackedDirs, flushTrackingFiles
+from pigencode.defs.piWatcher import PiWatcher
+from pigencode.defs.piSyncCode.piSeedIndex import getPiSeedIndex, piSeedGCTypes
+from .germSeed import germAllSeedFiles, seedFilePattern
+from .genCode import getJobsOption
+from .reorderSeeds import recoverReorderJournal
+
+def watch(argParse: ArgParse):
+    '''
+        Keep running and react to each change: edited piSeed files are
+        germinated again and their code regenerated (as germSeed
+        --incremental does), and edited Python files in the class and def
+        output directories are synced back to their piSeed files.
+    '''
+    cmd_options = argParse.cmd_options
+    pollInterval = cmd_options.get('interval', 0.5)
+    try: pollInterval = float(pollInterval)
+    except (TypeError, ValueError):
+        printIt(f'--interval requires a number of seconds: {pollInterval}', label.WARN)
+        pollInterval = 0.5
+    jobs = getJobsOption(argParse)
+    syncOptions = {'stats': 'stats' in cmd_options}
+
+    seedPath = getSeedPath()
+    if not recoverReorderJournal(seedPath): return
+    seedDir = seedPath.absolute()
+    piWatcher = PiWatcher(pollInterval, usePolling='poll' in cmd_options)
+    addWatchDirs(piWatcher, seedPath)
+    getPiSeedIndex(seedPath)
+    printIt(f'Watching {len(piWatcher.watchDirs)} directories ({piWatcher.mode}). Press Ctrl-C to stop.', label.INFO)
+    try:
+        while True:
+            changedPaths = piWatcher.wait()
+            seedFiles = []
+            codeFiles = []
+            for changedPath in sorted(changedPaths):
+                changedFile = Path(changedPath)
+                if changedFile.parent == seedDir:
+                    if seedFilePattern.match(changedFile.name):
+                        seedFiles.append(changedPath)
+                elif changedFile.suffix == '.py' and changedFile.is_file():
+                    codeFiles.append(getCwdRelativePath(changedFile))
+            startTime = time.perf_counter()
+            # files this round writes; edits made meanwhile are left for the next round
+            writeFiles = []
+            if seedFiles:
+                # code files rewritten by genCode are not synced back
+                codeStats = {codeFile: getFileStat(codeFile) for codeFile in codeFiles}
+                for seedFile in seedFiles:
+                    printIt(f'changed: {Path(seedFile).name}', label.UPDATE)
+                runWatchAction(germAllSeedFiles, True, True, jobs, writeFiles)
+                codeFiles = [codeFile for codeFile in codeFiles if getFileStat(codeFile) == codeStats[codeFile]]
+            for codeFile in codeFiles:
+                printIt(f'changed: {codeFile}', label.UPDATE)
+                seedFile = runWatchAction(syncSingleFile, codeFile, dict(syncOptions))
+                if seedFile: writeFiles.append(str(seedFile))
+            if seedFiles or codeFiles:
+                flushTrackingFiles()
+                printIt(f'done in {int((time.perf_counter() - startTime) * 1000)}ms', label.INFO)
+            addWatchDirs(piWatcher, seedPath)
+            piWatcher.markSeen(writeFiles)
+    except KeyboardInterrupt:
+        print()
+        printIt('watch stopped', label.INFO)
+    finally:
+        piWatcher.close()
+
+def addWatchDirs(piWatcher: PiWatcher, seedPath: Path):
+    piWatcher.addDir(seedPath)
+    piWatcher.addDir(getKeyItem(piGCDirs[2]))
+    piWatcher.addDir(getKeyItem(piGCDirs[3]))
+    # directories genCode placed files in through fileDirectory
+    for trackedDirs in (readTrackedDirs() or {}).values():
+        for trackedDir in trackedDirs:
+            piWatcher.addDir(trackedDir)
+
+def getCwdRelativePath(filePath: Path) -> str:
+    # piSeed fileDirectory values are relative to the cwd
+    try:
+        return str(filePath.relative_to(Path.cwd()))
+    except ValueError:
+        return str(filePath)
+
+def getFileStat(fileName: str) -> tuple[int, int] | None:
+    try:
+        fileStat = os.stat(fileName)
+    except OSError:
+        return None
+    return (fileStat.st_mtime_ns, fileStat.st_size)
+
+def findCodeSeedFile(codeFile: str) -> tuple[str, Path | None]:
+    '''piSeed type and file of the seed generating codeFile, found by its
+       name and fileDirectory in the seed index.'''
+    codePath = Path(codeFile)
+    piSeedIndex = getPiSeedIndex(getSeedPath())
+    # piDefGC seeds keep the quotes of their fileDirectory in the index
+    for fileDirectory in (str(codePath.parent), f"'{codePath.parent}'"):
+        for piSeedType in piSeedGCTypes:
+            seedFile = piSeedIndex.findSeedFile(piSeedType, codePath.stem, fileDirectory)
+            if seedFile: return piSeedType, seedFile
+    return "", None
+
+def syncSingleFile(fileName: str, options: dict) -> Path | None:
+    '''Write an edited python file back to the piSeed file generating it.
+       watch never creates piSeed files: a file without one is skipped.'''
+    piSeedType, seedFile = findCodeSeedFile(fileName)
+    if not seedFile:
+        printIt(f'{fileName}: no piSeed file generates it, not synced', label.WARN)
+        return None
+    if options.get('stats'):
+        printIt(f'{fileName}: {piSeedType} piSeed {seedFile.name}', label.INFO)
+    # imported on first use: loading syncCode slows the germinate-only case
+    if piSeedType == "piDefGC":
+        from pigencode.defs.piSyncCode.piSyncPythonDefToSeed import createNewPiDefGCSeedFile as syncSeedFile
+    elif piSeedType == "piGenClass":
+        from pigencode.defs.piSyncCode.piSyncPythonGenClassToSeed import createNewPiGenClassSeedFile as syncSeedFile
+    else:
+        from pigencode.defs.piSyncCode.piSyncPythonClassToSeed import createNewPiClassGCSeedFile as syncSeedFile
+    codePath = Path(fileName)
+    # rewrites the existing seed file, as syncCode does
+    return syncSeedFile(codePath.stem, codePath, seedFile, str(codePath.parent))
+
+def runWatchAction(action, *args):
+    '''Run a germinate or sync step and return its result; failures are
+       reported, return None and watching continues.'''
+    try:
+        return action(*args)
+    except (Exception, SystemExit) as e:
+        tb_str = ''.join(traceback.format_exception(None, e, e.__traceback__))
+        printIt(f'{action.__name__}:\n{tb_str}', label.ERROR)
@@ -1,8 +1,11 @@
+import os, atexit
 from json import load, loads, dump, JSONDecodeError
 from traceback import format_exception
 from pathlib import Path
 import difflib
 from ..defs.logIt import printIt, label, logIt, cStr, color
+from .piProfile import profileDef, addBytesRead, addBytesWritten
+from .piJsonCodec import dumpsJson, loadsJson, germFormats
 
 cswPath = Path.cwd()
 rcFileName = Path.cwd()
@@ -21,9 +24,74 @@ piGCDirs = list(piGenCodeDirs.keys())
 piIndexerTypes_S = ["users", "realms", "domains", "subjects"]
 piIndexerTypes = ["user", "realm", "domain", "subject"]
 
+# RC values are loaded once per process and re-read only when the rc file's
+# (mtime, size) changes; changes are written back in one atomic flush at exit.
+_rcCache: dict = {}
+_rcStat: tuple | None = None
+_rcLoaded = False
+_rcPending: dict = {}
+_rcReplaced = False
+_rcDeleted = object()
+
+def _rcFileStat() -> tuple | None:
+    try:
+        rcStat = rcFileName.stat()
+        return (rcStat.st_mtime_ns, rcStat.st_size)
+    except FileNotFoundError:
+        return None
+
+def _loadRC():
+    global _rcCache, _rcStat, _rcLoaded
+    chkStat = _rcFileStat()
+    if _rcLoaded and chkStat == _rcStat:
+        return
+    rawRC = {}
+    if chkStat and not _rcReplaced:
+        try:
+            with open(rcFileName, 'r') as rf:
+                rawRC = load(rf)
+        except (JSONDecodeError, OSError):
+            rawRC = {}
+    # keep values set in this process that have not been flushed yet
+    for rcName, rcValue in _rcPending.items():
+        if rcValue is _rcDeleted: rawRC.pop(rcName, None)
+        else: rawRC[rcName] = rcValue
+    _rcCache = rawRC
+    _rcStat = chkStat
+    _rcLoaded = True
+
+def _setRC(rcName: str, rcValue):
+    _loadRC()
+    if rcValue is _rcDeleted: _rcCache.pop(rcName, None)
+    else: _rcCache[rcName] = rcValue
+    _rcPending[rcName] = rcValue
+
+def flushRC():
+    '''Write pending rc changes to rcFileName (temp file + rename).'''
+    global _rcStat, _rcReplaced
+    if not _rcPending and not _rcReplaced:
+        return
+    _loadRC()
+    tmpFileName = rcFileName.with_name(f'{rcFileName.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmpFileName, 'w') as wf:
+            dump(_rcCache, wf, indent=2)
+        os.replace(tmpFileName, rcFileName)
+        _rcPending.clear()
+        _rcReplaced = False
+        _rcStat = _rcFileStat()
+    except OSError as e:
+        printIt(f'flushRC: {rcFileName}: {e}', label.ERROR)
+        if tmpFileName.is_file(): tmpFileName.unlink()
+
+atexit.register(flushRC)
+
 def resetPiRC():
-    if rcFileName.is_file():
-        rcFileName.unlink()
+    global _rcCache, _rcReplaced, _rcLoaded
+    _rcPending.clear()
+    _rcCache = {}
+    _rcReplaced = True
+    _rcLoaded = True
     for piDir, piDirPathStr in piGenCodeDirs.items():
         writeRC(piDir, piDirPathStr)
 
@@ -40,60 +108,53 @@ def setKeyItem(key, Value):
     writeRC(key, Value)
 
 def delKey(key):
-    global rcFileName
-    if rcFileName.is_file():
-        with open(rcFileName, 'r') as rf:
-            rawRC = load(rf)
-        del rawRC[key]
-    else:
-        rawRC = {}
-    #print(rawRC)
-    with open(rcFileName, 'w') as wf:
-        dump(rawRC, wf, indent=2)
+    _loadRC()
+    if key in _rcCache:
+        _setRC(key, _rcDeleted)
+
+def readAllRC() -> dict:
+    _loadRC()
+    return dict(_rcCache)
 
 def readRC(rcName: str) -> (int | float | str | list | dict):
-    global rcFileName
-    if rcFileName.is_file():
-        # print(rcFileName)
-        try:
-            with open(rcFileName, 'r') as rf:
-                rawRcJson = load(rf)
-                rcValue = rawRcJson[rcName]
-        except:
-            resetPiRC()
-            rcValue = piGenCodeDirs[rcName]
+    _loadRC()
+    if rcName in _rcCache:
+        rcValue = _rcCache[rcName]
     else:
         resetPiRC()
         rcValue = piGenCodeDirs[rcName]
     return rcValue
 
 def writeRC(rcName: str, rcValue: (int | float | str | list | dict)):
-    global rcFileName
-    if rcFileName.is_file():
-        with open(rcFileName, 'r') as rf:
-            rawRC = load(rf)
-    else:
-        rawRC = {}
-    rawRC[rcName] = rcValue
-    # print(rawRC)
-    with open(rcFileName, 'w') as wf:
-        dump(rawRC, wf, indent=2)
+    _setRC(rcName, rcValue)
+
+def getGermFormat() -> str:
+    '''Format germ files are written in, from the piGermFormat rc key.'''
+    _loadRC()
+    germFormat = _rcCache.get("piGermFormat", germFormats[0])
+    return germFormat if germFormat in germFormats else germFormats[0]
 
+@profileDef("read json")
 def readJson(fileName: str, verbose=True) -> dict:
     rtnDict = {}
     try:
-        with open(fileName, 'r') as rf:
-            rtnDict = load(rf)
+        with open(fileName, 'rb') as rf:
+            content = rf.read()
+        addBytesRead(len(content))
+        rtnDict = loadsJson(content)
     except FileNotFoundError:
         if verbose: printIt("pi|readJson -", fileName,label.FileNotFound)
     except JSONDecodeError as e:
         tb_str = ''.join(format_exception(None, e, e.__traceback__))
     return rtnDict
+@profileDef("write json")
 def writeJson(fileName: str, aDict: dict, verbose=True) -> bool:
     rtnBool = False
     try:
-        with open(fileName, 'w') as wf:
-            dump(aDict, wf, indent=2)
+        content = dumpsJson(aDict, getGermFormat() == "compact")
+        with open(fileName, 'wb') as wf:
+            wf.write(content)
+        addBytesWritten(len(content))
         rtnBool = True
     except FileNotFoundError:
         if verbose: printIt("pi|writeJson -", fileName,label.FileNotFound)
@@ -1,7 +1,14 @@
 from pathlib import Path
 import os
+import hashlib
+from json import load, dump, JSONDecodeError
 from ..defs.fileIO import getKeyItem, setKeyItem, piGCDirs
 
+# md5 of each base seed file last written by writeBasePiSeeds, kept in piSeedsDir
+baseSeedsFileName = ".piBaseSeeds.json"
+# seed directories whose base seeds were already ensured in this process
+ensuredSeedPaths: set[str] = set()
+
 # def getSeedPath() -> Path:
 #     seedPath = Path(getKeyItem(piGCDirs[0]))
 #     if not seedPath.exists():
@@ -16,17 +23,15 @@ def getSeedPath() -> Path:
     seedPath = Path(getKeyItem(piGCDirs[0]))
 
     if seedPath.is_dir():
-        writeBasePiSeeds(seedPath)
+        if str(seedPath) not in ensuredSeedPaths:
+            writeBasePiSeeds(seedPath)
     else:
         seedPath.mkdir(parents=True, exist_ok=True)
         writeBasePiSeeds(seedPath)
     return seedPath
 
-def writeBasePiSeeds(piSeedPath: Path):
-    """Write the base piSeed files to the piSeeds directory"""
-
-    piSeeds = {
-        "piStruct_piProlog": """# piStruct_piProlog
+basePiSeeds = {
+    "piStruct_piProlog": """# piStruct_piProlog
 piStruct piProlog 'Defines a data structure for piProlog.\\nA dictionary defining the structure of the piProlog added to the top of all piPi. piStructS00(title, version, author, copyright).'
 piStructS00 title 'A string value for storing the name of any system used to process pis.'
 piStructS00 version 'A string value for storing th e version of the system used to process pis.'
@@ -38,7 +43,7 @@ piValue piProlog.version '0.0.1'
 piValue piProlog.author 'martin@pidev.com'
 piValue piProlog.copyright '2023 Pi Development'
 """,
-        "piStruct_piBase": """# piStruct_piBase
+    "piStruct_piBase": """# piStruct_piBase
 piStruct piBase 'Defines a data structure for pi.\\nA dictionary for holding pi topic information.'
 piStructS00 piType 'piStruct child of pi storing a string type name of the pi.'
 piStructS00 piTitle 'piStruct child of pi storing a string title of the pi.'
@@ -48,14 +53,14 @@ piValue piBase.piType pi
 piValue piBase.piTitle pi
 piValue piBase.piSD 'Smallest particle of Pertinent Information, uesed tdefine base pis.'
 """,
-        "piStruct_piTouch": """# piStruct_piTouch
+    "piStruct_piTouch": """# piStruct_piTouch
 piStruct piTouch 'Defines a data structure for piTouch.\\nA dictionary of pi datetime stamp.'
 piStructS00 piCreationDate 'piStruct child of piTouch storing datetime stamp when a pi is created.'
 piStructS00 piModificationDate 'piStruct child of piTouch storing datetime stamp when a pi is modified.'
 piStructS00 piTouchDate 'piStruct child of piTouch storing datetime stamp when a pi is read.'
 piStructI00 piTouches 'Incrimenting integer counting the number of times the pi is tuched'
 """,
-        "piStruct_piIndexer": """# piStruct_piIndexer
+    "piStruct_piIndexer": """# piStruct_piIndexer
 piStruct piIndexer 'Defines a data structure for piIndexer.\\nA dictionary for indexing pis, 1) user, 2) realm, 3) domain, 4) subject and 5) type used to catalog all pis.'
 piStructS00 piMD5 'piStruct child of piIndexer storing a unique piIndexer signiture = md5(piUser+piRealm+piDomain+piSubject),'
 piStructS00 piUser 'piStruct child of piIndexer storing a designated user of the pi.'
@@ -68,12 +73,12 @@ piValue piIndexer.piRealm 'TBD'
 piValue piIndexer.piDomain 'TBD'
 piValue piIndexer.piSubject 'TBD'
 """,
-        "piStruct_piInfluence": """# piStruct_piInfluence
+    "piStruct_piInfluence": """# piStruct_piInfluence
 piStruct piInfluence 'Defines a data structure for piInfluence.\\nA dictionary of lists that map object used fot organizing pis,'
 piStructL00 piPrecedent 'piStruct child of piInfluence storing a list of piID strings corresponding to the symbolic links pointing to pis that preceded the current pi.'
 piStructL00 piDescendent 'piStruct child of piInfluence storing a list of piID strings corresponding to the symbolic links pointing to pis that sucdeed the current pi.'
 """,
-        "piStruct_pi": """# piStruct_pi
+    "piStruct_pi": """# piStruct_pi
 piStruct pi 'Define a pi data structure.\\nA dictionary for holding pi topic information.'
 piStructC00 piProlog piProlog
 piStructC00 piBase piBase
@@ -87,17 +92,17 @@ piValue pi.piProlog piProlog.
 piValue pi.piBase piBase.
 piValue pi.piIndexer piIndexer.
 """,
-        "piStruct_argument": """# piStruct_argument
+    "piStruct_argument": """# piStruct_argument
 piStruct argument 'Argument definition dict.'
 piStructS00 type 'Defines the arument data type (str|int|dict|list)'
 piStructS00 value 'Defines the arument defalut value. Starts as an str, will be programicly cast to the specified data type.'
 """,
-        "piStruct_fromImports": """# piStruct_fromImports
+    "piStruct_fromImports": """# piStruct_fromImports
 piStruct fromImports 'Defines a data structure for fromImports.'
 piStructS00 from 'Defines the from package name defalut as a python form path string.'
 piStructS00 import 'Defines the import object names as a comma dilinated string of object names.'
 """,
-        "piStruct_piClassGC": """# piStruct_piClassGC
+    "piStruct_piClassGC": """# piStruct_piClassGC
 piStruct piClassGC 'Data structure for generating code from a piSeed text file.'
 piStructC00 pi piClassGC.
 piStructA00 piClassGC.piBody 'Add elements to saved structure dict. At specifes the depth of this dict.'
@@ -118,12 +123,13 @@ piStructL02 preSuperInitCode 'Replace the standard __init__ code with lines of c
 piStructL02 postSuperInitCode 'Add  __init__ code lines after the supper coed of code listed as seperate list items.'
 piStructL02 initAppendCode 'Append the standard __init__ code with lines of code listed as seperate list items.'
 piStructS02 genProps 'Flag to generate class properies for each class argument.'
+piStructS02 slots 'Flag to declare __slots__ for the attributes the class assigns, leaving out those its inherited classes declare.'
 piStructL02 strCode 'Replace the standard __str__ code with lines of code listed as seperate list items.'
 piStructL02 jsonCode 'Replace the piGen json code with lines of code listed as seperate list items.'
 piStructD02 classDefCode 'Zero or more def function are defned in this dict.'
 piStructL02 globalCode 'lines of code to append after the lines of code defining the piClass.\\nEach line of code is a seperate list items.'
 """,
-        "piStruct_piDefGC": """# piStruct_piDefGC
+    "piStruct_piDefGC": """# piStruct_piDefGC
 piStruct piDefGC 'Data structure for generating Python function definition files from piSeed text files.'
 piStructC00 pi piDefGC.
 piStructA00 piDefGC.piBody 'Add elements to saved structure dict. At specifies the depth of this dict.'
@@ -159,7 +165,7 @@ piValue piDefGC.piBody:piDefGC:constants []
 piValue piDefGC.piBody:piDefGC:mlConstants {}
 piValue piDefGC.piBody:piDefGC:globalCode []
 """,
-        "piStruct_piGenClass": """# piStruct_piGenClass
+    "piStruct_piGenClass": """# piStruct_piGenClass
 piStruct piGenClass 'Data structure for generating multiple classes from a single piSeed file, similar to piDefGC for functions.'
 piStructC00 pi piGenClass.
 piStructA00 piGenClass.piBody 'Add elements to saved structure dict for class generation.'
@@ -176,11 +182,47 @@ piStructL02 globalCode 'List of global code lines at the end of the file.'
 """
 }
 
+def _getMD5(content: bytes) -> str:
+    return hashlib.md5(content).hexdigest()
+
+def _readBaseSeedMD5s(baseSeedsFile: Path) -> dict[str, str]:
+    try:
+        with open(baseSeedsFile, 'r') as rf:
+            return load(rf)
+    except (FileNotFoundError, JSONDecodeError, OSError):
+        return {}
+
+def writeBasePiSeeds(piSeedPath: Path):
+    """Write the base piSeed files to the piSeeds directory.
+       A file is written when it is missing, or when it still holds the content
+       last written here and that content is out of date. Files edited by hand
+       are left alone."""
+    baseSeedsFile = piSeedPath.joinpath(baseSeedsFileName)
+    writtenMD5s = _readBaseSeedMD5s(baseSeedsFile)
+    baseSeedMD5s = {}
     fileID = 0
-    for key, value in piSeeds.items():
+    for key, value in basePiSeeds.items():
         fileName = f'piSeed{str(fileID).zfill(3)}_{key}.pi'
         filePath = piSeedPath.joinpath(fileName)
-        if not filePath.exists():
+        seedMD5 = _getMD5(value.encode())
+        try:
+            with open(filePath, 'rb') as rf:
+                fileMD5 = _getMD5(rf.read())
+        except FileNotFoundError:
+            fileMD5 = ""
+        if not fileMD5 or (fileMD5 != seedMD5 and fileMD5 == writtenMD5s.get(fileName)):
             with open(filePath, 'w') as fw:
                 fw.write(value)
+            fileMD5 = seedMD5
+        if fileMD5 == seedMD5:
+            baseSeedMD5s[fileName] = seedMD5
+        elif fileName in writtenMD5s:
+            baseSeedMD5s[fileName] = writtenMD5s[fileName]
         fileID += 1
+    if baseSeedMD5s != writtenMD5s:
+        try:
+            with open(baseSeedsFile, 'w') as wf:
+                dump(baseSeedMD5s, wf, indent=2)
+        except OSError:
+            pass
+    ensuredSeedPaths.add(str(piSeedPath))
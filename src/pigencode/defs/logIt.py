@@ -1,5 +1,4 @@
-import os, time
-from inspect import currentframe, getframeinfo
+import os, sys, time, atexit, threading
 
 # Class of different termianl styles
 class color():
@@ -83,29 +82,140 @@ class label():
     IncorectPiValuePath = "Incorect PiValue Path: "
 
 
+class PiLogSink():
+    '''
+        Buffered log file writer. Records are queued in memory and appended by
+        a background flusher thread; the file is opened on the first flush and
+        kept open. When the file grows past maxBytes it is rotated to
+        <logFile>.1 .. <logFile>.<backupCount>.
+    '''
+    flushInterval = 0.5     # seconds between background flushes
+    maxBytes = 5 * 1024 * 1024
+    backupCount = 3
+
+    def __init__(self, logFileName: str) -> None:
+        self.logFileName = logFileName
+        self.logFile = None
+        self.records: list[str] = []
+        self.lock = threading.Lock()
+
+    def write(self, record: str):
+        with self.lock:
+            self.records.append(record)
+        _startLogFlusher()
+
+    def flush(self):
+        with self.lock:
+            if not self.records: return
+            records = self.records
+            self.records = []
+            try:
+                if self.logFile is None:
+                    self.logFile = open(self.logFileName, "a")
+                self.logFile.write("".join(records))
+                self.logFile.flush()
+                if self.logFile.tell() > self.maxBytes:
+                    self._rotate()
+            except OSError as e:
+                print(f'{label.ERROR}Could not write log {self.logFileName}: {e}', file=sys.stderr)
+
+    def _rotate(self):
+        self.close()
+        for backupNum in range(self.backupCount - 1, 0, -1):
+            backupFileName = f"{self.logFileName}.{backupNum}"
+            if os.path.isfile(backupFileName):
+                os.replace(backupFileName, f"{self.logFileName}.{backupNum + 1}")
+        os.replace(self.logFileName, f"{self.logFileName}.1")
+
+    def close(self):
+        if self.logFile is not None:
+            self.logFile.close()
+            self.logFile = None
+
+logSinks: dict[str, PiLogSink] = {}
+logStartTime = time.perf_counter()
+logFlusher: threading.Thread | None = None
+logFlusherStop = threading.Event()
+
+def _getLogSink(logFileName: str) -> PiLogSink:
+    logFileName = os.path.abspath(logFileName)
+    logSink = logSinks.get(logFileName)
+    if logSink is None:
+        logSink = logSinks.setdefault(logFileName, PiLogSink(logFileName))
+    return logSink
+
+def _runLogFlusher():
+    while not logFlusherStop.wait(PiLogSink.flushInterval):
+        flushLogs()
+
+def _startLogFlusher():
+    global logFlusher
+    if logFlusher is None:
+        _registerLogFinalizer()
+        logFlusher = threading.Thread(target=_runLogFlusher, name="piLogFlusher", daemon=True)
+        logFlusher.start()
+
+def flushLogs():
+    '''Write every buffered log record.'''
+    for logSink in list(logSinks.values()):
+        logSink.flush()
+
+def _resetLogSinks():
+    # a forked child starts without the parent's records, open files or flusher thread
+    global logFlusher
+    for logSink in logSinks.values():
+        logSink.lock = threading.Lock()
+        logSink.records = []
+        logSink.logFile = None
+    logFlusher = None
+
+logFinalizerRegistered = False
+
+def _registerLogFinalizer():
+    # multiprocessing worker processes exit without running atexit; a
+    # multiprocessing finalizer flushes them (imported on first use to keep
+    # CLI startup light)
+    global logFinalizerRegistered
+    if not logFinalizerRegistered:
+        from multiprocessing import util as mpUtil
+        mpUtil.Finalize(None, flushLogs, exitpriority=100)
+        mpUtil.register_after_fork(PiLogSink, _reregisterLogFinalizer)
+        logFinalizerRegistered = True
+
+def _reregisterLogFinalizer(_):
+    # forked multiprocessing children clear the inherited finalizers
+    from multiprocessing import util as mpUtil
+    mpUtil.Finalize(None, flushLogs, exitpriority=100)
+
+# flush on normal exit, on exit() and uncaught exceptions
+atexit.register(flushLogs)
+os.register_at_fork(after_in_child=_resetLogSinks)
+
 # log function
 def logIt(*message, logFileName="piGenCode.log"):
-    # write log
+    # write log record: [time] [+elapsed ms] [level] [module] message
     now = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    elapsedMs = int((time.perf_counter() - logStartTime) * 1000)
+    callerFrame = sys._getframe(1)
+    moduleName = callerFrame.f_globals.get("__name__", "").rsplit(".", 1)[-1]
 
     prtStr = ""
+    level = "LOG"
     needClip = False
     if len(message) > 0:
         for mess in message:
             if mess == label.BLANK:
                 pass
             elif mess in color.l2cDict:
-                prtStr = mess + prtStr
+                level = mess.rstrip(": ")
             else:
                 needClip = True
                 prtStr += str(mess) + " "
         if needClip:
             prtStr = prtStr[:-1]
 
-    prtStr = "["+now+"] "+prtStr+"\n"
-
-    with open(logFileName, "a") as f:
-        f.write(prtStr)
+    prtStr = f"[{now}] [+{elapsedMs}ms] [{level}] [{moduleName}] {prtStr}\n"
+    _getLogSink(logFileName).write(prtStr)
 
 
 def printIt(*message, asStr: bool = False) -> str:
@@ -141,10 +251,14 @@ def cStr(inStr:str, cVal:str):
     return cVal + inStr + color.RESET
 
 def deleteLog(logFileName="piGenCode.log"):
+    logSink = logSinks.get(os.path.abspath(logFileName))
+    if logSink:
+        logSink.flush()
+        logSink.close()
     if os.path.isfile(logFileName): os.remove(logFileName)
 
 def getCodeFile():
-    cf = currentframe()
+    cf = sys._getframe()
     codeObj = ''
     if cf:
         if cf.f_back: codeObj = cf.f_back.f_code
@@ -156,7 +270,7 @@ def getCodeFile():
     return codeObjStr
 
 def getCodeLine():
-    cf = currentframe()
+    cf = sys._getframe()
     codeObj = None
     if cf:
         if cf.f_back:
@@ -0,0 +1,40 @@
+import os
+import hashlib
+import locale
+from .piGermManifest import getFileMD5
+from .piProfile import profileDef, addBytesWritten
+
+def _getFileMode(fileName: str) -> int:
+    try:
+        return os.stat(fileName).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+@profileDef("write code")
+def writeCodeFile(fileName, content: str, encoding: str | None = None) -> bool:
+    '''
+        Write content to fileName unless the file already holds the same
+        content (compared by md5). Writes go to a temp file in the same
+        directory that is renamed over fileName. Returns True when written.
+    '''
+    fileName = str(fileName)
+    contentBytes = content.encode(encoding or locale.getpreferredencoding(False))
+    if getFileMD5(fileName) == hashlib.md5(contentBytes).hexdigest():
+        return False
+    fileMode = _getFileMode(fileName)
+    fileDir, baseName = os.path.split(fileName)
+    tmpFileName = os.path.join(fileDir, f'.{baseName}.{os.getpid()}.tmp')
+    try:
+        tmpFd = os.open(tmpFileName, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, fileMode)
+        with os.fdopen(tmpFd, 'wb') as f:
+            f.write(contentBytes)
+        os.chmod(tmpFileName, fileMode)
+        os.replace(tmpFileName, fileName)
+    except BaseException:
+        if os.path.exists(tmpFileName):
+            os.remove(tmpFileName)
+        raise
+    addBytesWritten(len(contentBytes))
+    return True
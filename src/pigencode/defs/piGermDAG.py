@@ -0,0 +1,79 @@
+from re import compile as reCompile
+from pathlib import Path
+from ..classes.piSeeds import readSeedPis
+from .fileIO import getKeyItem
+
+# seed types that write numbered germ files; seeds of the same kind keep their
+# file order so file numbers come out as in a serial run.
+piNumberedGermTypes = ("piClassGC", "piDefGC", "piGenClass")
+piTokenRE = reCompile(r'\w+')
+piGermFileRE = reCompile(r'(piClassGC|piDefGC|piGenClass)[0-9]{3}_(.+)\.json')
+
+def getExistingGermTitles() -> set[tuple[str, str]]:
+    '''(germKind, piTitle) of every numbered germ file already on disk.'''
+    piGermDir = Path(getKeyItem("piGermDir"))
+    existingTitles = set()
+    for germDir in (piGermDir.joinpath("piClassGC"), piGermDir.joinpath(getKeyItem("piDefGCDir")),
+                    piGermDir.joinpath("piGenClass")):
+        if germDir.is_dir():
+            for germFile in germDir.iterdir():
+                fileMatch = piGermFileRE.match(germFile.name)
+                if fileMatch:
+                    existingTitles.add(fileMatch.groups())
+    return existingTitles
+
+class PiSeedScan():
+    '''
+        piStruct/piDefault titles a piSeed file may write (piStruct and
+        piValuesSetD lines), titles it may read (every word token in the file)
+        and the numbered germ files it produces.
+    '''
+    def __init__(self, seedFile: str) -> None:
+        self.seedFile = seedFile
+        self.writes: set[str] = set()
+        self.reads: set[str] = set()
+        self.germTitles: set[tuple[str, str]] = set()
+        for _, piType, piTitle, piSD in readSeedPis(seedFile):
+            if piType in ("piStruct", "piValuesSetD"):
+                self.writes.add(piTitle.split('.')[0])
+            for piText in (piType, piTitle, piSD):
+                self.reads.update(piTokenRE.findall(piText))
+            if piType in piNumberedGermTypes:
+                self.germTitles.add((piType, piTitle))
+        self.reads |= self.writes
+
+def buildSeedDAG(seedFiles: list[str]) -> dict[str, set[str]]:
+    '''
+        Return {seedFile: set of earlier seedFiles it must wait for}.
+        A seed waits for an earlier seed that writes a title it reads, that reads
+        a title it writes, or that adds a new germ file of the same numbered germ
+        kind (new files take the next free number). Reads include the reads of
+        the seeds that define the titles read, so nested piStruct clones are
+        ordered as well.
+    '''
+    seedScans = [PiSeedScan(seedFile) for seedFile in seedFiles]
+    # a germ title reuses its file number when its file exists and no other seed shares it
+    existingTitles = getExistingGermTitles()
+    germTitleCounts: dict[tuple[str, str], int] = {}
+    for seedScan in seedScans:
+        for germTitle in seedScan.germTitles:
+            germTitleCounts[germTitle] = germTitleCounts.get(germTitle, 0) + 1
+    seedDeps: dict[str, set[str]] = {}
+    lastGermKind: dict[str, str] = {}
+    for seedIndex, seedScan in enumerate(seedScans):
+        tokenReads = set(seedScan.reads)
+        for prevScan in seedScans[:seedIndex]:
+            if prevScan.writes & tokenReads:
+                seedScan.reads |= prevScan.reads
+        deps: set[str] = set()
+        for prevScan in seedScans[:seedIndex]:
+            if prevScan.writes & seedScan.reads or prevScan.reads & seedScan.writes:
+                deps.add(prevScan.seedFile)
+        newGermKinds = set(germKind for germKind, piTitle in seedScan.germTitles \
+            if (germKind, piTitle) not in existingTitles or germTitleCounts[(germKind, piTitle)] > 1)
+        for germKind in newGermKinds:
+            if germKind in lastGermKind:
+                deps.add(lastGermKind[germKind])
+            lastGermKind[germKind] = seedScan.seedFile
+        seedDeps[seedScan.seedFile] = deps
+    return seedDeps
@@ -0,0 +1,95 @@
+import hashlib
+from pathlib import Path
+from json import load, dump, JSONDecodeError
+from .logIt import printIt, logIt, label
+from .fileIO import getKeyItem, piGCDirs
+
+manifestFileName = ".piGermManifest.json"
+manifestVersion = 2
+
+def getFileMD5(fileName: str) -> str:
+    '''Return the md5 of a file's content, or "" when the file does not exist.'''
+    try:
+        with open(fileName, 'rb') as rf:
+            return hashlib.md5(rf.read()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+class PiGermManifest():
+    '''
+        Build manifest stored under piGermDir recording, for each piSeed file,
+        the md5 of its content, the piStruct/piDefault files it read (with the
+        md5 seen when read) and the germ JSON and .py files it produced.
+        A seed whose content and inputs are unchanged, and whose outputs still
+        exist, does not need to be germinated again.
+    '''
+    def __init__(self) -> None:
+        self.fileName = Path(getKeyItem(piGCDirs[1])).joinpath(manifestFileName)
+        self.seeds: dict[str, dict] = {}
+        self.changed = False
+        self._read()
+
+    def _read(self):
+        if self.fileName.is_file():
+            try:
+                with open(self.fileName, 'r') as rf:
+                    rawManifest = load(rf)
+                if rawManifest.get("version") == manifestVersion:
+                    self.seeds = rawManifest.get("seeds", {})
+            except (JSONDecodeError, OSError) as e:
+                logIt(f'Ignoring unreadable manifest {self.fileName}: {e}', label.WARN)
+                self.seeds = {}
+
+    def isSeedCurrent(self, seedFile: str) -> bool:
+        seedEntry = self.seeds.get(Path(seedFile).name)
+        if not seedEntry: return False
+        if seedEntry["seedMD5"] != getFileMD5(seedFile): return False
+        for inputFile, inputMD5 in seedEntry["inputs"].items():
+            if getFileMD5(inputFile) != inputMD5: return False
+        for outputFile in seedEntry["outputs"]:
+            if not Path(outputFile).is_file(): return False
+        return True
+
+    def getSeedOutputs(self, seedFile: str) -> list[str]:
+        seedEntry = self.seeds.get(Path(seedFile).name, {})
+        return seedEntry.get("outputs", [])
+
+    def getSeedClasses(self, seedFile: str) -> set[str]:
+        '''Base names of the piClassGC .py files the seed generates.'''
+        seedEntry = self.seeds.get(Path(seedFile).name, {})
+        return set(seedEntry.get("classes", []))
+
+    def inheritsFrom(self, seedFile: str, classNames: set[str]) -> bool:
+        '''True when a class of the seed inherits from one of classNames,
+           as its generated __init__ passes the parent's arguments on.'''
+        seedEntry = self.seeds.get(Path(seedFile).name, {})
+        return not classNames.isdisjoint(seedEntry.get("inherits", []))
+
+    def recordSeed(self, seedFile: str, inputFiles: dict[str, str], outputFiles: list[str],
+                   classNames: set[str] = set(), inheritNames: set[str] = set()):
+        self.seeds[Path(seedFile).name] = {
+            "seedMD5": getFileMD5(seedFile),
+            "inputs": inputFiles,
+            "outputs": sorted(set(str(outputFile) for outputFile in outputFiles)),
+            "classes": sorted(classNames),
+            "inherits": sorted(inheritNames)
+        }
+        self.changed = True
+
+    def pruneSeeds(self, seedFiles: list[str]):
+        '''Drop entries of seed files no longer present in piSeedsDir.'''
+        seedNames = set(Path(seedFile).name for seedFile in seedFiles)
+        for seedName in list(self.seeds.keys()):
+            if seedName not in seedNames:
+                del self.seeds[seedName]
+                self.changed = True
+
+    def save(self):
+        if not self.changed: return
+        self.fileName.parent.mkdir(mode=511, parents=True, exist_ok=True)
+        try:
+            with open(self.fileName, 'w') as wf:
+                dump({"version": manifestVersion, "seeds": self.seeds}, wf, indent=2)
+            self.changed = False
+        except OSError as e:
+            printIt(f'Could not write manifest {self.fileName}: {e}', label.ERROR)
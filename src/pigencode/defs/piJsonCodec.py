@@ -0,0 +1,71 @@
+from re import compile as reCompile
+from json import loads, dumps, JSONDecodeError
+try:
+    # optional: several times faster than the json module for germ files
+    import orjson
+except ImportError:
+    orjson = None
+
+# germ file formats, set with the piGermFormat rc key:
+#   indent  - 2 space indented JSON (default), for reading by hand
+#   compact - minified JSON, smaller and faster to write
+germFormats = ("indent", "compact")
+
+def getJsonBackend() -> str:
+    return "orjson" if orjson is not None else "json"
+
+# 20 digits may exceed 64 bits
+longNumberPattern = reCompile(rb'[0-9]{20}')
+
+# value types orjson writes exactly as the json module does; floats are not
+# (1e-07, NaN), nor types only orjson accepts (dataclasses, datetime)
+plainJsonTypes = (str, int, bool, type(None))
+
+def isPlainJson(aDict) -> bool:
+    '''True when aDict holds only dict, list and plainJsonTypes values.'''
+    values = [aDict]
+    while values:
+        value = values.pop()
+        valueType = type(value)
+        if valueType is dict:
+            for key in value:
+                if type(key) not in plainJsonTypes: return False
+            values.extend(value.values())
+        elif valueType is list or valueType is tuple:
+            values.extend(value)
+        elif valueType not in plainJsonTypes:
+            return False
+    return True
+
+def dumpsJson(aDict, compact: bool = False) -> bytes:
+    '''Serialize aDict as JSON bytes; indented with 2 spaces unless
+       compact. Indented output matches json.dump(indent=2) byte for byte,
+       so non-ASCII text stays \\u escaped; compact output is UTF-8.
+       orjson is used only for plain values (see isPlainJson) and, when
+       indented, ASCII output without DEL, which it does not escape; the
+       json module writes everything else, NaN and Infinity included.'''
+    if orjson is not None and isPlainJson(aDict):
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact: option |= orjson.OPT_INDENT_2
+        try:
+            content = orjson.dumps(aDict, option=option)
+            if compact or (content.isascii() and b'\x7f' not in content): return content
+        except TypeError:
+            pass
+    if compact:
+        return dumps(aDict, separators=(',', ':')).encode()
+    return dumps(aDict, indent=2).encode()
+
+def loadsJson(content: bytes | str):
+    '''Parse JSON in either germ format. Raises json.JSONDecodeError.
+       Content orjson reads differently, NaN and Infinity (rejected) or
+       integers too long for 64 bits (read as floats), is parsed with the
+       json module.'''
+    if orjson is not None:
+        if isinstance(content, str): content = content.encode()
+        if not longNumberPattern.search(content):
+            try:
+                return orjson.loads(content)
+            except JSONDecodeError:
+                pass
+    return loads(content)
@@ -1,30 +1,41 @@
+import os
 from os import makedirs
 import datetime
+import pickle
 from traceback import format_exception
 from pathlib import Path
-from json import load, loads, dump, dumps, JSONDecodeError
+from json import loads, dumps, JSONDecodeError
 from re import compile as reCompile
+from bisect import insort
 from .logIt import logIt, printIt, label
 from ..classes.piSeeds import PiSeedTypes, PiSeed, PiSeedTypeREs
-from ..defs.fileIO import readRC, writeRC, getKeyItem, setKeyItem, piGenCodeDirs, piGCDirs
+from ..defs.fileIO import readRC, writeRC, getKeyItem, setKeyItem, piGenCodeDirs, piGCDirs, getGermFormat
 from ..defs.piID import getPiIDs
+from .piProfile import profileDef, addBytesRead, addBytesWritten
+from .piJsonCodec import dumpsJson, loadsJson
 
+@profileDef("read json")
 def readJson(fileName: str, verbose=True) -> dict:
     rtnDict = {}
     try:
-        with open(fileName, 'r') as rf:
-            rtnDict = load(rf)
+        with open(fileName, 'rb') as rf:
+            content = rf.read()
+        addBytesRead(len(content))
+        rtnDict = loadsJson(content)
     except FileNotFoundError:
         if verbose: printIt("piGen|readJson -", fileName,label.FileNotFound)
     except JSONDecodeError as e:
         tb_str = ''.join(format_exception(None, e, e.__traceback__))
     return rtnDict
 
+@profileDef("write json")
 def writeJson(fileName: str, aDict: dict, verbose=True) -> bool:
     rtnBool = False
     try:
-        with open(fileName, 'w') as wf:
-            dump(aDict, wf, indent=2)
+        content = dumpsJson(aDict, getGermFormat() == "compact")
+        with open(fileName, 'wb') as wf:
+            wf.write(content)
+        addBytesWritten(len(content))
         rtnBool = True
     except FileNotFoundError:
         if verbose: printIt("piGen|writeJson -", fileName,label.FileNotFound)
@@ -33,25 +44,50 @@ def writeJson(fileName: str, aDict: dict, verbose=True) -> bool:
         printIt(tb_str,label.ERROR)
     return rtnBool
 
+# Parsed piStruct/piDefault templates keyed by file name and validated by the
+# file's (mtime, size). Templates are kept pickled so each read hands out an
+# independent copy that callers are free to modify.
+piTemplateCache: dict[str, tuple[tuple, bytes]] = {}
+
+def _readPiTemplate(fileName: str, verbose=True) -> dict:
+    try:
+        fileStat = os.stat(fileName)
+    except OSError:
+        piTemplateCache.pop(fileName, None)
+        return readJson(fileName, verbose)
+    fileKey = (fileStat.st_mtime_ns, fileStat.st_size)
+    cachedTemplate = piTemplateCache.get(fileName)
+    if cachedTemplate and cachedTemplate[0] == fileKey:
+        return pickle.loads(cachedTemplate[1])
+    rtnDict = readJson(fileName, verbose)
+    if rtnDict:
+        piTemplateCache[fileName] = (fileKey, pickle.dumps(rtnDict, pickle.HIGHEST_PROTOCOL))
+    return rtnDict
+
+def _makePiDir(piDir: Path):
+    if not piDir.is_dir():
+        makedirs(piDir, exist_ok=True)
+
 def getPiStrucFileName(baseTitle: str) -> str:
     piGermDir = getKeyItem(piGCDirs[1])
     if not piGermDir:
         piGermDir = piGenCodeDirs[piGCDirs[1]]
         setKeyItem(piGCDirs[1], piGermDir)
     piStrucFileName = Path(piGermDir).joinpath(PiSeedTypes[0])
-    makedirs(piStrucFileName, exist_ok=True)
+    _makePiDir(piStrucFileName)
     piStrucFileName = Path(piStrucFileName).joinpath(f'{PiSeedTypes[0]}_{baseTitle}.json')
     return str(piStrucFileName)
 
 def writePiStruc(baseTitle: str, aDict: dict, verbose=True) -> bool:
     piStrucFileName = getPiStrucFileName(baseTitle)
+    piTemplateCache.pop(piStrucFileName, None)
     rtnBool = writeJson(piStrucFileName, aDict, verbose)
     if rtnBool and verbose: printIt(piStrucFileName,label.SAVED)
     return rtnBool
 
 def readPiStruc(baseTitle: str, verbose=True) -> dict:
     piStrucFileName = getPiStrucFileName(baseTitle)
-    rtnDict = readJson(piStrucFileName, verbose)
+    rtnDict = _readPiTemplate(piStrucFileName, verbose)
     return rtnDict
 
 def getPiDefaultFileName(baseTitle: str) -> str:
@@ -60,12 +96,13 @@ def getPiDefaultFileName(baseTitle: str) -> str:
         piGermDir = piGenCodeDirs[piGCDirs[1]]
         setKeyItem(piGCDirs[1], piGermDir)
     piDefaultFileName = Path(piGermDir).joinpath(PiSeedTypes[1])
-    makedirs(piDefaultFileName, exist_ok=True)
+    _makePiDir(piDefaultFileName)
     piDefaultFileName = Path(piDefaultFileName).joinpath(f'{PiSeedTypes[1]}_{baseTitle}.json')
     return str(piDefaultFileName)
 
 def writePiDefault(baseTitle: str, aDict: dict, verbose=True) -> bool:
     piStrucFileName = getPiDefaultFileName(baseTitle)
+    piTemplateCache.pop(piStrucFileName, None)
     # populate piID and piMD5
     if type(aDict.get("piID")) == str:
         piID, piMD5 = getPiIDs(aDict)
@@ -83,7 +120,7 @@ def writePiDefault(baseTitle: str, aDict: dict, verbose=True) -> bool:
 
 def readPiDefault(baseTitle: str, verbose=True) -> dict:
     piStrucFileName = getPiDefaultFileName(baseTitle)
-    rtnDict = readJson(piStrucFileName, verbose)
+    rtnDict = _readPiTemplate(piStrucFileName, verbose)
     return rtnDict
 
 
@@ -151,81 +188,141 @@ def piLoadPiClassGCJson(PiClassName: str, piClassGCDir: str) -> dict:
         printIt('piLoadPiClassGCJson', fileName, label.FileNotFound)
     return rtnJson
 
-class PiDefGCFiles():
-    def __init__(self) -> None:
-        piScratchPath = Path(getKeyItem("piGermDir"))
-        self.fileDirName = piScratchPath.joinpath(getKeyItem("piDefGCDir"))
-        self.fileDirName.mkdir(mode=511, parents=True, exist_ok=True)
+class PiGermDirIndex():
+    '''
+        Sorted index of the numbered germ files (piDefGC001_title.json, ...)
+        in one directory: file name -> (number, title), title -> file names
+        and, for piDefGC files, the fileDirectory read from each file.
+        The directory is listed again only when its mtime changes, so other
+        processes adding or renaming files are noticed.
+    '''
+    def __init__(self, fileDirName: Path, fileRE) -> None:
+        self.fileDirName = fileDirName
+        self.fileRE = fileRE
+        self.dirStat = None
+        self.fileNames: list[str] = []
+        self.fileParts: dict[str, tuple[int, str]] = {}
+        self.titleFiles: dict[str, list[str]] = {}
+        self.fileDirectories: dict[str, str | None] = {}
+
+    def _statDir(self):
+        try: return self.fileDirName.stat().st_mtime_ns
+        except FileNotFoundError: return None
+
+    def _addName(self, fileName: str):
+        fileMatch = self.fileRE.match(fileName)
+        if fileMatch and fileName not in self.fileParts:
+            fileParts = fileMatch.groups()
+            self.fileParts[fileName] = (int(fileParts[0]), fileParts[1])
+            insort(self.fileNames, fileName)
+            insort(self.titleFiles.setdefault(fileParts[1], []), fileName)
+
+    def refresh(self):
+        dirStat = self._statDir()
+        if dirStat == self.dirStat: return
+        self.fileNames, self.fileParts, self.titleFiles = [], {}, {}
+        self.fileDirectories = {}
+        if dirStat is not None:
+            for p in self.fileDirName.iterdir():
+                if p.is_file(): self._addName(p.name)
+        self.dirStat = dirStat
+
+    def maxFileInt(self) -> int:
+        '''Number of the last file in name order, 0 when there is none.'''
+        self.refresh()
+        if self.fileNames: return self.fileParts[self.fileNames[-1]][0]
+        return 0
+
+    def getTitleFiles(self, piTitle: str) -> list[str]:
+        self.refresh()
+        return self.titleFiles.get(piTitle, [])
+
+    def getFileDirectory(self, fileName: str) -> str | None:
+        if fileName not in self.fileDirectories:
+            fileDirectory = None
+            try:
+                with open(self.fileDirName.joinpath(fileName), 'rb') as f:
+                    data = loadsJson(f.read())
+                fileDirectory = data.get("piBody", {}).get("piDefGC", {}).get("fileDirectory")
+            except Exception:
+                # If we can't read the file, just continue
+                pass
+            self.fileDirectories[fileName] = fileDirectory
+        return self.fileDirectories[fileName]
+
+    def addFile(self, fileName: str, fileDirectory=None):
+        '''Record a germ file just written to the directory.'''
+        self._addName(fileName)
+        self.fileDirectories.pop(fileName, None)
+        if fileDirectory is not None:
+            self.fileDirectories[fileName] = fileDirectory
+        self.dirStat = self._statDir()
+
+    def shiftFilesUpOne(self, fromFileInt: int, fileType: str, pad=3):
+        '''Renumber every file numbered fromFileInt or above up by one,
+           highest first, then update the index in one step.'''
+        self.refresh()
+        renames = [(fileName, f'{fileType}{str(self.fileParts[fileName][0]+1).zfill(pad)}_{self.fileParts[fileName][1]}.json')
+                   for fileName in reversed(self.fileNames) if self.fileParts[fileName][0] >= fromFileInt]
+        for oldName, newName in renames:
+            self.fileDirName.joinpath(oldName).rename(self.fileDirName.joinpath(newName))
+        fileDirectories = self.fileDirectories
+        self.dirStat = None
+        self.refresh()
+        for oldName, newName in renames:
+            if oldName in fileDirectories:
+                self.fileDirectories[newName] = fileDirectories[oldName]
+
+piGermDirIndexes: dict[str, PiGermDirIndex] = {}
+
+def getGermDirIndex(fileDirName: Path, fileRE) -> PiGermDirIndex:
+    '''Process-wide PiGermDirIndex for fileDirName.'''
+    dirIndex = piGermDirIndexes.get(str(fileDirName))
+    if dirIndex is None:
+        dirIndex = piGermDirIndexes[str(fileDirName)] = PiGermDirIndex(fileDirName, fileRE)
+    return dirIndex
+
+class PiGermFiles():
+    '''Numbered germ file allocation shared by PiDefGCFiles, PiGenClassFiles
+       and PiClassGCFiles.'''
+    fileType = ""
+    fileRE = None
+    def _initGermFiles(self, fileDirName: Path, mode=511) -> None:
+        self.fileDirName = fileDirName
+        self.fileDirName.mkdir(mode=mode, parents=True, exist_ok=True)
+        self.dirIndex = getGermDirIndex(self.fileDirName, self.fileRE)
         self.baseMaxFileInt = self._getBaseMaxFileInt()
         self.maxFileInt = self.baseMaxFileInt
         self.lastLineNumber = 0
-        self.defGCFilePaths = []
 
-    def _getPiDefGCFiles(self):
-        # Pattern for piDefGC files: piDefGC001_filename.json
-        defgc_pattern = reCompile(r'piDefGC(\d{3})_(.+)\.json')
-        return [p.name for p in self.fileDirName.iterdir() if p.is_file() and defgc_pattern.match(p.name)]
+    def __getstate__(self):
+        # the directory index stays with the process that built it
+        state = self.__dict__.copy()
+        state.pop("dirIndex", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.dirIndex = getGermDirIndex(self.fileDirName, self.fileRE)
 
     def _getBaseMaxFileInt(self):
-        rtnInt = 1
-        PiDefGCFiles = self._getPiDefGCFiles()
-        if PiDefGCFiles:
-            PiDefGCFiles.sort()
-            defgc_pattern = reCompile(r'piDefGC(\d{3})_(.+)\.json')
-            fileMatch = defgc_pattern.match(str(PiDefGCFiles[-1]))
-            if fileMatch:
-                fileParts = fileMatch.groups()
-                rtnInt = int(fileParts[0]) + 1
-        return rtnInt
+        return self.dirIndex.maxFileInt() + 1
 
     def _shiftFilesUpOneFromBaseMaxFileInt(self, pad=3):
-        PiDefGCFiles = self._getPiDefGCFiles()
-        if PiDefGCFiles:
-            PiDefGCFiles.sort(reverse=True)
-            defgc_pattern = reCompile(r'piDefGC(\d{3})_(.+)\.json')
-            for PiDefGCFile in PiDefGCFiles:
-                fileMatch = defgc_pattern.match(PiDefGCFile)
-                if fileMatch:
-                    fileParts = fileMatch.groups()
-                    fileInt = int(fileParts[0])
-                    if fileInt >= self.baseMaxFileInt:
-                        newName = self.fileDirName.joinpath(f'piDefGC{str(int(fileParts[0])+1).zfill(pad)}_{fileParts[1]}.json')
-                        oldName = self.fileDirName.joinpath(PiDefGCFile)
-                        self.fileDirName.joinpath(PiDefGCFile).rename(newName)
+        self.dirIndex.shiftFilesUpOne(self.baseMaxFileInt, self.fileType, pad)
 
     def _chkForExistingFile(self, piTitle: str, fileDirectory=None):
         fileInt = 0
-        PiDefGCFiles = self._getPiDefGCFiles()
-        if PiDefGCFiles:
-            PiDefGCFiles.sort()
-            defgc_pattern = reCompile(r'piDefGC(\d{3})_(.+)\.json')
-            for PiDefGCFile in PiDefGCFiles:
-                fileMatch = defgc_pattern.match(PiDefGCFile)
-                if fileMatch:
-                    fileParts = fileMatch.groups()
-                    if fileParts[0].isnumeric():
-                        chkFileName = fileParts[1]
-                        # Only consider it a match if both title and file path match
-                        # If fileDirectory is None, fall back to just checking the title
-                        if chkFileName == piTitle:
-                            # If we have a file directory, we need to check if it matches
-                            # by reading the JSON file and checking the fileDirectory field
-                            if fileDirectory:
-                                jsonFile = self.fileDirName.joinpath(PiDefGCFile)
-                                if jsonFile.exists():
-                                    try:
-                                        with open(jsonFile, 'r') as f:
-                                            data = load(f)
-                                            if data.get("piBody", {}).get("piDefGC", {}).get("fileDirectory") == fileDirectory:
-                                                fileInt = int(fileParts[0])
-                                                break
-                                    except Exception:
-                                        # If we can't read the file, just continue
-                                        pass
-                            else:
-                                # If no fileDirectory specified, just match on title
-                                fileInt = int(fileParts[0])
-                                break
+        titleFiles = self.dirIndex.getTitleFiles(piTitle)
+        if titleFiles:
+            if fileDirectory:
+                # Only consider it a match if both title and file path match
+                for titleFile in titleFiles:
+                    if self.dirIndex.getFileDirectory(titleFile) == fileDirectory:
+                        fileInt = self.dirIndex.fileParts[titleFile][0]
+                        break
+            else:
+                fileInt = self.dirIndex.fileParts[titleFiles[0]][0]
         return fileInt
 
     def _getFileIntZFill(self, piTitle: str, lineNumber: int, fileDirectory=None, pad=3) -> str:
@@ -240,27 +337,45 @@ class PiDefGCFiles():
                 self.lastLineNumber = lineNumber
                 fileInt = self.maxFileInt
             self.maxFileInt += 1
-        else:
-            pass
-            #print(">>>", piTitle, self.lastLineNumber, self.baseMaxFileInt, self.maxFileInt, f'{piTitle} file exists')
         return str(fileInt).zfill(3)
 
+    def _getGermFileName(self, piType: str, piTitle: str, lineNumber=0, fileDirectory=None) -> str:
+        _makePiDir(self.fileDirName)
+        fileIntStr = self._getFileIntZFill(piTitle, lineNumber, fileDirectory)
+        fileName = self.fileDirName.joinpath(f'{piType}{fileIntStr}_{piTitle}.json')
+        return str(fileName)
+
+    def _writeGermFile(self, fileName: str, aDict: dict, verbose=True, fileDirectory=None) -> bool:
+        rtnBool = writeJson(fileName, aDict, verbose)
+        if rtnBool:
+            self.dirIndex.addFile(Path(fileName).name, fileDirectory)
+        if rtnBool and verbose:
+            printIt(fileName, label.SAVED)
+        return rtnBool
+
+
+class PiDefGCFiles(PiGermFiles):
+    fileType = "piDefGC"
+    fileRE = reCompile(r'piDefGC(\d{3})_(.+)\.json')
+    def __init__(self) -> None:
+        piScratchPath = Path(getKeyItem("piGermDir"))
+        self._initGermFiles(piScratchPath.joinpath(getKeyItem("piDefGCDir")))
+        self.defGCFilePaths = []
+
     def _getPiDefGCFileName(self, piType: str, piTitle: str, lineNumber=0, aDict=None) -> str:
-        makedirs(self.fileDirName, exist_ok=True)
+        return self._getGermFileName(piType, piTitle, lineNumber, self._getDefFileDirectory(aDict))
+
+    def _getDefFileDirectory(self, aDict=None):
         fileDirectory = None
         if aDict and "piBody" in aDict and "piDefGC" in aDict["piBody"] and "fileDirectory" in aDict["piBody"]["piDefGC"]:
             fileDirectory = aDict["piBody"]["piDefGC"]["fileDirectory"]
-        fileIntStr = self._getFileIntZFill(piTitle, lineNumber, fileDirectory)
-        fileName = self.fileDirName.joinpath(f'{piType}{fileIntStr}_{piTitle}.json')
-        return str(fileName)
+        return fileDirectory
 
     def writePiDefGC(self, piType: str, piTitle: str, lineNumber: int, aDict: dict, verbose=True) -> bool:
         piStrucFileName = self._getPiDefGCFileName(piType, piTitle, lineNumber, aDict)
-        rtnBool = writeJson(piStrucFileName, aDict, verbose)
+        rtnBool = self._writeGermFile(piStrucFileName, aDict, verbose, self._getDefFileDirectory(aDict))
         if rtnBool:
             self.defGCFilePaths.append(piStrucFileName)
-        if rtnBool and verbose:
-            printIt(piStrucFileName, label.SAVED)
         return rtnBool
 
     def readPiDefGC(self, piType: str, piTitle: str, verbose=True) -> dict:
@@ -269,95 +384,22 @@ class PiDefGCFiles():
         return rtnDict
 
 
-class PiGenClassFiles():
+class PiGenClassFiles(PiGermFiles):
+    fileType = "piGenClass"
+    fileRE = reCompile(r'piGenClass(\d{3})_(.+)\.json')
     def __init__(self) -> None:
         piScratchPath = Path(getKeyItem("piGermDir"))
-        self.fileDirName = piScratchPath.joinpath("piGenClass")
-        self.fileDirName.mkdir(mode=0o755, parents=True, exist_ok=True)
-        self.baseMaxFileInt = self._getBaseMaxFileInt()
-        self.maxFileInt = self.baseMaxFileInt
-        self.lastLineNumber = 0
+        self._initGermFiles(piScratchPath.joinpath("piGenClass"), mode=0o755)
         self.genClassFilePaths = []
 
-    def _getPiGenClassFiles(self):
-        # Pattern for piGenClass files: piGenClass001_filename.json
-        genclass_pattern = reCompile(r'piGenClass(\d{3})_(.+)\.json')
-        return [p.name for p in self.fileDirName.iterdir() if p.is_file() and genclass_pattern.match(p.name)]
-
-    def _getBaseMaxFileInt(self):
-        rtnInt = 1
-        PiGenClassFiles = self._getPiGenClassFiles()
-        if PiGenClassFiles:
-            PiGenClassFiles.sort()
-            genclass_pattern = reCompile(r'piGenClass(\d{3})_(.+)\.json')
-            fileMatch = genclass_pattern.match(str(PiGenClassFiles[-1]))
-            if fileMatch:
-                fileParts = fileMatch.groups()
-                rtnInt = int(fileParts[0]) + 1
-        return rtnInt
-
-    def _shiftFilesUpOneFromBaseMaxFileInt(self, pad=3):
-        PiGenClassFiles = self._getPiGenClassFiles()
-        if PiGenClassFiles:
-            PiGenClassFiles.sort(reverse=True)
-            genclass_pattern = reCompile(r'piGenClass(\d{3})_(.+)\.json')
-            for PiGenClassFile in PiGenClassFiles:
-                fileMatch = genclass_pattern.match(PiGenClassFile)
-                if fileMatch:
-                    fileParts = fileMatch.groups()
-                    fileInt = int(fileParts[0])
-                    if fileInt >= self.baseMaxFileInt:
-                        newName = self.fileDirName.joinpath(f'piGenClass{str(int(fileParts[0])+1).zfill(pad)}_{fileParts[1]}.json')
-                        oldName = self.fileDirName.joinpath(PiGenClassFile)
-                        self.fileDirName.joinpath(PiGenClassFile).rename(newName)
-
-    def _chkForExistingFile(self, piTitle: str):
-        fileInt = 0
-        PiGenClassFiles = self._getPiGenClassFiles()
-        if PiGenClassFiles:
-            PiGenClassFiles.sort()
-            genclass_pattern = reCompile(r'piGenClass(\d{3})_(.+)\.json')
-            for PiGenClassFile in PiGenClassFiles:
-                fileMatch = genclass_pattern.match(PiGenClassFile)
-                if fileMatch:
-                    fileParts = fileMatch.groups()
-                    if fileParts[0].isnumeric():
-                        chkFileName = fileParts[1]
-                        if chkFileName == piTitle:
-                            fileInt = int(fileParts[0])
-                            break
-        return fileInt
-
-    def _getFileIntZFill(self, piTitle: str, lineNumber: int, pad=3) -> str:
-        fileInt = self._chkForExistingFile(piTitle)
-        if not fileInt:
-            if not self.lastLineNumber:
-                self.lastLineNumber = lineNumber
-            if lineNumber < self.lastLineNumber:
-                self._shiftFilesUpOneFromBaseMaxFileInt(pad)
-                fileInt = self.baseMaxFileInt
-            else:
-                self.lastLineNumber = lineNumber
-                fileInt = self.maxFileInt
-            self.maxFileInt += 1
-        else:
-            pass
-            # print(">>>", piTitle, self.lastLineNumber, self.baseMaxFileInt, self.maxFileInt, f'{piTitle} file exists')
-        return str(fileInt).zfill(3)
-
     def _getPiGenClassFileName(self, piType: str, piTitle: str, lineNumber=0) -> str:
-        makedirs(self.fileDirName, exist_ok=True)
-        fileIntStr = self._getFileIntZFill(piTitle, lineNumber)
-        fileName = self.fileDirName.joinpath(f'{piType}{fileIntStr}_{piTitle}.json')
-        return str(fileName)
+        return self._getGermFileName(piType, piTitle, lineNumber)
 
     def writePiGenClass(self, piType: str, piTitle: str, lineNumber, aDict: dict, verbose=True) -> bool:
         piStrucFileName = self._getPiGenClassFileName(piType, piTitle, lineNumber)
-        rtnBool = writeJson(piStrucFileName, aDict, verbose)
+        rtnBool = self._writeGermFile(piStrucFileName, aDict, verbose)
         if rtnBool:
             self.genClassFilePaths.append(piStrucFileName)
-        if rtnBool and verbose:
-            printIt(piStrucFileName, label.SAVED)
         return rtnBool
 
     def readPiGenClass(self, piType: str, piTitle: str, verbose=True) -> dict:
@@ -366,100 +408,23 @@ class PiGenClassFiles():
         return rtnDict
 
 
-class PiClassGCFiles():
+class PiClassGCFiles(PiGermFiles):
+    fileType = "piClassGC"
+    # PiSeedTypes[2]: reCompile('piClassGC(\d{3})_(.+).json'),
+    fileRE = PiSeedTypeREs[PiSeedTypes[2]]
     def __init__(self) -> None:
         piScratchPath = Path(getKeyItem("piGermDir"))
-        self.fileDirName = piScratchPath.joinpath("piClassGC")
-        self.fileDirName.mkdir(mode=511, parents=True, exist_ok=True)
-        self.baseMaxFileInt = self._getBaseMaxFileInt()
-        self.maxFileInt = self.baseMaxFileInt
-        self.lastLineNumber = 0
+        self._initGermFiles(piScratchPath.joinpath("piClassGC"))
         self.classGCFilePaths = []
-    def _getPiClassGCFiles(self):
-        return [p.name for p in self.fileDirName.iterdir() if p.is_file() and PiSeedTypeREs[PiSeedTypes[2]].match(p.name)]
-    def _getBaseMaxFileInt(self):
-        rtnInt = 1
-        PiClassGCFiles = self._getPiClassGCFiles()
-        if PiClassGCFiles:
-            PiClassGCFiles.sort()
-            fileMatch = PiSeedTypeREs[PiSeedTypes[2]].match(str(PiClassGCFiles[-1]))
-            if fileMatch:
-                fileParts = fileMatch.groups()
-                rtnInt = int(fileParts[0]) + 1
-        return rtnInt
-
-    def _shiftFilesUpOneFromBaseMaxFileInt(self, pad = 3):
-        PiClassGCFiles = self._getPiClassGCFiles()
-        if PiClassGCFiles:
-            PiClassGCFiles.sort(reverse=True)
-            for PiClassGCFile in PiClassGCFiles:
-                # PiSeedTypes[3]: reCompile('piClassGC(\d{3})_(.+).json'),
-                fileMatch = PiSeedTypeREs[PiSeedTypes[2]].match(PiClassGCFile)
-                if fileMatch:
-                    fileParts = fileMatch.groups()
-                    fileInt = int(fileParts[0])
-                    if fileInt >= self.baseMaxFileInt:
-                        # print(f'self.baseMaxFileInt >= fileInt: {self.baseMaxFileInt} >= {fileInt}')
-                        newName = self.fileDirName.joinpath(f'piClassGC{str(int(fileParts[0])+1).zfill(pad)}_{fileParts[1]}.json')
-                        oldName = self.fileDirName.joinpath(PiClassGCFile)
-                        # print("oldName",oldName.stem)
-                        self.fileDirName.joinpath(PiClassGCFile).rename(newName)
-                        # print("newName",newName.stem)
-
-    def _chkForExistingFile(self, piTitle: str):
-        fileInt = 0
-        PiClassGCFiles = self._getPiClassGCFiles()
-        if PiClassGCFiles:
-            PiClassGCFiles.sort()
-            for PiClassGCFile in PiClassGCFiles:
-                # print('PiClassGCFile',PiClassGCFile)
-                # PiSeedTypes[3]: reCompile('piClassGC(\d{3})_(.+).json'),
-                fileMatch = PiSeedTypeREs[PiSeedTypes[2]].match(PiClassGCFile)
-                if fileMatch:
-                    fileParts = fileMatch.groups()
-                    # print(fileParts)
-                    if fileParts[0].isnumeric():
-                        chkFileName = fileParts[1]
-                        if chkFileName == piTitle:
-                            fileInt = int(fileParts[0])
-                            break
-        return fileInt
-
-    def _getFileIntZFill(self, piTitle: str, lineNumber: int, pad = 3) -> str:
-        fileInt = self._chkForExistingFile(piTitle)
-        # print("piTitle", "self.lastLineNumber", "self.baseMaxFileInt", "self.maxFileInt", fileInt)
-        # print(f'piTitle: {piTitle} {"-"*8}')
-        if not fileInt:
-            if not self.lastLineNumber:
-                self.lastLineNumber = lineNumber
-            if lineNumber < self.lastLineNumber:
-                # print(">",piTitle, self.lastLineNumber, self.baseMaxFileInt, self.maxFileInt, fileInt)
-                #  piWordsBody 29 18 19 0
-                self._shiftFilesUpOneFromBaseMaxFileInt(pad)
-                fileInt = self.baseMaxFileInt
-            else:
-                # print(">>",piTitle, self.lastLineNumber, self.baseMaxFileInt, self.maxFileInt, fileInt)
-                self.lastLineNumber = lineNumber
-                fileInt = self.maxFileInt
-            self.maxFileInt += 1
-        else:
-            pass
-            # print(">>>",piTitle, self.lastLineNumber, self.baseMaxFileInt, self.maxFileInt, f'{piTitle} file exits')
-        return str(fileInt).zfill(3)
 
     def _getPiClassGCFileName(self, piType: str, piTitle: str, lineNumber = 0) -> str:
-
-        makedirs(self.fileDirName, exist_ok=True)
-        fileIntStr = self._getFileIntZFill(piTitle, lineNumber)
-        fileName = self.fileDirName.joinpath(f'{piType}{fileIntStr}_{piTitle}.json')
-        return str(fileName)
+        return self._getGermFileName(piType, piTitle, lineNumber)
 
     def writePiClassGC(self, piType: str, piTitle: str, lineNumber: int, aDict: dict, verbose=True) -> bool:
         piStrucFileName = self._getPiClassGCFileName(piType, piTitle, lineNumber)
         #print('piStrucFileName:', piStrucFileName)
-        rtnBool = writeJson(piStrucFileName, aDict, verbose)
+        rtnBool = self._writeGermFile(piStrucFileName, aDict, verbose)
         if rtnBool: self.classGCFilePaths.append(piStrucFileName)
-        if rtnBool and verbose: printIt(piStrucFileName,label.SAVED)
         return rtnBool
 
     def readPiClassGC(self, piType: str, piTitle: str, verbose=True) -> dict:
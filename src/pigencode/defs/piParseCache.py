@@ -0,0 +1,92 @@
+import os
+import ast
+from bisect import bisect_right
+from .piProfile import profilePhase, addBytesRead
+
+class PiParsedFile():
+    '''
+        Source text of a Python file with its AST, line start offsets and
+        classified piSeed type, each computed on first use.
+    '''
+    __slots__ = ("fileName", "fileStat", "content", "_tree", "_parseError",
+                 "_lineOffsets", "seedType")
+
+    def __init__(self, fileName: str, fileStat: tuple[int, int], content: str) -> None:
+        self.fileName = fileName
+        self.fileStat = fileStat
+        self.content = content
+        self._tree: ast.Module | None = None
+        self._parseError: Exception | None = None
+        self._lineOffsets: list[int] | None = None
+        self.seedType = ""   # set by determineOptimalPiSeedType
+
+    @property
+    def tree(self) -> ast.Module:
+        '''AST of content; a SyntaxError is raised again on every access.'''
+        if self._tree is None:
+            if self._parseError is not None:
+                raise self._parseError
+            try:
+                with profilePhase("parse python"):
+                    self._tree = ast.parse(self.content)
+            except (SyntaxError, ValueError) as e:
+                self._parseError = e
+                raise
+        return self._tree
+
+    @property
+    def lineOffsets(self) -> list[int]:
+        '''Offset in content of the start of each line.'''
+        if self._lineOffsets is None:
+            lineOffsets = [0]
+            lineStart = self.content.find('\n')
+            while lineStart >= 0:
+                lineOffsets.append(lineStart + 1)
+                lineStart = self.content.find('\n', lineStart + 1)
+            self._lineOffsets = lineOffsets
+        return self._lineOffsets
+
+    def getLineNo(self, offset: int) -> int:
+        '''1-based line number of a content offset.'''
+        return bisect_right(self.lineOffsets, offset)
+
+# {absolute file name: PiParsedFile}, validated by (mtime_ns, size)
+parsedFiles: dict[str, PiParsedFile] = {}
+# {content: PiParsedFile} so parseSource reuses the tree of a cached file
+parsedSources: dict[str, PiParsedFile] = {}
+
+def getParsedFile(pythonFile) -> PiParsedFile:
+    '''Cached PiParsedFile for pythonFile; read again only when its
+       (mtime, size) changed. Raises OSError like open().'''
+    fileName = os.path.abspath(pythonFile)
+    fileStatResult = os.stat(fileName)
+    fileStat = (fileStatResult.st_mtime_ns, fileStatResult.st_size)
+    parsedFile = parsedFiles.get(fileName)
+    if parsedFile is None or parsedFile.fileStat != fileStat:
+        if parsedFile is not None:
+            parsedSources.pop(parsedFile.content, None)
+        with profilePhase("read python"):
+            with open(fileName, 'r', encoding='utf-8') as f:
+                content = f.read()
+            addBytesRead(fileStat[1])
+        parsedFile = PiParsedFile(fileName, fileStat, content)
+        parsedFiles[fileName] = parsedFile
+        parsedSources[content] = parsedFile
+    return parsedFile
+
+def readPythonFile(pythonFile) -> str:
+    return getParsedFile(pythonFile).content
+
+def parsePythonFile(pythonFile) -> ast.Module:
+    return getParsedFile(pythonFile).tree
+
+def parseSource(content: str) -> ast.Module:
+    '''ast.parse(content), reusing the tree of a cached file with this content.'''
+    parsedFile = parsedSources.get(content)
+    if parsedFile is not None:
+        return parsedFile.tree
+    return ast.parse(content)
+
+def clearParseCache():
+    parsedFiles.clear()
+    parsedSources.clear()
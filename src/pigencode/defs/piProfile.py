@@ -0,0 +1,165 @@
+import time
+from functools import wraps
+from .logIt import printIt, label
+
+class PiProfilePhase():
+    '''Count, wall time and bytes read and written of a named phase, with
+       the phases run inside it.'''
+    __slots__ = ("name", "count", "wallTime", "bytesRead", "bytesWritten", "phases")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.count = 0
+        self.wallTime = 0.0
+        self.bytesRead = 0
+        self.bytesWritten = 0
+        self.phases: dict[str, PiProfilePhase] = {}
+
+    def getPhase(self, name: str) -> "PiProfilePhase":
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = PiProfilePhase(name)
+        return phase
+
+    def addPhase(self, phase: "PiProfilePhase"):
+        '''Add the counts, times and bytes of phase and its phases to this one.'''
+        self.count += phase.count
+        self.wallTime += phase.wallTime
+        self.bytesRead += phase.bytesRead
+        self.bytesWritten += phase.bytesWritten
+        for subPhase in phase.phases.values():
+            self.getPhase(subPhase.name).addPhase(subPhase)
+
+    def json(self) -> dict:
+        return {"name": self.name, "count": self.count, "wallTime": self.wallTime,
+                "bytesRead": self.bytesRead, "bytesWritten": self.bytesWritten,
+                "phases": [phase.json() for phase in self.phases.values()]}
+
+# None while profiling is off; phases are then a shared no-op
+profileRoot: PiProfilePhase | None = None
+phaseStack: list[PiProfilePhase] = []
+cProfiler = None
+pstatsFileName = ""
+
+class _PhaseTimer():
+    __slots__ = ("phase", "startTime")
+
+    def __init__(self, name: str) -> None:
+        self.phase = phaseStack[-1].getPhase(name)
+
+    def __enter__(self):
+        phaseStack.append(self.phase)
+        self.startTime = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.phase.wallTime += time.perf_counter() - self.startTime
+        self.phase.count += 1
+        phaseStack.pop()
+        return False
+
+class _NoPhase():
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc) -> bool: return False
+
+noPhase = _NoPhase()
+
+def profiling() -> bool:
+    return profileRoot is not None
+
+def profilePhase(*nameParts: str):
+    '''Context manager timing the named phase (name parts are joined with
+       spaces) inside the current one.'''
+    if profileRoot is None: return noPhase
+    return _PhaseTimer(" ".join(nameParts))
+
+def profileDef(*nameParts: str):
+    '''Decorator timing each call of a function as a profilePhase.'''
+    name = " ".join(nameParts)
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if profileRoot is None: return func(*args, **kwargs)
+            with _PhaseTimer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def addBytesRead(byteCount: int):
+    if profileRoot is not None: phaseStack[-1].bytesRead += byteCount
+
+def addBytesWritten(byteCount: int):
+    if profileRoot is not None: phaseStack[-1].bytesWritten += byteCount
+
+def startProfile(name: str, pstatsFile: str = ""):
+    '''Turn profiling on with name as the root phase. With pstatsFile,
+       cProfile also runs and its stats are dumped there by stopProfile.'''
+    global profileRoot, cProfiler, pstatsFileName
+    profileRoot = PiProfilePhase(name)
+    phaseStack[:] = [profileRoot]
+    profileRoot.wallTime = -time.perf_counter()
+    pstatsFileName = pstatsFile
+    if pstatsFile:
+        # imported here: cProfile is only loaded when asked for
+        import cProfile
+        cProfiler = cProfile.Profile()
+        cProfiler.enable()
+
+def stopProfile() -> PiProfilePhase | None:
+    '''Turn profiling off and return the root phase.'''
+    global profileRoot, cProfiler
+    rootPhase = profileRoot
+    if rootPhase is None: return None
+    if cProfiler is not None:
+        cProfiler.disable()
+        cProfiler.dump_stats(pstatsFileName)
+        cProfiler = None
+    rootPhase.wallTime += time.perf_counter()
+    rootPhase.count = 1
+    profileRoot = None
+    phaseStack.clear()
+    return rootPhase
+
+def runProfiledJob(profileOn: bool, func, *args):
+    '''Run func(*args) in a worker process and return (result, phases), the
+       phases being None unless profileOn. Pass profiling() as profileOn and
+       the phases to mergeProfile in the parent.'''
+    global cProfiler
+    if not profileOn: return func(*args), None
+    # a forked worker has a copy of the parent's profile, dumped by the parent only
+    cProfiler = None
+    startProfile("job")
+    try:
+        result = func(*args)
+    finally:
+        jobPhase = stopProfile()
+    return result, jobPhase
+
+def mergeProfile(jobPhase: PiProfilePhase | None):
+    '''Add the phases a worker process ran to the current phase.'''
+    if profileRoot is None or jobPhase is None: return
+    for subPhase in jobPhase.phases.values():
+        phaseStack[-1].getPhase(subPhase.name).addPhase(subPhase)
+
+def _formatBytes(byteCount: int) -> str:
+    if not byteCount: return "-"
+    for unit in ("B", "KB", "MB"):
+        if byteCount < 1024: return f'{byteCount}{unit}'
+        byteCount //= 1024
+    return f'{byteCount}GB'
+
+def _addPhaseLines(phase: PiProfilePhase, depth: int, phaseLines: list[str]):
+    phaseName = f'{"  " * depth}{phase.name}'
+    phaseLines.append(f'{phaseName:<40}{phase.count:>8}{phase.wallTime * 1000:>12.1f}'
+                      f'{_formatBytes(phase.bytesRead):>10}{_formatBytes(phase.bytesWritten):>10}')
+    for subPhase in sorted(phase.phases.values(), key=lambda p: p.wallTime, reverse=True):
+        _addPhaseLines(subPhase, depth + 1, phaseLines)
+
+def printProfile(rootPhase: PiProfilePhase):
+    '''Print the phase tree, the slowest phases first.'''
+    phaseLines = [f'{"phase":<40}{"count":>8}{"wall ms":>12}{"read":>10}{"written":>10}']
+    _addPhaseLines(rootPhase, 0, phaseLines)
+    printIt('profile:\n' + '\n'.join(phaseLines), label.INFO)
+    if pstatsFileName:
+        printIt(f'cProfile stats written: {pstatsFileName}', label.INFO)
@@ -0,0 +1,115 @@
+import os
+from pathlib import Path
+from json import load, dump, JSONDecodeError
+from .logIt import printIt, logIt, label
+
+journalVersion = 1
+# journal states: renames planned, every file moved to its temporary name
+journalPrepared = "prepared"
+journalStaged = "staged"
+
+def _writeJournalFile(fileName: Path, content: dict):
+    '''Write content as JSON (temp file + fsync + rename), so a crash
+       leaves either the old or the new file.'''
+    tmpFileName = fileName.with_name(f'{fileName.name}.{os.getpid()}.tmp')
+    with open(tmpFileName, 'w') as wf:
+        dump(content, wf, indent=2)
+        wf.flush()
+        os.fsync(wf.fileno())
+    os.replace(tmpFileName, fileName)
+
+def _getTempPath(filePath: Path) -> Path:
+    # hidden and in the same directory: the rename is atomic and the file
+    # no longer matches the piSeed or germ file name patterns
+    return filePath.with_name(f'.piRenaming.{filePath.name}')
+
+class PiRenameJournal():
+    '''
+        Batch of file renames applied as one transaction. The whole plan,
+        with the JSON files to rewrite once the names are in place, is
+        journaled before any file is touched. Every file is first moved to
+        a temporary name, then to its new name, so names may be permuted
+        freely. recoverRenameJournal undoes a batch interrupted before all
+        files reached their temporary names and finishes one interrupted
+        after.
+    '''
+    def __init__(self, journalFile: Path) -> None:
+        self.journalFile = Path(journalFile)
+        self.renames: dict[str, str] = {}
+        self.jsonFiles: dict[str, dict] = {}
+
+    def addRename(self, oldPath: Path, newPath: Path):
+        if str(oldPath) != str(newPath):
+            self.renames[str(oldPath)] = str(newPath)
+
+    def addJsonFile(self, fileName: Path, content: dict):
+        '''Write content to fileName once every file is renamed.'''
+        self.jsonFiles[str(fileName)] = content
+
+    def _chkRenames(self):
+        newNames = set()
+        for oldName, newName in self.renames.items():
+            if not os.path.isfile(oldName):
+                raise FileNotFoundError(f'Cannot rename missing file {oldName}')
+            if newName in newNames:
+                raise FileExistsError(f'Two files would be renamed to {newName}')
+            if os.path.exists(newName) and newName not in self.renames:
+                raise FileExistsError(f'Rename target already exists: {newName}')
+            if os.path.exists(_getTempPath(Path(oldName))):
+                raise FileExistsError(f'Temporary file left by an earlier rename: {_getTempPath(Path(oldName))}')
+            newNames.add(newName)
+
+    def apply(self) -> int:
+        '''Rename every file, returning the number renamed. Raises OSError
+           before any file is touched when the plan cannot be applied.'''
+        if self.journalFile.exists():
+            raise FileExistsError(f'Unfinished rename journal: {self.journalFile}')
+        if not self.renames and not self.jsonFiles: return 0
+        self._chkRenames()
+        journal = {"version": journalVersion, "state": journalPrepared,
+                   "renames": [[oldName, str(_getTempPath(Path(oldName))), newName]
+                               for oldName, newName in self.renames.items()],
+                   "jsonFiles": self.jsonFiles}
+        _writeJournalFile(self.journalFile, journal)
+        for oldName, tmpName, _ in journal["renames"]:
+            os.rename(oldName, tmpName)
+        journal["state"] = journalStaged
+        _writeJournalFile(self.journalFile, journal)
+        _finishJournal(self.journalFile, journal)
+        return len(self.renames)
+
+def _finishJournal(journalFile: Path, journal: dict):
+    for _, tmpName, newName in journal["renames"]:
+        if os.path.exists(tmpName):
+            os.rename(tmpName, newName)
+    for fileName, content in journal["jsonFiles"].items():
+        _writeJournalFile(Path(fileName), content)
+    journalFile.unlink()
+
+def _undoJournal(journalFile: Path, journal: dict):
+    for oldName, tmpName, _ in journal["renames"]:
+        if os.path.exists(tmpName) and not os.path.exists(oldName):
+            os.rename(tmpName, oldName)
+    journalFile.unlink()
+
+def recoverRenameJournal(journalFile: Path) -> bool:
+    '''Undo or finish the batch of an interrupted PiRenameJournal.apply.
+       Returns False when journalFile is left because it cannot be read.'''
+    journalFile = Path(journalFile)
+    if not journalFile.is_file(): return True
+    try:
+        with open(journalFile, 'r') as rf:
+            journal = load(rf)
+    except (JSONDecodeError, OSError) as e:
+        logIt(f'Cannot read rename journal {journalFile}: {e}', label.ERROR)
+        return False
+    if journal.get("version") != journalVersion:
+        logIt(f'Unknown rename journal version in {journalFile}', label.ERROR)
+        return False
+    if journal.get("state") == journalStaged:
+        _finishJournal(journalFile, journal)
+        printIt(f'Finished {len(journal["renames"])} renames of an interrupted batch', label.INFO)
+    else:
+        _undoJournal(journalFile, journal)
+        printIt(f'Undid {len(journal["renames"])} renames of an interrupted batch', label.INFO)
+    return True
@@ -0,0 +1,86 @@
+from bisect import bisect_left, insort
+
+def _getLineKey(line: str) -> tuple[str, str] | None:
+    '''(piType, piTitle) of a seed line; elements start at column 0.'''
+    if not line or line[0].isspace(): return None
+    lineParts = line.split(None, 2)
+    if len(lineParts) > 1:
+        return lineParts[0], lineParts[1]
+    return None
+
+class PiSeedDocument():
+    '''
+        piSeed file content held as a list of lines for syncCode updates.
+        Lines are indexed by their leading (piType, piTitle) pair, so an
+        element is found without scanning the file. Splices edit the lines
+        and the index in place; the text is joined again only when next
+        asked for.
+    '''
+    __slots__ = ("lines", "_index", "_text")
+
+    def __init__(self, seedContent: str) -> None:
+        self.lines = seedContent.split('\n')
+        self._index: dict[tuple[str, str], list[int]] | None = None
+        self._text: str | None = seedContent
+
+    @property
+    def text(self) -> str:
+        '''Seed file content with every splice applied.'''
+        if self._text is None:
+            self._text = '\n'.join(self.lines)
+        return self._text
+
+    def _getIndex(self) -> dict[tuple[str, str], list[int]]:
+        if self._index is None:
+            index = {}
+            for lineNo, line in enumerate(self.lines):
+                lineKey = _getLineKey(line)
+                if lineKey is not None:
+                    index.setdefault(lineKey, []).append(lineNo)
+            self._index = index
+        return self._index
+
+    def find(self, piType: str, piTitle: str) -> list[int]:
+        '''Numbers of the lines starting with piType piTitle.'''
+        return list(self._getIndex().get((piType, piTitle), ()))
+
+    def findValues(self, piType: str, piTitle: str) -> list[int]:
+        '''Numbers of the lines starting with piType piTitle followed by
+           whitespace, as matched by r"^piType\\s+piTitle\\s+".'''
+        return [lineNo for lineNo in self.find(piType, piTitle)
+                if self.lines[lineNo][-1].isspace() or
+                len(self.lines[lineNo].split(None, 2)) > 2]
+
+    def findStructs(self, piType: str, piTitle: str) -> list[int]:
+        '''Numbers of the lines holding only piType piTitle, as matched by
+           r"^piType\\s+piTitle\\s*$".'''
+        return [lineNo for lineNo in self.find(piType, piTitle)
+                if len(self.lines[lineNo].split(None, 2)) == 2]
+
+    def getValue(self, lineNo: int) -> str:
+        '''Text of a line after its piType and piTitle.'''
+        lineParts = self.lines[lineNo].split(None, 2)
+        return lineParts[2] if len(lineParts) > 2 else ''
+
+    def splice(self, startLineNo: int, endLineNo: int, newLines: list[str]):
+        '''Replace lines[startLineNo:endLineNo] with newLines.'''
+        index = self._index
+        if index is not None:
+            # drop the replaced lines, shift the lines after them and add the new ones
+            for lineNo in range(startLineNo, endLineNo):
+                lineKey = _getLineKey(self.lines[lineNo])
+                if lineKey is not None:
+                    lineNos = index[lineKey]
+                    lineNos.remove(lineNo)
+                    if not lineNos: del index[lineKey]
+            lineShift = len(newLines) - (endLineNo - startLineNo)
+            if lineShift:
+                for lineNos in index.values():
+                    for i in range(bisect_left(lineNos, endLineNo), len(lineNos)):
+                        lineNos[i] += lineShift
+            for lineNo, line in enumerate(newLines, startLineNo):
+                lineKey = _getLineKey(line)
+                if lineKey is not None:
+                    insort(index.setdefault(lineKey, []), lineNo)
+        self.lines[startLineNo:endLineNo] = newLines
+        self._text = None
@@ -0,0 +1,137 @@
+import os
+import re
+from pathlib import Path
+from json import load, dump, JSONDecodeError
+from ..logIt import printIt, logIt, label
+from ..fileIO import getKeyItem, piGCDirs
+
+seedIndexFileName = ".piSeedIndex.json"
+seedIndexVersion = 1
+piSeedGCTypes = ("piClassGC", "piGenClass", "piDefGC")
+
+def _getFileDirectoryPattern(piSeedType: str, piName: str) -> str:
+    '''fileDirectory patterns used by the find*SeedFile functions.'''
+    if piSeedType == "piDefGC":
+        return rf"(piValue {piName}\.piBody:piDefGC:fileDirectory\s+(.+))"
+    return rf"(piValue {piName}\.piBody:{piSeedType}:fileDirectory\s+'([^']+)')"
+
+def _getSeedNames(seedFileName: str) -> list[tuple[str, str]]:
+    '''(piSeedType, name) pairs the seed file name matches as
+       "*_{piSeedType}_{name}.pi".'''
+    seedNames = []
+    if seedFileName.endswith(".pi") and not seedFileName.startswith('.'):
+        for piSeedType in piSeedGCTypes:
+            typeTag = f"_{piSeedType}_"
+            tagIndex = seedFileName.find(typeTag)
+            while tagIndex >= 0:
+                piName = seedFileName[tagIndex + len(typeTag):-3]
+                if piName: seedNames.append((piSeedType, piName))
+                tagIndex = seedFileName.find(typeTag, tagIndex + 1)
+    return seedNames
+
+class PiSeedIndex():
+    '''
+        Persistent index, stored under piGermDir, of the piClassGC, piGenClass
+        and piDefGC seed files in piSeedsDir and the fileDirectory each one
+        sets. Seed files are re-read only when their (mtime, size) changes,
+        and the directory is listed again only when its mtime changes.
+    '''
+    def __init__(self, seedPath: Path) -> None:
+        self.seedPath = seedPath
+        self.fileName = Path(getKeyItem(piGCDirs[1])).joinpath(seedIndexFileName)
+        self.dirStat = None
+        # {seedFileName: {"stat": [mtime_ns, size], "dirs": {"piSeedType|name": fileDirectory}}}
+        self.seeds: dict[str, dict] = {}
+        self.seedNames: dict[tuple[str, str], list[str]] = {}
+        self.changed = False
+        self._read()
+
+    def _read(self):
+        if self.fileName.is_file():
+            try:
+                with open(self.fileName, 'r') as rf:
+                    rawIndex = load(rf)
+                if rawIndex.get("version") == seedIndexVersion and \
+                        rawIndex.get("seedPath") == str(self.seedPath):
+                    self.seeds = rawIndex.get("seeds", {})
+            except (JSONDecodeError, OSError) as e:
+                logIt(f'Ignoring unreadable seed index {self.fileName}: {e}', label.WARN)
+                self.seeds = {}
+
+    def _readSeedEntry(self, seedFile: Path, seedStat: list) -> dict:
+        fileDirectories = {}
+        try:
+            with open(seedFile, 'r', encoding='utf-8') as f:
+                content = f.read()
+            for piSeedType, piName in _getSeedNames(seedFile.name):
+                match = re.search(_getFileDirectoryPattern(piSeedType, piName), content, re.MULTILINE)
+                fileDirectories[f"{piSeedType}|{piName}"] = match.group(2) if match else None
+        except Exception:
+            pass
+        self.changed = True
+        return {"stat": seedStat, "dirs": fileDirectories}
+
+    def refresh(self):
+        try:
+            dirStat = self.seedPath.stat().st_mtime_ns
+        except (OSError, AttributeError):
+            return
+        if dirStat == self.dirStat: return
+        seeds, seedNames = {}, {}
+        with os.scandir(self.seedPath) as seedEntries:
+            for seedEntry in seedEntries:
+                entryNames = _getSeedNames(seedEntry.name)
+                if not entryNames or not seedEntry.is_file(): continue
+                entryStat = seedEntry.stat()
+                seedStat = [entryStat.st_mtime_ns, entryStat.st_size]
+                seedIndexEntry = self.seeds.get(seedEntry.name)
+                if not seedIndexEntry or seedIndexEntry["stat"] != seedStat:
+                    seedIndexEntry = self._readSeedEntry(Path(seedEntry.path), seedStat)
+                seeds[seedEntry.name] = seedIndexEntry
+                for seedName in entryNames:
+                    seedNames.setdefault(seedName, []).append(seedEntry.name)
+        if seeds.keys() != self.seeds.keys(): self.changed = True
+        self.seeds, self.seedNames = seeds, seedNames
+        self.dirStat = dirStat
+        self.save()
+
+    def getFileDirectory(self, piSeedType: str, piName: str, seedFileName: str) -> str | None:
+        '''fileDirectory set in seedFileName, re-reading it if it changed.'''
+        seedFile = self.seedPath.joinpath(seedFileName)
+        try:
+            fileStat = seedFile.stat()
+        except OSError:
+            return None
+        seedStat = [fileStat.st_mtime_ns, fileStat.st_size]
+        if self.seeds[seedFileName]["stat"] != seedStat:
+            self.seeds[seedFileName] = self._readSeedEntry(seedFile, seedStat)
+            self.save()
+        return self.seeds[seedFileName]["dirs"].get(f"{piSeedType}|{piName}")
+
+    def findSeedFile(self, piSeedType: str, piName: str, py_file_dir) -> Path | None:
+        '''Seed file of piSeedType for piName whose fileDirectory equals py_file_dir.'''
+        self.refresh()
+        for seedFileName in self.seedNames.get((piSeedType, piName), []):
+            if self.getFileDirectory(piSeedType, piName, seedFileName) == py_file_dir:
+                return self.seedPath.joinpath(seedFileName)
+        return None
+
+    def save(self):
+        if not self.changed: return
+        try:
+            self.fileName.parent.mkdir(mode=511, parents=True, exist_ok=True)
+            with open(self.fileName, 'w') as wf:
+                dump({"version": seedIndexVersion, "seedPath": str(self.seedPath),
+                      "seeds": self.seeds}, wf, indent=2)
+            self.changed = False
+        except OSError as e:
+            printIt(f'Could not write seed index {self.fileName}: {e}', label.WARN)
+
+piSeedIndex: PiSeedIndex | None = None
+
+def getPiSeedIndex(seedPath: Path) -> PiSeedIndex:
+    '''Process-wide PiSeedIndex of seedPath, created on first use.'''
+    global piSeedIndex
+    if piSeedIndex is None or piSeedIndex.seedPath != seedPath:
+        piSeedIndex = PiSeedIndex(seedPath)
+    return piSeedIndex
@@ -0,0 +1,153 @@
+import re
+
+# piSeed line patterns of one class; {key} is the escaped
+# "className.piBody:piSeedType" seed key. Matched from the line start.
+seedPatternTemplates = {
+    "argument": r'piStructC01\s+argument\s+(\w+)\.\s*$',
+    "fromImportsStruct": r'piStructC01\s+fromImports\s+(\w+)\.\s*$',
+    "element": r'(?:piValueA|piStruct[AC]\d+|piValue)\s+{key}:(\w+)',
+    "piClassName": r'piValue\s+{key}:piClassName\s+(.+)$',
+    "codeValueA": r'piValueA\s+{key}:(\w+)\s+(?:"(.+)"|([^"\s]\S*))$',
+    "initArgType": r'piValue\s+{key}:initArguments:(\w+):type\s+(.+)$',
+    "initArgValue": r'piValue\s+{key}:initArguments:(\w+):value\s+(.+)$',
+    "initArgTypeKey": r'piValue\s+{key}:initArguments:(\w+):type\s+',
+    "initArgValueKey": r'piValue\s+{key}:initArguments:(\w+):value\s+',
+    "fromImportsFrom": r'piValue\s+{key}:fromImports:(\w+):from\s+',
+    "fromImportsImport": r'piValue\s+{key}:fromImports:(\w+):import\s+',
+    "globals": r'piValue\s+{key}:globals:(\w+)\s+(.+)$'
+}
+# {(piSeedType, className, patternName): compiled pattern}
+seedPatterns: dict[tuple[str, str, str], re.Pattern] = {}
+
+def getSeedPattern(className: str, patternName: str, piSeedType: str = "piClassGC") -> re.Pattern:
+    '''Compiled seedPatternTemplates[patternName] for className, compiled
+       once per process. Use pattern.match(line).'''
+    patternKey = (piSeedType, className, patternName)
+    pattern = seedPatterns.get(patternKey)
+    if pattern is None:
+        seedKey = re.escape(f'{className}.piBody:{piSeedType}')
+        pattern = seedPatterns[patternKey] = re.compile(
+            seedPatternTemplates[patternName].replace('{key}', seedKey))
+    return pattern
+
+# resolved without reading the seed
+piBaseValues = {
+    'pi.piBase:piType': 'pi',
+    'pi.piBase:piTitle': 'pi',
+    'pi.piBase:piSD': 'Smallest particle of Pertinent Information, uesed to define base pis.'
+}
+
+def findPiSeedValue(value: str, seedContent: str) -> str:
+    '''Value of the first seed line containing "piValue {value}", the
+       value itself when there is none.'''
+    valueIndex = seedContent.find(f'piValue {value}')
+    if valueIndex < 0: return value
+    lineStart = seedContent.rfind('\n', 0, valueIndex) + 1
+    lineEnd = seedContent.find('\n', valueIndex)
+    if lineEnd < 0: lineEnd = len(seedContent)
+    lineParts = seedContent[lineStart:lineEnd].split(' ', 2)
+    if len(lineParts) >= 3:
+        return lineParts[2].strip().strip('"\'')
+    return value
+
+class PiSeedQuery():
+    '''
+        piClassGC values of one class in one piSeed, classified in a single
+        pass over the seed lines with patterns compiled once per class.
+        Get one with getPiSeedQuery; treat the values as read only.
+    '''
+    __slots__ = ("seedContent", "className", "argNames", "argTypeLines",
+                 "argTypes", "argValues", "piClassName", "codeValues",
+                 "elegantValues", "_resolvedValues")
+
+    def __init__(self, seedContent: str, className: str) -> None:
+        self.seedContent = seedContent
+        self.className = className
+        self.argNames: dict[str, None] = {}     # argument structs in seed order
+        self.argTypeLines: list[tuple[str, str]] = []
+        self.argTypes: dict[str, str] = {}      # last type line of each argument
+        self.argValues: dict[str, str] = {}     # last value line, unresolved
+        self.piClassName = ""
+        self.codeValues: dict[str, list[str]] = {}  # piValueA lines by element
+        self.elegantValues = False              # an argument value references pi.piBase
+        self._resolvedValues: dict[str, str] = {}
+        argumentPattern = getSeedPattern(className, "argument")
+        piClassNamePattern = getSeedPattern(className, "piClassName")
+        codeValueAPattern = getSeedPattern(className, "codeValueA")
+        argTypePattern = getSeedPattern(className, "initArgType")
+        argValuePattern = getSeedPattern(className, "initArgValue")
+        for line in seedContent.split('\n'):
+            if line[:1].isspace():
+                # indented type lines are kept for extractPiClassTypesFromInitArgs only
+                match = argTypePattern.match(line.strip())
+                if match: self.argTypeLines.append((match.group(1), match.group(2).strip()))
+            elif line.startswith('piValueA'):
+                match = codeValueAPattern.match(line)
+                if match:
+                    # inheritance names are written unquoted
+                    self.codeValues.setdefault(match.group(1), []).append(
+                        match.group(2) if match.group(3) is None else match.group(3))
+            elif line.startswith('piValue'):
+                match = argTypePattern.match(line)
+                if match:
+                    argType = match.group(2).strip()
+                    self.argTypeLines.append((match.group(1), argType))
+                    self.argTypes[match.group(1)] = argType
+                    continue
+                match = argValuePattern.match(line)
+                if match:
+                    self.argValues[match.group(1)] = match.group(2).strip()
+                    if match.group(2).startswith('pi.'): self.elegantValues = True
+                    continue
+                if not self.piClassName:
+                    match = piClassNamePattern.match(line)
+                    if match: self.piClassName = match.group(1).strip()
+            elif line.startswith('piStructC01'):
+                match = argumentPattern.match(line)
+                if match: self.argNames[match.group(1)] = None
+
+    def getCodeValues(self, elementName: str) -> list[str]:
+        '''Quoted values of the piValueA lines of elementName, in seed order.'''
+        return list(self.codeValues.get(elementName, ()))
+
+    def resolveValue(self, value: str) -> str:
+        '''Value a piSeed reference like "pi.piBase:piType" stands for.'''
+        if not value or not value.startswith('pi.'):
+            return value
+        resolvedValue = self._resolvedValues.get(value)
+        if resolvedValue is None:
+            resolvedValue = piBaseValues.get(value)
+            if resolvedValue is None:
+                resolvedValue = findPiSeedValue(value, self.seedContent)
+            self._resolvedValues[value] = resolvedValue
+        return resolvedValue
+
+    def getInitArgs(self) -> dict[str, dict[str, str]]:
+        '''{argName: {"type", "value"}} of the init arguments, with values
+           resolved; a new dict on every call.'''
+        initArgs = {}
+        for argName in self.argNames:
+            argValue = self.argValues.get(argName)
+            initArgs[argName] = {
+                'type': self.argTypes.get(argName, 'str'),
+                'value': self.resolveValue(argValue) if argValue is not None else ''}
+        return initArgs
+
+# {(className, seedContent): PiSeedQuery}. Seed content changes with every
+# splice, so only the most recent queries are kept.
+seedQueries: dict[tuple[str, str], PiSeedQuery] = {}
+maxSeedQueries = 16
+
+def getPiSeedQuery(seedContent: str, className: str) -> PiSeedQuery:
+    '''PiSeedQuery for className in seedContent, reused while the seed
+       content is unchanged.'''
+    queryKey = (className, seedContent)
+    seedQuery = seedQueries.get(queryKey)
+    if seedQuery is None:
+        if len(seedQueries) >= maxSeedQueries:
+            del seedQueries[next(iter(seedQueries))]
+        seedQuery = seedQueries[queryKey] = PiSeedQuery(seedContent, className)
+    return seedQuery
+
+def clearSeedQueries():
+    seedQueries.clear()
@@ -7,7 +7,12 @@ from typing import Dict, List, Tuple, Optional, Set, Any, Union
 from ..logIt import printIt, label
 from ..fileIO import getKeyItem, piGCDirs
 from ..getSeedPath import getSeedPath
-from ...classes.piGenCode import PiGenCode
+from ..piParseCache import getParsedFile, readPythonFile, parseSource
+from ..piProfile import profileDef
+from .piSeedIndex import getPiSeedIndex
+from .piSeedDocument import PiSeedDocument
+from .piSeedQuery import getPiSeedQuery, getSeedPattern, piBaseValues, findPiSeedValue
+from ...classes.piGenCode import PiGenCode, isSlotsFlag, defaultStrReturn, getInheritClassArgs
 
 global options
 global devExept
@@ -87,6 +92,14 @@ def isExactDefaultStrCode(methodCode: List[str], className: str) -> bool:
     # Join the method code
     actualCode = '\n'.join(methodCode).strip()
 
+    # Default __str__ encoding the json() dict in one call
+    if actualCode.startswith('def __str__(self)'):
+        bodyLines = [line.strip() for line in methodCode[1:] if line.strip()]
+        for piClassName in (className, className[:1].upper() + className[1:]):
+            if bodyLines == [defaultStrReturn.format(piClassName=piClassName)] or \
+               bodyLines == [f"return '{piClassName} = {{}}'"]:
+                return True
+
     # Check if it starts with the expected pattern
     if not actualCode.startswith('def __str__(self):'):
         return False
@@ -184,6 +197,8 @@ def isCustomCodeUsingArchitecture(elementType: str, actualCode: List[str], class
         tempGen.jsonCode = []  # Force empty to get default
         tempGen.classComment = []  # Force empty to get default
         tempGen.fromPiClasses = []  # Force empty to get default
+        tempGen.fromImports = {}
+        tempGen.rawFromImports = []
         tempGen.globals = []  # Force empty to get default
         tempGen.preSuperInitCode = []  # Force empty to get default
         tempGen.postSuperInitCode = []  # Force empty to get default
@@ -217,6 +232,9 @@ def isCustomCodeUsingArchitecture(elementType: str, actualCode: List[str], class
             return not isExactDefaultStrCode(actualCode, className)
         return True
 
+# "arg": self.arg item of a default json() dict; Pi type args use their own json()
+defaultJsonItemRE = re.compile(r'"(\w+)": self\.\1(?:\.json\(\)(?: if self\.\1 else None)?)?,?$')
+
 def isDefaultJsonCode(methodCode: List[str], className: str, initArgs: Dict) -> bool:
     """Check if json() method is just the default generated pattern"""
     printIt('isDefaultJsonCode', showDefNames02)
@@ -229,6 +247,22 @@ def isDefaultJsonCode(methodCode: List[str], className: str, initArgs: Dict) ->
     if not codeStr.startswith('def json(self) -> dict:'):
         return False
 
+    # Default json() building one dict: inherited values from
+    # super().json() and "arg": self.arg items for init args only
+    bodyLines = [line.strip() for line in methodCode[1:] if line.strip()]
+    if bodyLines and bodyLines[-1] == 'return rtnDict':
+        if bodyLines[:-1] == ['rtnDict = {}']:
+            return True
+        if len(bodyLines) >= 3 and bodyLines[0] == 'rtnDict = {' and bodyLines[-2] == '}':
+            jsonItems = bodyLines[1:-2]
+            if jsonItems and jsonItems[0].rstrip(',') == '**super().json()':
+                jsonItems = jsonItems[1:]
+            jsonItemMatches = [defaultJsonItemRE.match(jsonItem) for jsonItem in jsonItems]
+            if not all(jsonItemMatches):
+                return False  # an item computes its value
+            if all(match.group(1) in initArgs for match in jsonItemMatches):
+                return True
+
     # Check for the specific default pattern generated by piGenCode
     # Default pattern includes: rtnDict = {
     if 'rtnDict = {' not in codeStr:
@@ -323,72 +357,21 @@ def isDefaultInitAppendCode(codeLines: List[str], initArgs: Dict) -> bool:
 def hasElegantValueReferences(seedContent: str, className: str) -> bool:
     """Check if the seed file uses elegant pi.piBase:field references"""
     printIt('hasElegantValueReferences', showDefNames02)
-    lines = seedContent.split('\n')
-    argValuePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:initArguments:\w+:value\s+pi\.'
-
-    for line in lines:
-        if re.match(argValuePattern, line):
-            return True  # Found elegant reference
-
-    return False
+    return getPiSeedQuery(seedContent, className).elegantValues
 
 
 def extractInitArgsFromSeed(seedContent: str, className: str) -> Dict[str, str]:
     """Extract initArguments from seed content for pattern matching"""
     printIt('extractInitArgsFromSeed', showDefNames02)
-    lines = seedContent.split('\n')
-    initArgs = {}
-
-    argPattern = rf'^piStructC01\s+argument\s+(\w+)\.\s*$'
-
-    for line in lines:
-        match = re.match(argPattern, line)
-        if match:
-            argName = match.group(1)
-            initArgs[argName] = 'str'  # Default type
-
-    return initArgs
+    # 'str' is the default type
+    return {argName: 'str' for argName in getPiSeedQuery(seedContent, className).argNames}
 
 
 def extractInitArgsFromSeedDetailed(seedContent: str, className: str) -> Dict[str, Dict[str, str]]:
     """Extract detailed initArguments from seed content including type and value information"""
     printIt('extractInitArgsFromSeedDetailed', showDefNames02)
-    lines = seedContent.split('\n')
-    initArgs = {}
-
-    # Find argument definitions
-    argPattern = rf'^piStructC01\s+argument\s+(\w+)\.\s*$'
-    typePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:initArguments:(\w+):type\s+(.+)$'
-    valuePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:initArguments:(\w+):value\s+(.+)$'
-
-    # First pass: find all arguments
-    for line in lines:
-        match = re.match(argPattern, line)
-        if match:
-            argName = match.group(1)
-            initArgs[argName] = {'type': 'str', 'value': ''}
-
-    # Second pass: find types and values
-    for line in lines:
-        # Check for type definitions
-        match = re.match(typePattern, line)
-        if match:
-            argName = match.group(1)
-            argType = match.group(2).strip()
-            if argName in initArgs:
-                initArgs[argName]['type'] = argType
-
-        # Check for value definitions
-        match = re.match(valuePattern, line)
-        if match:
-            argName = match.group(1)
-            argValue = match.group(2).strip()
-            if argName in initArgs:
-                # Resolve piSeed references to actual values
-                resolvedValue = resolvePiSeedValue(argValue, seedContent)
-                initArgs[argName]['value'] = resolvedValue
-
-    return initArgs
+    # piSeed references in values are resolved to actual values
+    return getPiSeedQuery(seedContent, className).getInitArgs()
 
 
 def shouldPreserveElegantPattern(seedContent: str, className: str, codeType: str, codeLines: List[str], options: dict = {}) -> bool:
@@ -408,7 +391,8 @@ def shouldPreserveElegantPattern(seedContent: str, className: str, codeType: str
             if (f'rtnStr = "{className} = ' in codeStr and
                 'return rtnStr' in codeStr and
                 'rtnStr +=' in codeStr and
-                    len([line for line in codeLines if line.strip()]) <= 5):  # Very simple default pattern
+                    len([line for line in codeLines if line.strip()]) <= 5) or \
+                    isExactDefaultStrCode(codeLines, className):  # Very simple default pattern
                 if options and options.get('stats', False):
                     printIt(
                         f"PRESERVE: {codeType} for {className} - exact default pattern", label.DEBUG)
@@ -443,9 +427,7 @@ def shouldPreserveElegantPattern(seedContent: str, className: str, codeType: str
         if codeLines and len(codeLines) > 0:
             codeStr = '\n'.join(codeLines)
             # Only preserve if it's the exact default pattern
-            if ('def json(self):' in codeStr and
-                'return {' in codeStr and
-                    len([line for line in codeLines if line.strip()]) <= 10):  # Simple default pattern
+            if 'def json(self)' in codeStr and ('return {' in codeStr or 'rtnDict = {' in codeStr):
                 initArgs = extractInitArgsFromSeed(seedContent, className)
                 isDefault = isDefaultJsonCode(codeLines, className, initArgs)
                 if isDefault:
@@ -525,27 +507,8 @@ def findPiDefGCSeedFile(py_file: Path, dest_dir: str | None = None) -> Optional[
         else:
             py_file_dir = py_file.parent
 
-        # Look for piSeed files that contain piDefGC for this def name
-        seedFiles = list(seedPath.glob(f"*_piDefGC_{defName}.pi"))
-        for seedFile in seedFiles:
-            try:
-                with open(seedFile, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Look for piDefGC line with this def name
-                    fileDirectoryPattern = rf"(piValue {defName}\.piBody:piDefGC:fileDirectory\s+(.+))"
-                    # Search for the pattern in the line
-                    match = re.search(fileDirectoryPattern,
-                                      content, re.MULTILINE)
-                    if match:
-                        # print('content:', content)
-                        rawFileDirectory = match.group(2)
-                        # rawFileDirectory is already clean (no quotes), so use it directly
-                        fileDirectory = rawFileDirectory
-                        if fileDirectory == py_file_dir:
-                            return seedFile
-            except Exception:
-                continue
-        return None
+        # Look up the piDefGC seed file for this def name in the seed index
+        return getPiSeedIndex(seedPath).findSeedFile("piDefGC", defName, py_file_dir)
     except Exception as e:
         if devExept:
             tb_str = ''.join(traceback.format_exception(
@@ -567,26 +530,8 @@ def findPiGenClassSeedFile(py_file: Path, dest_dir: str | None = None) -> Option
         else:
             py_file_dir = py_file.parent
 
-        # Look for piSeed files that contain piGenClass for this class
-        seedFiles = list(seedPath.glob(f"*_piGenClass_{className}.pi"))
-        for seedFile in seedFiles:
-            try:
-                with open(seedFile, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Look for piClassGC line with this def name
-                    fileDirectoryPattern = rf"(piValue {className}\.piBody:piGenClass:fileDirectory\s+'([^']+)')"
-                    # Search for the pattern in the line
-                    match = re.search(fileDirectoryPattern,
-                                      content, re.MULTILINE)
-                    if match:
-                        rawFileDirectory = match.group(2)
-                        # rawFileDirectory is already clean (no quotes), so use it directly
-                        fileDirectory = rawFileDirectory
-                        if fileDirectory == py_file_dir:
-                            return seedFile
-            except Exception:
-                continue
-        return None
+        # Look up the piGenClass seed file for this class in the seed index
+        return getPiSeedIndex(seedPath).findSeedFile("piGenClass", className, py_file_dir)
     except Exception as e:
         if devExept:
             tb_str = ''.join(traceback.format_exception(
@@ -607,24 +552,8 @@ def findPiClassGCSeedFile(py_file: Path, dest_dir: str | None = None) -> Optiona
         else:
             py_file_dir = py_file.parent
 
-        # Look for piSeed files that contain piClassGC for this class
-        seedFiles = list(seedPath.glob(f"*_piClassGC_{className}.pi"))
-
-        for seedFile in seedFiles:
-            try:
-                with open(seedFile, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Look for piClassGC line with this def name
-                    regex_pattern = rf"(piValue {className}\.piBody:piClassGC:fileDirectory\s+'([^']+)')"
-                    # Search for the pattern in the line
-                    match = re.search(regex_pattern, content, re.MULTILINE)
-                    if match:
-                        fileDirectory = match.group(2)
-                        if (fileDirectory) == str(py_file_dir):
-                            return seedFile
-            except Exception:
-                continue
-        return None
+        # Look up the piClassGC seed file for this class in the seed index
+        return getPiSeedIndex(seedPath).findSeedFile("piClassGC", className, str(py_file_dir))
     except Exception as e:
         if devExept:
             tb_str = ''.join(traceback.format_exception(None, e, e.__traceback__))
@@ -640,8 +569,7 @@ def isPythonFileDefType(filePath: Path) -> bool:
     """
     printIt('isPythonFileDefType', showDefNames02)
     try:
-        with open(filePath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = readPythonFile(filePath)
 
         # Count class definitions vs function definitions
         class_count = len(re.findall(r'^class\s+\w+', content, re.MULTILINE))
@@ -743,6 +671,7 @@ def getDestDirForFile(py_file: Path, options) -> str:
     # Use Path.joinpath to join the final parts
     return str(Path().joinpath(*final_parts))
 
+@profileDef("sync", "detect type")
 def determineOptimalPiSeedType(pythonFile: Path) -> str:
     """
     Determine the optimal piSeed type for a Python file:
@@ -752,12 +681,13 @@ def determineOptimalPiSeedType(pythonFile: Path) -> str:
     """
     printIt('determineOptimalPiSeedType', showDefNames02)
     try:
-        with open(pythonFile, 'r', encoding='utf-8') as f:
-            content = f.read()
+        parsedFile = getParsedFile(pythonFile)
+        if parsedFile.seedType:
+            return parsedFile.seedType
 
         # Try to parse the Python file - handle syntax errors gracefully
         try:
-            tree = ast.parse(content)
+            tree = parsedFile.tree
         except SyntaxError as e:
             printIt(
                 f"WARN: Syntax error in {pythonFile.name}: {e}. Skipping file type analysis.", label.WARN)
@@ -780,12 +710,13 @@ def determineOptimalPiSeedType(pythonFile: Path) -> str:
                 functions.append(node)
         # Decision logic
         if len(classes) == 0:
-            return "piDefGC"  # No classes, use function definitions
+            seedType = "piDefGC"  # No classes, use function definitions
         elif len(classes) > 1:
-            return "piGenClass"  # Multiple classes, use piGenClass
-        elif len(classes) == 1:
+            seedType = "piGenClass"  # Multiple classes, use piGenClass
+        else:
             # Single class - check complexity
             class_node = classes[0]
+            seedType = "piGenClass"  # Has inheritance, use piGenClass
 
             # Check for inheritance
             if class_node.bases:
@@ -795,8 +726,9 @@ def determineOptimalPiSeedType(pythonFile: Path) -> str:
                     if isinstance(base_node, ast.Name):
                         inherited_classes.append(base_node.id)
                 if 'PiPi' in inherited_classes:
-                    return "piClassGC"
-            return "piGenClass"  # Has inheritance, use piGenClass
+                    seedType = "piClassGC"
+        parsedFile.seedType = seedType
+        return seedType
 
     except Exception as e:
         if devExept:
@@ -1089,102 +1021,74 @@ def extractMethodCode(method_name: str, pythonContent: str, methodNode: ast.Func
         printIt(f"Error extracting method code: {e}", label.ERROR)
         return isPropertry, []
 
-def updateSeedCodeElement(seedContent: str, className: str, codeElementName: str, methodCode: List[str]) -> Tuple[str, bool]:
+@profileDef("sync element", "code element")
+def updateSeedCodeElement(seedDoc: PiSeedDocument, className: str, codeElementName: str, methodCode: List[str]) -> bool:
     """
-    Update a code element in the piSeed file content with proper ordering.
-    Returns (updated_content, was_changed)
+    Update a code element in the piSeed document with proper ordering.
+    Returns was_changed; seedDoc is only spliced when the code changed.
     """
     printIt('updateSeedCodeElement', showDefNames03)
     try:
-        lines = seedContent.split('\n')
-        newLines = []
-        changed = False
-
-        # Pattern to match the specific code element
-        elementPattern = rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:{re.escape(codeElementName)}\s+'
-
-        # Extract existing code element content for comparison
-        existingCode = []
-        i = 0
-        foundElement = False
+        elementTitle = f'{className}.piBody:piClassGC:{codeElementName}'
+        elementLineNos = seedDoc.findValues('piValueA', elementTitle)
+
+        if elementLineNos:
+            # Extract existing code lines from the first block of the element
+            startLineNo = elementLineNos[0]
+            i = startLineNo
+            existingCode = []
+            for lineNo in elementLineNos:
+                if lineNo != i:
+                    break
+                # Extract the quoted content
+                elementValue = seedDoc.getValue(lineNo)
+                if len(elementValue) > 1 and elementValue[0] == '"' and elementValue[-1] == '"':
+                    # Unescape quotes and normalize for comparison
+                    existingCode.append(elementValue[1:-1].replace('\\"', '"'))
+                i += 1
 
-        while i < len(lines):
-            line = lines[i]
+            # Normalize both existing and new code for comparison
+            # Remove trailing empty lines for comparison but preserve internal structure
+            def normalizeCodeForComparison(codeLines):
+                # Remove trailing empty lines
+                while codeLines and not codeLines[-1].strip():
+                    codeLines.pop()
+                return [line.strip() for line in codeLines if line.strip() or any(codeLines[i+1:])]
 
-            # Check if this line matches our code element pattern
-            if re.match(elementPattern, line):
-                if not foundElement:
-                    foundElement = True
-                    # Extract existing code lines
-                    while i < len(lines) and re.match(elementPattern, lines[i]):
-                        # Extract the quoted content
-                        match = re.match(
-                            rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:{re.escape(codeElementName)}\s+"(.*)"$', lines[i])
-                        if match:
-                            # Unescape quotes and normalize for comparison
-                            existingLine = match.group(1).replace('\\"', '"')
-                            existingCode.append(existingLine)
-                        i += 1
+            normalizedExisting = normalizeCodeForComparison(existingCode.copy())
+            normalizedNew = normalizeCodeForComparison(methodCode.copy())
 
-                    # Normalize both existing and new code for comparison
-                    # Remove trailing empty lines for comparison but preserve internal structure
-                    def normalizeCodeForComparison(codeLines):
-                        # Remove trailing empty lines
-                        while codeLines and not codeLines[-1].strip():
-                            codeLines.pop()
-                        return [line.strip() for line in codeLines if line.strip() or any(codeLines[i+1:])]
-
-                    normalizedExisting = normalizeCodeForComparison(
-                        existingCode.copy())
-                    normalizedNew = normalizeCodeForComparison(
-                        methodCode.copy())
-
-                    # Compare normalized code
-                    if normalizedExisting != normalizedNew:
-                        # Content is different, replace with new code
-                        for codeLine in methodCode:
-                            # Escape quotes in code lines properly
-                            escapedCode = escapeQuotesForPiSeed(codeLine)
-                            newLines.append(
-                                f'piValueA {className}.piBody:piClassGC:{codeElementName} "{escapedCode}"')
-                        changed = True
-                    else:
-                        # Content is the same, keep existing code (preserve original formatting)
-                        for existingLine in existingCode:
-                            # Keep the original escaped format from the piSeed
-                            originalEscaped = existingLine.replace('"', '\\"')
-                            newLines.append(
-                                f'piValueA {className}.piBody:piClassGC:{codeElementName} "{originalEscaped}"')
-                        # No change needed
-                        for existingLine in existingCode:
-                            escapedCode = existingLine.replace('"', '\\"')
-                            newLines.append(
-                                f'piValueA {className}.piBody:piClassGC:{codeElementName} "{escapedCode}"')
-                    continue
-                else:
-                    # Skip remaining lines (already processed above)
-                    i += 1
-                    continue
-            else:
-                newLines.append(line)
-                i += 1
+            # Content is the same, keep existing code (preserve original formatting)
+            if normalizedExisting == normalizedNew:
+                return False
 
-        # If we didn't find the element, add it in the correct position
-        if not foundElement:
-            insertIndex = findCorrectInsertionPosition(
-                newLines, className, codeElementName)
-            # Insert new code element at the correct position
-            for idx, codeLine in enumerate(methodCode):
+            # Content is different, replace the first block with new code and
+            # drop any other lines of this element
+            for lineNo in reversed(elementLineNos):
+                if lineNo >= i:
+                    seedDoc.splice(lineNo, lineNo + 1, [])
+            newLines = []
+            for codeLine in methodCode:
+                # Escape quotes in code lines properly
                 escapedCode = escapeQuotesForPiSeed(codeLine)
-                newLines.insert(
-                    insertIndex + idx, f'piValueA {className}.piBody:piClassGC:{codeElementName} "{escapedCode}"')
-            changed = True
+                newLines.append(f'piValueA {elementTitle} "{escapedCode}"')
+            seedDoc.splice(startLineNo, i, newLines)
+            return True
 
-        return '\n'.join(newLines), changed
+        # If we didn't find the element, add it in the correct position
+        insertIndex = findCorrectInsertionPosition(
+            seedDoc.lines, className, codeElementName)
+        # Insert new code element at the correct position
+        newLines = []
+        for codeLine in methodCode:
+            escapedCode = escapeQuotesForPiSeed(codeLine)
+            newLines.append(f'piValueA {elementTitle} "{escapedCode}"')
+        seedDoc.splice(insertIndex, insertIndex, newLines)
+        return True
 
     except Exception as e:
         printIt(f"Error updating seed code element: {e}", label.ERROR)
-        return seedContent, False
+        return False
 
 def findCorrectInsertionPosition(lines: List[str], className: str, codeElementName: str) -> int:
     """
@@ -1200,9 +1104,10 @@ def findCorrectInsertionPosition(lines: List[str], className: str, codeElementNa
     7. postSuperInitCode (if present)
     8. initAppendCode (if present)
     9. genProps (if present)
-    10. strCode ←
-    11. jsonCode
-    12. classDefCode
+    10. slots (if present)
+    11. strCode ←
+    12. jsonCode
+    13. classDefCode
     """
     printIt(f'findCorrectInsertionPosition: {className}', showDefNames)
     #print(codeElementName)
@@ -1218,6 +1123,7 @@ def findCorrectInsertionPosition(lines: List[str], className: str, codeElementNa
         'postSuperInitCode',
         'initAppendCode',
         'genProps',
+        'slots',
         'strCode',
         'jsonCode',
         'classDefCode'
@@ -1231,43 +1137,15 @@ def findCorrectInsertionPosition(lines: List[str], className: str, codeElementNa
 
     # Find the last occurrence of elements that should come before our target
     insertIndex = 0
-    classPattern = rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:(\w+)'
-    structPattern = rf'^piStruct[AC]\d+\s+{re.escape(className)}\.piBody:piClassGC:(\w+)'
-    valuePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:(\w+)'
+    # piValueA, piStruct (like initArguments) and piValue (like piClassName) elements
+    elementPattern = getSeedPattern(className, "element")
+    elementsBefore = set(elementOrder[:targetIndex])
 
     for i, line in enumerate(lines):
-        # Check for piValueA elements
-        match = re.match(classPattern, line)
-        if match:
-            elementName = match.group(1)
-            try:
-                elementIndex = elementOrder.index(elementName)
-                if elementIndex < targetIndex:
-                    insertIndex = i + 1
-            except ValueError:
-                pass
-
-        # Check for piStruct elements (like initArguments)
-        match = re.match(structPattern, line)
-        if match:
-            elementName = match.group(1)
-            try:
-                elementIndex = elementOrder.index(elementName)
-                if elementIndex < targetIndex:
-                    insertIndex = i + 1
-            except ValueError:
-                pass
-
-        # Check for piValue elements (like piClassName)
-        match = re.match(valuePattern, line)
-        if match:
-            elementName = match.group(1)
-            try:
-                elementIndex = elementOrder.index(elementName)
-                if elementIndex < targetIndex:
-                    insertIndex = i + 1
-            except ValueError:
-                pass
+        if line.startswith('piValue') or line.startswith('piStruct'):
+            match = elementPattern.match(line)
+            if match and match.group(1) in elementsBefore:
+                insertIndex = i + 1
 
     return insertIndex
 
@@ -1314,48 +1192,23 @@ def generateExpectedDefaultStrCode(className: str, initArgs: Dict[str, Dict[str,
 
         lines = []
         # No class-level indentation - piGenCode will add it during generation
-        lines.append("def __str__(self):")
+        lines.append("def __str__(self) -> str:")
 
         # Use the actual piClassName from the piSeed, not the lowercase version
         actualClassName = getActualClassName(
             seedContent, className) if seedContent else className
 
-        # Handle inheritance - if class has inheritance, generate super() call pattern
-        if inheritance and len(inheritance) > 0:
-            # For inherited classes, piGenCode generates a simple super() call
+        if 'PiPi' in inheritance:
+            # PiPi classes use the PiPi string
+            lowerClassName = actualClassName[0].lower() + actualClassName[1:]
+            lines.append(f'    """ return string of {lowerClassName} json """')
             lines.append("    rtnStr = super().__str__()")
             lines.append("    return rtnStr")
-            lines.append("")
-            return lines
-
-        # Handle regular parameters for non-inherited classes
-        lines.append(f'    rtnStr = "{actualClassName} = ' + '{\\n"')
-
-        param_names = list(initArgs.keys())
-        for i, param_name in enumerate(param_names):
-            param_info = initArgs[param_name]
-            param_type = param_info.get("type", "str")
-
-            if param_type.startswith("Pi"):
-                # Complex Pi type handling - skip for now
-                pass
-            elif param_type.startswith("pi"):
-                # Complex pi type handling - skip for now
-                pass
-            else:
-                # Simple parameter - generate exact format
-                if i == len(param_names) - 1:
-                    # Last parameter - no comma
-                    lines.append(
-                        f'    rtnStr += f\'    "{param_name}":"{{self.{param_name}}}"\\n\'')
-                else:
-                    # Not last parameter - include comma
-                    lines.append(
-                        f'    rtnStr += f\'    "{param_name}":"{{self.{param_name}}}",\\n\'')
-
-        lines.append('    rtnStr += "}"')
-        lines.append('    return rtnStr')
-        lines.append('')
+        elif initArgs or inheritance:
+            # The json() dict encoded in one call
+            lines.append('    ' + defaultStrReturn.format(piClassName=actualClassName))
+        else:
+            lines.append(f"    return '{actualClassName} = {{}}'")
 
         return lines
 
@@ -1364,10 +1217,11 @@ def generateExpectedDefaultStrCode(className: str, initArgs: Dict[str, Dict[str,
         return []
 
 
-def extractJsonCodeWithComparison(pythonContent: str, jsonNode: ast.FunctionDef, className: str, seedContent: str) -> List[str]:
+def extractJsonCodeWithComparison(pythonContent: str, jsonNode: ast.FunctionDef, className: str, seedContent: str, classDir: str = "") -> List[str]:
     """
     Enhanced version that compares actual json() method with expected default method from piGenCode.
     This prevents capturing auto-generated jsonCode as custom modifications.
+    classDir is the directory of the python file, where the inherited classes are read from.
     """
     printIt('extractJsonCodeWithComparison', showDefNames03)
     try:
@@ -1382,7 +1236,7 @@ def extractJsonCodeWithComparison(pythonContent: str, jsonNode: ast.FunctionDef,
         initArgs = extractInitArgsFromSeedDetailed(seedContent, className)
         inheritance = extractInheritanceFromSeed(seedContent, className)
         expectedDefaultJsonCode = generateExpectedDefaultJsonCode(
-            className, initArgs, inheritance, seedContent)
+            className, initArgs, inheritance, seedContent, classDir)
 
         if not expectedDefaultJsonCode:
             # Can't generate expected default, return actual (safe fallback)
@@ -1404,10 +1258,12 @@ def extractJsonCodeWithComparison(pythonContent: str, jsonNode: ast.FunctionDef,
         return extractJsonCode_original(pythonContent, jsonNode, className)
 
 
-def generateExpectedDefaultJsonCode(className: str, initArgs: Dict[str, Dict[str, str]], inheritance: List[str] = [], seedContent: str = "") -> List[str]:
+def generateExpectedDefaultJsonCode(className: str, initArgs: Dict[str, Dict[str, str]], inheritance: List[str] = [], seedContent: str = "", classDir: str = "") -> List[str]:
     """
     Generate the expected default json() method that piGenCode would create
-    when no jsonCode is present in the piSeed file.
+    when no jsonCode is present in the piSeed file. Arguments of inherited Pi
+    classes, read from their python files in classDir (piClassGCDir when not
+    given), come from super().json().
     """
     printIt('generateExpectedDefaultJsonCode', showDefNames03)
     try:
@@ -1417,47 +1273,50 @@ def generateExpectedDefaultJsonCode(className: str, initArgs: Dict[str, Dict[str
         lines = []
         # No class-level indentation - piGenCode will add it during generation
         lines.append("def json(self) -> dict:")
-        lines.append("    rtnDict = {")
-
-        # Handle inheritance - piGenCode has complex logic for inherited classes
-        if inheritance and len(inheritance) > 0:
-            # For inherited classes, piGenCode generates complex inheritance handling
-            # This is very complex to replicate exactly, so for now we'll be conservative
-            # and not try to match inherited class json methods exactly
-            # This means inherited classes with default json methods might be synced
-            # but that's safer than missing custom methods
-            lines.append("    }")
+
+        if 'PiPi' in inheritance:
+            actualClassName = getActualClassName(
+                seedContent, className) if seedContent else className
+            lowerClassName = actualClassName[0].lower() + actualClassName[1:]
+            lines.append(f'    """ return dict of {lowerClassName} json """')
+            lines.append("    rtnDict = super().json()")
             lines.append("    return rtnDict")
-            lines.append("")
-            lines.append("")
             return lines
 
-        # Handle regular parameters for non-inherited classes
-        param_names = list(initArgs.keys())
-        for i, param_name in enumerate(param_names):
-            param_info = initArgs[param_name]
-            param_type = param_info.get("type", "str")
+        jsonItems = []
+        inheritArgs = {}
+        for inheritClass in inheritance:
+            if inheritClass[:2] == 'Pi':
+                parameters = getInheritClassArgs(inheritClass, classDir or getKeyItem(piGCDirs[2]))
+                if parameters and not inheritArgs:
+                    jsonItems.append('**super().json()')
+                inheritArgs.update(parameters)
 
+        for param_name, param_info in initArgs.items():
+            param_type = param_info.get("type", "str")
+            param_value = str(param_info.get("value", ""))
+            if param_name == 'fileName' or param_name in inheritArgs:
+                # piGenCode skips fileName and the inherited arguments
+                continue
             if param_type.startswith("Pi"):
-                # Complex Pi type handling - skip for now
-                pass
-            elif param_type.startswith("pi"):
-                # Complex pi type handling - skip for now
-                pass
-            elif param_name != 'fileName':  # piGenCode skips fileName parameter
-                # Simple parameter - generate exact format
-                if i == len(param_names) - 1:
-                    # Last parameter - no comma
-                    lines.append(f'        "{param_name}": self.{param_name}')
+                # Pi type values come from their own json()
+                if 'None' in param_type or param_value.lower() == 'none':
+                    jsonItems.append(f'"{param_name}": self.{param_name}.json() if self.{param_name} else None')
                 else:
-                    # Not last parameter - include comma
-                    lines.append(f'        "{param_name}": self.{param_name},')
+                    jsonItems.append(f'"{param_name}": self.{param_name}.json()')
+            elif param_type.startswith("pi") and param_type[:1].upper() + param_type[1:] in inheritance:
+                continue
+            else:
+                jsonItems.append(f'"{param_name}": self.{param_name}')
 
-        lines.append('    }')
+        if jsonItems:
+            lines.append("    rtnDict = {")
+            lines.extend(f'        {jsonItem},' for jsonItem in jsonItems)
+            lines[-1] = lines[-1][:-1]  # no comma after the last item
+            lines.append('    }')
+        else:
+            lines.append("    rtnDict = {}")
         lines.append('    return rtnDict')
-        lines.append('')  # Add blank line to match actual extraction
-        # Add second blank line to match actual extraction pattern
-        lines.append('')
 
         return lines
 
@@ -1536,32 +1395,14 @@ def extractStrCodeWithComparison(pythonContent: str, strNode: ast.FunctionDef, c
 def getActualClassName(seedContent: str, className: str) -> str:
     """Get the actual piClassName from the piSeed content"""
     printIt('getActualClassName', showDefNames03)
-    lines = seedContent.split('\n')
-
-    for line in lines:
-        match = re.match(
-            rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:piClassName\s+(.+)$', line)
-        if match:
-            return match.group(1).strip()
-
     # Fallback to the provided className
-    return className
+    return getPiSeedQuery(seedContent, className).piClassName or className
 
 
 def extractInheritanceFromSeed(seedContent: str, className: str) -> List[str]:
     """Extract inheritance information from piSeed content"""
     printIt('extractInheritanceFromSeed', showDefNames03)
-    inheritance = []
-    lines = seedContent.split('\n')
-
-    for line in lines:
-        if f'{className}.piBody:piClassGC:inheritance' in line:
-            match = re.match(
-                rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:inheritance\s+"(.+)"$', line)
-            if match:
-                inheritance.append(match.group(1))
-
-    return inheritance
+    return getPiSeedQuery(seedContent, className).getCodeValues('inheritance')
 
 
 def extractStrCode_original(pythonContent: str, strNode: ast.FunctionDef, className: str) -> List[str]:
@@ -1640,26 +1481,12 @@ def resolvePiSeedValue(value: str, seedContent: str) -> str:
         # This is a simplified resolution - in a full implementation, we'd load the actual pi structure
 
         # Common mappings based on the piSeed structure
-        valueMap = {
-            'pi.piBase:piType': 'pi',
-            'pi.piBase:piTitle': 'pi',
-            'pi.piBase:piSD': 'Smallest particle of Pertinent Information, uesed to define base pis.'
-        }
-
-        if value in valueMap:
-            return valueMap[value]
+        if value in piBaseValues:
+            return piBaseValues[value]
 
         # If not found in map, try to extract from seedContent
-        # Look for piValuesSetD definitions
-        lines = seedContent.split('\n')
-        for line in lines:
-            if f'piValue {value}' in line:
-                parts = line.split(' ', 2)
-                if len(parts) >= 3:
-                    return parts[2].strip().strip('"\'')
-
-        # If still not found, return the original value
-        return value
+        # Look for piValuesSetD definitions; the original value if still not found
+        return findPiSeedValue(value, seedContent)
 
     except Exception as e:
         printIt(f"Error resolving piSeed value {value}: {e}", label.DEBUG)
@@ -1708,39 +1535,16 @@ def generateExpectedInitComponents(seedContent: str, className: str) -> Dict[str
     printIt('generateExpectedInitComponents', showDefNames03)
     try:
         # Extract existing piSeed components
-        lines = seedContent.split('\n')
+        seedQuery = getPiSeedQuery(seedContent, className)
 
         # Extract initArguments
-        initArgs = extractInitArgsFromSeedDetailed(seedContent, className)
+        initArgs = seedQuery.getInitArgs()
 
         # Extract existing code components from piSeed
-        preSuperInitCode: list[str] = []
-        postSuperInitCode: list[str] = []
-        initAppendCode: list[str] = []
-        inheritance: list[str] = []
-
-        # Parse existing piSeed for these components
-        for line in lines:
-            if f'{className}.piBody:piClassGC:preSuperInitCode' in line:
-                match = re.match(
-                    rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:preSuperInitCode\s+"(.+)"$', line)
-                if match:
-                    preSuperInitCode.append(match.group(1))
-            elif f'{className}.piBody:piClassGC:postSuperInitCode' in line:
-                match = re.match(
-                    rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:postSuperInitCode\s+"(.+)"$', line)
-                if match:
-                    postSuperInitCode.append(match.group(1))
-            elif f'{className}.piBody:piClassGC:initAppendCode' in line:
-                match = re.match(
-                    rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:initAppendCode\s+"(.+)"$', line)
-                if match:
-                    initAppendCode.append(match.group(1))
-            elif f'{className}.piBody:piClassGC:inheritance' in line:
-                match = re.match(
-                    rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:inheritance\s+"(.+)"$', line)
-                if match:
-                    inheritance.append(match.group(1))
+        preSuperInitCode = seedQuery.getCodeValues('preSuperInitCode')
+        postSuperInitCode = seedQuery.getCodeValues('postSuperInitCode')
+        initAppendCode = seedQuery.getCodeValues('initAppendCode')
+        inheritance = seedQuery.getCodeValues('inheritance')
 
         # Generate expected method signature
         signature_parts = ['def __init__(self']
@@ -1784,11 +1588,12 @@ def parseActualInitMethod(pythonContent: str, initNode: ast.FunctionDef, classNa
         lines = pythonContent.split('\n')
         startLine = initNode.lineno - 1
 
-        # Find method end
+        # Find method end, after the body starts: the closing '):' of a
+        # signature split over lines is indented like the def line
         endLine = len(lines)
         methodIndent = len(lines[startLine]) - len(lines[startLine].lstrip())
 
-        for i in range(startLine + 1, len(lines)):
+        for i in range(initNode.body[0].lineno - 1, len(lines)):
             if lines[i].strip() and len(lines[i]) - len(lines[i].lstrip()) <= methodIndent:
                 endLine = i
                 break
@@ -1821,6 +1626,9 @@ def parseActualInitMethod(pythonContent: str, initNode: ast.FunctionDef, classNa
         # Remove trailing empty lines
         while bodyLines and not bodyLines[-1].strip():
             bodyLines.pop()
+        # piGenCode writes pass for an __init__ without arguments or code
+        if [line.strip() for line in bodyLines] == ['pass']:
+            bodyLines = []
 
         # Get expected standard assignments from the method signature
         expectedAssignments = extractExpectedAssignments(signature)
@@ -2239,209 +2047,203 @@ def escapeValueForPiSeed(value: str) -> str:
     return f'"{escaped_value}"'
 
 
-def updateSeedInitArguments(seedContent: str, className: str, initArgs: Dict[str, Dict[str, str]]) -> Tuple[str, bool]:
+@profileDef("sync element", "initArguments")
+def updateSeedInitArguments(seedDoc: PiSeedDocument, className: str, initArgs: Dict[str, Dict[str, str]]) -> bool:
     """
-    Update initArguments in the piSeed file content.
-    Returns (updated_content, was_changed)
+    Update initArguments in the piSeed document.
+    Returns was_changed; seedDoc is only spliced when something changed.
     """
     printIt('updateSeedInitArguments', showDefNames03)
     try:
-        lines = seedContent.split('\n')
-        newLines = []
+        lines = seedDoc.lines
+        sectionSplices = []
         changed = False
 
         # Patterns to match initArguments entries
-        structPattern = rf'^piStructA00\s+{re.escape(className)}\.piBody:piClassGC:initArguments\s*$'
-        argStructPattern = rf'^piStructC01\s+argument\s+(\w+)\.\s*$'
-        argTypePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:initArguments:(\w+):type\s+'
-        argValuePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:initArguments:(\w+):value\s+'
+        structTitle = f'{className}.piBody:piClassGC:initArguments'
+        argStructPattern = getSeedPattern(className, "argument")
+        argTypePattern = getSeedPattern(className, "initArgTypeKey")
+        argValuePattern = getSeedPattern(className, "initArgValueKey")
 
         # Extract existing arguments for comparison
         existingArgs = {}
-        i = 0
-        foundInitArgs = False
+        structLineNos = seedDoc.findStructs('piStructA00', structTitle)
 
-        while i < len(lines):
-            line = lines[i]
+        # Each initArguments structure declaration is followed by its arguments
+        for structLineNo in structLineNos:
+            i = structLineNo + 1
+            newLines = []
 
-            # Check if we found the initArguments structure declaration
-            if re.match(structPattern, line):
-                foundInitArgs = True
-                newLines.append(line)
-                i += 1
+            # Extract existing argument definitions
+            while i < len(lines):
+                line = lines[i]
 
-                # Extract existing argument definitions
-                while i < len(lines):
-                    line = lines[i]
+                # Extract argument structure declarations
+                argStructMatch = argStructPattern.match(line)
+                if argStructMatch:
+                    argName = argStructMatch.group(1)
+                    if argName not in existingArgs:
+                        existingArgs[argName] = {
+                            'type': 'str', 'value': '""'}
+                    i += 1
+                    continue
 
-                    # Extract argument structure declarations
-                    argStructMatch = re.match(argStructPattern, line)
-                    if argStructMatch:
-                        argName = argStructMatch.group(1)
+                # Extract argument type definitions
+                argTypeMatch = argTypePattern.match(line)
+                if argTypeMatch:
+                    argName = argTypeMatch.group(1)
+                    # Extract the type part after the pattern
+                    typeAfterPattern = argTypePattern.match(line)
+                    if typeAfterPattern:
+                        typePart = line[typeAfterPattern.end():].strip()
                         if argName not in existingArgs:
                             existingArgs[argName] = {
                                 'type': 'str', 'value': '""'}
+                        existingArgs[argName]['type'] = typePart
                         i += 1
                         continue
-
-                    # Extract argument type definitions
-                    argTypeMatch = re.match(argTypePattern, line)
-                    if argTypeMatch:
-                        argName = argTypeMatch.group(1)
-                        # Extract the type part after the pattern
-                        typeAfterPattern = re.match(argTypePattern, line)
-                        if typeAfterPattern:
-                            typePart = line[typeAfterPattern.end():].strip()
-                            if argName not in existingArgs:
-                                existingArgs[argName] = {
-                                    'type': 'str', 'value': '""'}
-                            existingArgs[argName]['type'] = typePart
-                            i += 1
-                            continue
-                        else:
-                            printIt(
-                                f'No type part after pattern for line: {line.strip()}', label.WARN)
-                            i += 1  # Always advance to prevent infinite loop
-                            continue
-                    # Extract argument value definitions
-                    argValueMatch = re.match(argValuePattern, line)
-                    if argValueMatch:
-                        argName = argValueMatch.group(1)
-                        # Extract the value part after the pattern - use argValuePattern not argTypePattern!
-                        valueAfterPattern = re.match(argValuePattern, line)
-                        if valueAfterPattern:
-                            valuePart = line[valueAfterPattern.end():].strip()
-                            if argName not in existingArgs:
-                                existingArgs[argName] = {
-                                    'type': 'str', 'value': '""'}
-                            existingArgs[argName]['value'] = valuePart
-                            i += 1
-                        else:
-                            printIt(
-                                f'No value part after pattern for line: {line.strip()}', label.WARN)
-                            i += 1  # Always advance to prevent infinite loop
+                    else:
+                        printIt(
+                            f'No type part after pattern for line: {line.strip()}', label.WARN)
+                        i += 1  # Always advance to prevent infinite loop
                         continue
+                # Extract argument value definitions
+                argValueMatch = argValuePattern.match(line)
+                if argValueMatch:
+                    argName = argValueMatch.group(1)
+                    # Extract the value part after the pattern - use argValuePattern not argTypePattern!
+                    valueAfterPattern = argValuePattern.match(line)
+                    if valueAfterPattern:
+                        valuePart = line[valueAfterPattern.end():].strip()
+                        if argName not in existingArgs:
+                            existingArgs[argName] = {
+                                'type': 'str', 'value': '""'}
+                        existingArgs[argName]['value'] = valuePart
+                        i += 1
+                    else:
+                        printIt(
+                            f'No value part after pattern for line: {line.strip()}', label.WARN)
+                        i += 1  # Always advance to prevent infinite loop
+                    continue
 
-                    # If we reach here, we're done with initArguments section
-                    break
+                # If we reach here, we're done with initArguments section
+                break
 
-                # Compare existing arguments with new arguments
-                # Normalize both for comparison to avoid unnecessary changes
-                def normalizeArgValue(value):
-                    """Normalize argument values for comparison"""
-                    if not value:
-                        return '""'
+            # Compare existing arguments with new arguments
+            # Normalize both for comparison to avoid unnecessary changes
+            def normalizeArgValue(value, argType=''):
+                """Normalize argument values for comparison"""
+                if not value:
+                    # genCode defaults an empty Pi class argument to its constructor
+                    if argType[:2] == 'Pi': return f'{argType}()'
+                    return '""'
+
+                # Handle None values consistently - all None representations should be treated as equivalent
+                valueStr = str(value).strip()
+                if valueStr in ["'None'", '"None"', 'None']:
+                    return 'None'  # Canonical form for comparison
+
+                # Unescape quotes for comparison
+                normalized = valueStr.replace('\\"', '"')
+
+                # If it's a list with escaped quotes, normalize it
+                if normalized.startswith('[') and '\\"' in valueStr:
+                    # This handles cases like [\"stduser\"] vs ["stduser"]
+                    normalized = valueStr.replace('\\"', '"')
 
-                    # Handle None values consistently - all None representations should be treated as equivalent
-                    valueStr = str(value).strip()
-                    if valueStr in ["'None'", '"None"', 'None']:
-                        return 'None'  # Canonical form for comparison
+                return normalized
 
-                    # Unescape quotes for comparison
-                    normalized = valueStr.replace('\\"', '"')
+            # Normalize existing arguments for comparison
+            normalizedExisting = {}
+            for argName, argInfo in existingArgs.items():
+                normalizedExisting[argName] = {
+                    'type': argInfo['type'],
+                    'value': normalizeArgValue(argInfo['value'], argInfo['type'])
+                }
 
-                    # If it's a list with escaped quotes, normalize it
-                    if normalized.startswith('[') and '\\"' in valueStr:
-                        # This handles cases like [\"stduser\"] vs ["stduser"]
-                        normalized = valueStr.replace('\\"', '"')
+            # Normalize new arguments for comparison
+            normalizedNew = {}
+            for argName, argInfo in initArgs.items():
+                normalizedNew[argName] = {
+                    'type': argInfo['type'],
+                    'value': normalizeArgValue(argInfo['value'], argInfo['type'])
+                }
 
-                    return normalized
+            # STRICT IDEMPOTENCY: Only change if normalized values are actually different
+            if normalizedExisting == normalizedNew:
+                # Values are equivalent after normalization, keep existing format for idempotency
+                for argName, argInfo in existingArgs.items():
+                    newLines.append(f'piStructC01 argument {argName}.')
 
-                # Normalize existing arguments for comparison
-                normalizedExisting = {}
                 for argName, argInfo in existingArgs.items():
-                    normalizedExisting[argName] = {
-                        'type': argInfo['type'],
-                        'value': normalizeArgValue(argInfo['value'])
-                    }
+                    newLines.append(
+                        f'piValue {className}.piBody:piClassGC:initArguments:{argName}:type {argInfo["type"]}')
+                    newLines.append(
+                        f'piValue {className}.piBody:piClassGC:initArguments:{argName}:value {argInfo["value"]}')
+                # No change needed for idempotency
+            elif normalizedExisting != normalizedNew:
+                # Arguments are different, add new argument definitions
+                for argName, argInfo in initArgs.items():
+                    newLines.append(f'piStructC01 argument {argName}.')
 
-                # Normalize new arguments for comparison
-                normalizedNew = {}
                 for argName, argInfo in initArgs.items():
-                    normalizedNew[argName] = {
-                        'type': argInfo['type'],
-                        'value': normalizeArgValue(argInfo['value'])
-                    }
+                    escapedValue = escapeValueForPiSeed(argInfo["value"])
+                    newLines.append(
+                        f'piValue {className}.piBody:piClassGC:initArguments:{argName}:type {argInfo["type"]}')
+                    newLines.append(
+                        f'piValue {className}.piBody:piClassGC:initArguments:{argName}:value {escapedValue}')
 
-                # STRICT IDEMPOTENCY: Only change if normalized values are actually different
-                if normalizedExisting == normalizedNew:
-                    # Values are equivalent after normalization, keep existing format for idempotency
-                    for argName, argInfo in existingArgs.items():
-                        newLines.append(f'piStructC01 argument {argName}.')
-
-                    for argName, argInfo in existingArgs.items():
-                        newLines.append(
-                            f'piValue {className}.piBody:piClassGC:initArguments:{argName}:type {argInfo["type"]}')
-                        newLines.append(
-                            f'piValue {className}.piBody:piClassGC:initArguments:{argName}:value {argInfo["value"]}')
-                    # No change needed for idempotency
-                elif normalizedExisting != normalizedNew:
-                    # Arguments are different, add new argument definitions
-                    for argName, argInfo in initArgs.items():
-                        newLines.append(f'piStructC01 argument {argName}.')
-
-                    for argName, argInfo in initArgs.items():
-                        escapedValue = escapeValueForPiSeed(argInfo["value"])
-                        newLines.append(
-                            f'piValue {className}.piBody:piClassGC:initArguments:{argName}:type {argInfo["type"]}')
-                        newLines.append(
-                            f'piValue {className}.piBody:piClassGC:initArguments:{argName}:value {escapedValue}')
-
-                    changed = True
-                else:
-                    # Arguments are the same, keep existing definitions
-                    for argName, argInfo in existingArgs.items():
-                        newLines.append(f'piStructC01 argument {argName}.')
+                changed = True
+            else:
+                # Arguments are the same, keep existing definitions
+                for argName, argInfo in existingArgs.items():
+                    newLines.append(f'piStructC01 argument {argName}.')
 
-                    for argName, argInfo in existingArgs.items():
-                        newLines.append(
-                            f'piValue {className}.piBody:piClassGC:initArguments:{argName}:type {argInfo["type"]}')
-                        newLines.append(
-                            f'piValue {className}.piBody:piClassGC:initArguments:{argName}:value {argInfo["value"]}')
+                for argName, argInfo in existingArgs.items():
+                    newLines.append(
+                        f'piValue {className}.piBody:piClassGC:initArguments:{argName}:type {argInfo["type"]}')
+                    newLines.append(
+                        f'piValue {className}.piBody:piClassGC:initArguments:{argName}:value {argInfo["value"]}')
 
-                continue
-            else:
-                newLines.append(line)
-                i += 1
+            sectionSplices.append((structLineNo + 1, i, newLines))
+
+        if structLineNos:
+            if changed:
+                for startLineNo, endLineNo, newLines in reversed(sectionSplices):
+                    seedDoc.splice(startLineNo, endLineNo, newLines)
+            return changed
 
         # If initArguments structure wasn't found, add it
-        if not foundInitArgs and initArgs:
+        if initArgs:
             # Find a good place to insert (after piClassName)
-            insertIndex = len(newLines)
-            classNamePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:piClassName\s+'
-
-            for idx in range(len(newLines)):
-                if re.match(classNamePattern, newLines[idx]):
-                    insertIndex = idx + 1
-                    break
+            insertIndex = len(lines)
+            classNameLineNos = seedDoc.findValues(
+                'piValue', f'{className}.piBody:piClassGC:piClassName')
+            if classNameLineNos:
+                insertIndex = classNameLineNos[0] + 1
 
             # Insert initArguments structure
-            newLines.insert(
-                insertIndex, f'piStructA00 {className}.piBody:piClassGC:initArguments')
-            insertIndex += 1
+            newLines = [f'piStructA00 {className}.piBody:piClassGC:initArguments']
 
             # Add argument definitions
             for argName, argInfo in initArgs.items():
-                newLines.insert(
-                    insertIndex, f'piStructC01 argument {argName}.')
-                insertIndex += 1
+                newLines.append(f'piStructC01 argument {argName}.')
 
             for argName, argInfo in initArgs.items():
                 escapedValue = escapeValueForPiSeed(argInfo["value"])
-                newLines.insert(
-                    insertIndex, f'piValue {className}.piBody:piClassGC:initArguments:{argName}:type {argInfo["type"]}')
-                insertIndex += 1
-                newLines.insert(
-                    insertIndex, f'piValue {className}.piBody:piClassGC:initArguments:{argName}:value {escapedValue}')
-                insertIndex += 1
+                newLines.append(
+                    f'piValue {className}.piBody:piClassGC:initArguments:{argName}:type {argInfo["type"]}')
+                newLines.append(
+                    f'piValue {className}.piBody:piClassGC:initArguments:{argName}:value {escapedValue}')
 
+            seedDoc.splice(insertIndex, insertIndex, newLines)
             changed = True
 
-        return '\n'.join(newLines), changed
+        return changed
 
     except Exception as e:
         printIt(f"Error updating seed init arguments: {e}", label.ERROR)
-        return seedContent, False
+        return False
 
 
 def extractPiClassTypesFromInitArgs(seedContent: str, className: str) -> Set[str]:
@@ -2454,26 +2256,19 @@ def extractPiClassTypesFromInitArgs(seedContent: str, className: str) -> Set[str
     printIt('extractPiClassTypesFromInitArgs', showDefNames03)
     try:
         piClassTypes = set()
-        lines = seedContent.split('\n')
 
-        # Pattern to match initArguments type definitions
-        typePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:initArguments:(\w+):type\s+(.+)$'
+        # initArguments type definitions
+        for argName, argType in getPiSeedQuery(seedContent, className).argTypeLines:
+            argType = argType.strip('"')
 
-        for line in lines:
-            line = line.strip()
-            match = re.match(typePattern, line)
-            if match:
-                argName = match.group(1)
-                argType = match.group(2).strip('"')
-
-                # Check if this is a Pi class type (starts with Pi and is capitalized)
-                if argType.startswith('Pi') and argType[2:3].isupper():
-                    piClassTypes.add(argType)
-                    if argType.startswith('Pi') and len(argType) > 2:
-                        # Also add the module name (e.g., PiUserProfile -> piUserProfile)
-                        moduleName = argType[2].lower(
-                        ) + argType[3:] if len(argType) > 3 else argType[2:].lower()
-                        piClassTypes.add(moduleName)
+            # Check if this is a Pi class type (starts with Pi and is capitalized)
+            if argType.startswith('Pi') and argType[2:3].isupper():
+                piClassTypes.add(argType)
+                if argType.startswith('Pi') and len(argType) > 2:
+                    # Also add the module name (e.g., PiUserProfile -> piUserProfile)
+                    moduleName = argType[2].lower(
+                    ) + argType[3:] if len(argType) > 3 else argType[2:].lower()
+                    piClassTypes.add(moduleName)
 
         return piClassTypes
 
@@ -2529,208 +2324,204 @@ def extractImportStatements(importNodes: List) -> Tuple[Dict[str, Dict[str, str]
         return {}, []
 
 
-def updateSeedFromImports(seedContent: str, className: str, fromImports: Dict[str, Dict[str, str]]) -> Tuple[str, bool]:
+@profileDef("sync element", "fromImports")
+def updateSeedFromImports(seedDoc: PiSeedDocument, className: str, fromImports: Dict[str, Dict[str, str]]) -> bool:
     """
-    Update fromImports in the piSeed file content.
-    Returns (updated_content, was_changed)
+    Update fromImports in the piSeed document.
+    Returns was_changed
     """
     printIt('updateSeedFromImports', showDefNames03)
     try:
-        lines = seedContent.split('\n')
-        newLines = []
+        lines = seedDoc.lines
         changed = False
 
         # Patterns to match fromImports entries
-        structPattern = rf'^piStructA00\s+{re.escape(className)}\.piBody:piClassGC:fromImports\s*$'
-        importStructPattern = rf'^piStructC01\s+fromImports\s+(\w+)\.\s*$'
-        importFromPattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:fromImports:(\w+):from\s+'
-        importImportPattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:fromImports:(\w+):import\s+'
-
-        i = 0
-        foundFromImports = False
-
-        while i < len(lines):
-            line = lines[i]
-
-            # Check if we found the fromImports structure declaration
-            if re.match(structPattern, line):
-                foundFromImports = True
-                newLines.append(line)
-                i += 1
-
-                # Skip existing import definitions
-                while i < len(lines):
-                    line = lines[i]
-                    if (re.match(importStructPattern, line) or
-                        re.match(importFromPattern, line) or
-                            re.match(importImportPattern, line)):
-                        i += 1
-                        continue
-                    else:
-                        break
+        structTitle = f'{className}.piBody:piClassGC:fromImports'
+        importStructPattern = getSeedPattern(className, "fromImportsStruct")
+        importFromPattern = getSeedPattern(className, "fromImportsFrom")
+        importImportPattern = getSeedPattern(className, "fromImportsImport")
 
-                # Add new import definitions
-                for module_name, import_info in fromImports.items():
-                    # Clean module name for piSeed (replace dots, hyphens with underscores)
-                    clean_module = module_name.replace(
-                        '.', '_').replace('-', '_')
-                    newLines.append(f'piStructC01 fromImports {clean_module}.')
-
-                for module_name, import_info in fromImports.items():
-                    clean_module = module_name.replace(
-                        '.', '_').replace('-', '_')
-                    newLines.append(
-                        f'piValue {className}.piBody:piClassGC:fromImports:{clean_module}:from "{import_info["from"]}"')
-                    newLines.append(
-                        f'piValue {className}.piBody:piClassGC:fromImports:{clean_module}:import "{import_info["import"]}"')
-
-                changed = True
-                continue
-            else:
-                newLines.append(line)
-                i += 1
+        # New import definitions
+        newLines = []
+        for module_name, import_info in fromImports.items():
+            # Clean module name for piSeed (replace dots, hyphens with underscores)
+            clean_module = module_name.replace('.', '_').replace('-', '_')
+            newLines.append(f'piStructC01 fromImports {clean_module}.')
+
+        for module_name, import_info in fromImports.items():
+            clean_module = module_name.replace('.', '_').replace('-', '_')
+            newLines.append(
+                f'piValue {className}.piBody:piClassGC:fromImports:{clean_module}:from "{import_info["from"]}"')
+            newLines.append(
+                f'piValue {className}.piBody:piClassGC:fromImports:{clean_module}:import "{import_info["import"]}"')
+
+        # Replace the import definitions following each fromImports structure declaration
+        structLineNos = seedDoc.findStructs('piStructA00', structTitle)
+        for structLineNo in reversed(structLineNos):
+            i = structLineNo + 1
+            # Skip existing import definitions
+            while i < len(lines):
+                line = lines[i]
+                if (importStructPattern.match(line) or
+                    importFromPattern.match(line) or
+                        importImportPattern.match(line)):
+                    i += 1
+                    continue
+                else:
+                    break
+            seedDoc.splice(structLineNo + 1, i, newLines)
+            changed = True
 
         # If fromImports structure wasn't found, add it
-        if not foundFromImports and fromImports:
+        if not structLineNos and fromImports:
             # Find a good place to insert (after headers)
-            insertIndex = len(newLines)
-            headersPattern = rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:headers\s+'
+            insertIndex = len(lines)
 
             # Look for existing headers section
-            for idx in range(len(newLines)):
-                if re.match(headersPattern, newLines[idx]):
-                    # Find end of headers section
-                    insertIndex = idx
-                    while insertIndex < len(newLines) and re.match(headersPattern, newLines[insertIndex]):
-                        insertIndex += 1
-                    break
+            headerLineNos = seedDoc.findValues(
+                'piValueA', f'{className}.piBody:piClassGC:headers')
+            if headerLineNos:
+                # Find end of headers section
+                insertIndex = headerLineNos[0]
+                for lineNo in headerLineNos:
+                    if lineNo != insertIndex:
+                        break
+                    insertIndex += 1
 
             # Insert fromImports structure
-            newLines.insert(
-                insertIndex, f'piStructA00 {className}.piBody:piClassGC:fromImports')
-            insertIndex += 1
-
-            # Add import definitions
-            for module_name, import_info in fromImports.items():
-                clean_module = module_name.replace('.', '_').replace('-', '_')
-                newLines.insert(
-                    insertIndex, f'piStructC01 fromImports {clean_module}.')
-                insertIndex += 1
-
-            for module_name, import_info in fromImports.items():
-                clean_module = module_name.replace('.', '_').replace('-', '_')
-                newLines.insert(
-                    insertIndex, f'piValue {className}.piBody:piClassGC:fromImports:{clean_module}:from "{import_info["from"]}"')
-                insertIndex += 1
-                newLines.insert(
-                    insertIndex, f'piValue {className}.piBody:piClassGC:fromImports:{clean_module}:import "{import_info["import"]}"')
-                insertIndex += 1
-
+            seedDoc.splice(insertIndex, insertIndex,
+                           [f'piStructA00 {structTitle}'] + newLines)
             changed = True
 
-        return '\n'.join(newLines), changed
+        return changed
 
     except Exception as e:
         printIt(f"Error updating seed fromImports: {e}", label.ERROR)
-        return seedContent, False
+        return False
 
 
-def updateSeedGlobals(seedContent: str, className: str, moduleGlobals: Dict[str, str]) -> Tuple[str, bool]:
+@profileDef("sync element", "globals")
+def updateSeedGlobals(seedDoc: PiSeedDocument, className: str, moduleGlobals: Dict[str, str]) -> bool:
     """
-    Update globals section in the piSeed file content for module-level assignments.
-    Returns (updated_content, was_changed)
+    Update globals section in the piSeed document for module-level assignments.
+    Returns was_changed; seedDoc is only spliced when something changed.
     """
     printIt('updateSeedGlobals', showDefNames03)
     if not moduleGlobals:
-        return seedContent, False
+        return False
 
-    lines = seedContent.split('\n')
-    newLines = []
+    lines = seedDoc.lines
+    sectionSplices = []
     changed = False
-    i = 0
 
     # Find the globals section or create it
-    globalsPattern = rf'^piStructA00\s+{re.escape(className)}\.piBody:piClassGC:globals\s*$'
-    foundGlobals = False
-
-    while i < len(lines):
-        line = lines[i]
+    structLineNos = seedDoc.findStructs('piStructA00', f'{className}.piBody:piClassGC:globals')
 
-        # Check if we found the globals structure declaration
-        if re.match(globalsPattern, line):
-            foundGlobals = True
-            newLines.append(line)
-            i += 1
+    for structLineNo in structLineNos:
+        i = structLineNo + 1
+        newLines = []
 
-            # Extract existing globals
-            existingGlobals = {}
-            while i < len(lines):
-                line = lines[i]
+        # Extract existing globals
+        existingGlobals = {}
+        while i < len(lines):
+            line = lines[i]
 
-                # Check for global variable definitions
-                globalVarPattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:globals:(\w+)\s+(.+)$'
-                globalVarMatch = re.match(globalVarPattern, line)
+            # Check for global variable definitions
+            globalVarPattern = getSeedPattern(className, "globals")
+            globalVarMatch = globalVarPattern.match(line)
 
-                if globalVarMatch:
-                    varName = globalVarMatch.group(1)
-                    varValue = globalVarMatch.group(2)
-                    existingGlobals[varName] = varValue
-                    i += 1
-                    continue
+            if globalVarMatch:
+                varName = globalVarMatch.group(1)
+                varValue = globalVarMatch.group(2)
+                existingGlobals[varName] = varValue
+                i += 1
+                continue
 
-                # If we reach here, we're done with globals section
-                break
+            # If we reach here, we're done with globals section
+            break
 
-            # Compare and update globals
-            for varName, varValue in moduleGlobals.items():
-                if varName not in existingGlobals or existingGlobals[varName] != varValue:
-                    newLines.append(
-                        f'piValue {className}.piBody:piClassGC:globals:{varName} {varValue}')
-                    changed = True
-                elif varName in existingGlobals:
-                    # Keep existing line
-                    newLines.append(
-                        f'piValue {className}.piBody:piClassGC:globals:{varName} {existingGlobals[varName]}')
+        # Compare and update globals
+        for varName, varValue in moduleGlobals.items():
+            if varName not in existingGlobals or existingGlobals[varName] != varValue:
+                newLines.append(
+                    f'piValue {className}.piBody:piClassGC:globals:{varName} {varValue}')
+                changed = True
+            elif varName in existingGlobals:
+                # Keep existing line
+                newLines.append(
+                    f'piValue {className}.piBody:piClassGC:globals:{varName} {existingGlobals[varName]}')
+        sectionSplices.append((structLineNo + 1, i, newLines))
 
-            # Continue with the rest of the file
-            continue
-        else:
-            newLines.append(line)
-            i += 1
+    if changed:
+        for startLineNo, endLineNo, newLines in reversed(sectionSplices):
+            seedDoc.splice(startLineNo, endLineNo, newLines)
 
     # If globals section doesn't exist, create it after the class structure
-    if not foundGlobals and moduleGlobals:
+    if not structLineNos and moduleGlobals:
         # Find where to insert globals section (after piClassName line)
-        insertIndex = -1
-        for idx, line in enumerate(newLines):
-            classNamePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:piClassName\s+'
-            if re.match(classNamePattern, line):
-                insertIndex = idx + 1
-                break
+        classNameLineNos = seedDoc.findValues(
+            'piValue', f'{className}.piBody:piClassGC:piClassName')
 
-        if insertIndex != -1:
+        if classNameLineNos:
             # Insert globals structure and values
-            newLines.insert(
-                insertIndex, f'piStructA00 {className}.piBody:piClassGC:globals')
-            insertIndex += 1
+            newLines = [f'piStructA00 {className}.piBody:piClassGC:globals']
             for varName, varValue in moduleGlobals.items():
-                newLines.insert(
-                    insertIndex, f'piValue {className}.piBody:piClassGC:globals:{varName} {varValue}')
-                insertIndex += 1
+                newLines.append(
+                    f'piValue {className}.piBody:piClassGC:globals:{varName} {varValue}')
+            insertIndex = classNameLineNos[0] + 1
+            seedDoc.splice(insertIndex, insertIndex, newLines)
             changed = True
 
-    if changed:
-        return '\n'.join(newLines), True
-    else:
-        return seedContent, False
+    return changed
+
+
+@profileDef("sync element", "imports")
+def classHasSlots(classNode: ast.ClassDef) -> bool:
+    """True when the class body assigns __slots__."""
+    for item in classNode.body:
+        if isinstance(item, ast.Assign):
+            targets = item.targets
+        elif isinstance(item, ast.AnnAssign):
+            targets = [item.target]
+        else:
+            continue
+        if any(isinstance(target, ast.Name) and target.id == '__slots__' for target in targets):
+            return True
+    return False
 
+def updateSeedSlots(seedDoc: PiSeedDocument, className: str, hasSlots: bool) -> bool:
+    """
+    Set the slots flag in the piSeed document to whether the Python class
+    declares __slots__; the slot names are regenerated by genCode.
+    Returns was_changed; seedDoc is only spliced when the flag changed.
+    """
+    printIt('updateSeedSlots', showDefNames03)
+    try:
+        elementTitle = f'{className}.piBody:piClassGC:slots'
+        elementLineNos = seedDoc.findValues('piValue', elementTitle)
+        seedHasSlots = bool(elementLineNos) and \
+            isSlotsFlag(seedDoc.getValue(elementLineNos[-1]).strip('"\''))
+        if seedHasSlots == hasSlots:
+            return False
+        newLines = [f'piValue {elementTitle} True'] if hasSlots else []
+        if elementLineNos:
+            for lineNo in reversed(elementLineNos[1:]):
+                seedDoc.splice(lineNo, lineNo + 1, [])
+            seedDoc.splice(elementLineNos[0], elementLineNos[0] + 1, newLines)
+        else:
+            insertIndex = findCorrectInsertionPosition(seedDoc.lines, className, 'slots')
+            seedDoc.splice(insertIndex, insertIndex, newLines)
+        return True
+
+    except Exception as e:
+        printIt(f"Error updating seed slots: {e}", label.ERROR)
+        return False
 
-def updateSeedImports(seedContent: str, className: str, regularImports: List[str]) -> Tuple[str, bool]:
-    """Update regular imports in piSeed file"""
+def updateSeedImports(seedDoc: PiSeedDocument, className: str, regularImports: List[str]) -> bool:
+    """Update regular imports in piSeed document"""
     printIt('updateSeedImports', showDefNames03)
     try:
-        lines = seedContent.split('\n')
-        newLines = []
+        lines = seedDoc.lines
         changed = False
 
         # Find existing imports
@@ -2753,27 +2544,25 @@ def updateSeedImports(seedContent: str, className: str, regularImports: List[str
 
         if changed:
             # Insert imports after fromImports or headers
+            insertLineNos = []
             chk4FromImports = False
             for i, line in enumerate(lines):
                 if chk4FromImports:
-                    if 'fromImports' in line:
-                        newLines.append(line)
-                    else:
-                        newLines.extend(imports_to_add)
-                        newLines.append(line)
+                    if 'fromImports' not in line:
+                        insertLineNos.append(i)
                         chk4FromImports = False
-                else:
-                    newLines.append(line)
-                    if f'{className}.piBody:piClassGC:headers' in line:
-                        chk4FromImports = True
+                elif f'{className}.piBody:piClassGC:headers' in line:
+                    chk4FromImports = True
 
-            return '\n'.join(newLines), True
+            for insertLineNo in reversed(insertLineNos):
+                seedDoc.splice(insertLineNo, insertLineNo, imports_to_add)
+            return True
         else:
-            return seedContent, False
+            return False
 
     except Exception as e:
         printIt(f"Error updating seed imports: {e}", label.ERROR)
-        return seedContent, False
+        return False
 
 
 
@@ -2934,7 +2723,7 @@ def extractModuleDocstring(pythonContent: str) -> List[str]:
     """Extract module-level docstring"""
     printIt('extractModuleDocstring', showDefNames03)
     try:
-        tree = ast.parse(pythonContent)
+        tree = parseSource(pythonContent)
         if (tree.body and isinstance(tree.body[0], ast.Expr) and
             isinstance(tree.body[0].value, ast.Constant) and
                 isinstance(tree.body[0].value.value, str)):
@@ -3083,18 +2872,16 @@ def validateSyncResults(pythonFile: Path, piSeedFile: Path, changes: List[str]):
             warnings.append(f"Python path is not a file: {pythonFile}")
         else:
             try:
-                with open(pythonFile, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    if not content.strip():
-                        warnings.append(f"Python file is empty: {pythonFile}")
-
-                    # Try to parse as Python
-                    import ast
-                    try:
-                        ast.parse(content)
-                    except SyntaxError as e:
-                        warnings.append(
-                            f"Python syntax error in {pythonFile}: {e}")
+                parsedFile = getParsedFile(pythonFile)
+                if not parsedFile.content.strip():
+                    warnings.append(f"Python file is empty: {pythonFile}")
+
+                # Try to parse as Python
+                try:
+                    parsedFile.tree
+                except SyntaxError as e:
+                    warnings.append(
+                        f"Python syntax error in {pythonFile}: {e}")
 
             except Exception as e:
                 warnings.append(f"Cannot read Python file {pythonFile}: {e}")
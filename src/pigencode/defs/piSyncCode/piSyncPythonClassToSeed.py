@@ -3,10 +3,13 @@ import ast
 import traceback
 from json import dumps
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Optional
 from ...defs.logIt import printIt, label
 from ...defs.getSeedPath import getSeedPath
+from ...defs.piParseCache import readPythonFile, parsePythonFile
+from ...defs.piProfile import profileDef
 from ...classes.piSeeds import extractPiSeed
+from .piSeedDocument import PiSeedDocument
 from .piSyncCodeUtil import extractCodeDocStr, \
                         getNextPiSeedNumber, \
                         getDefDocString, \
@@ -19,16 +22,21 @@ from .piSyncCodeUtil import extractCodeDocStr, \
                         updateSeedInitArguments, \
                         extractMethodCode, \
                         extractStrCodeWithComparison, \
+                        isExactDefaultStrCode, \
                         extractJsonCodeWithComparison, \
                         mapMethodToCodeElement, \
                         extractImportStatements, \
                         extractPiClassTypesFromInitArgs, \
+                        extractInheritanceFromSeed, \
                         updateSeedFromImports, \
                         updateSeedImports, \
+                        classHasSlots, \
+                        updateSeedSlots, \
                         extractAssignmentCode, \
                         updateSeedGlobals, \
                         removeTrailingBlankLines, \
-                        escapeQuotesForPiSeed
+                        escapeQuotesForPiSeed, \
+                        findPiClassGCSeedFile
 
 piSeedValuePattern = r'["\'](.*)["\'].*$'
 global options
@@ -44,6 +52,7 @@ showDefNames03 = label.ABORTPRT
 # Intelligent pattern detection functions
 
 
+@profileDef("sync", "piClassGC")
 def createNewPiClassGCSeedFile(className: str, pythonFile: Path, seed_file: Path | None = None, dest_dir: str | None = None) -> Optional[Path]:
     """Create a new piClassGC piSeed file for the given class"""
     printIt(f'createNewPiClassGCSeedFile: {className}', showDefNames)
@@ -108,9 +117,8 @@ def createNewPiClassGCSeedFile(className: str, pythonFile: Path, seed_file: Path
         # 4. Add rawFromImports (empty for now)
 
         # 5. Add globals - extract module-level variables
-        with open(pythonFile, 'r', encoding='utf-8') as f:
-            pythonContent = f.read()
-        tree = ast.parse(pythonContent)
+        pythonContent = readPythonFile(pythonFile)
+        tree = parsePythonFile(pythonFile)
         
         # Extract module-level assignments (global variables)
         moduleGlobals = {}
@@ -148,7 +156,8 @@ def createNewPiClassGCSeedFile(className: str, pythonFile: Path, seed_file: Path
 
         # 7. Add inheritance (empty for now)
         # piValueA piTopic.piBody:piClassGC:inheritance PiPi
-        if class_info['classes'][1]:
+        # a class without bases has no base list after its name
+        if len(class_info['classes']) > 1 and isinstance(class_info['classes'][1], list):
             for inheritance in class_info['classes'][1]:
                 seedContent += f"piValueA {className}.piBody:piClassGC:inheritance {inheritance}\n"
 
@@ -188,10 +197,13 @@ def createNewPiClassGCSeedFile(className: str, pythonFile: Path, seed_file: Path
             for init_line in class_info['init_body']:
                 seedContent += f"piValueA {className}.piBody:piClassGC:initAppendCode \"{init_line}\"\n"
         # 13. Add genProps (empty for now)
+        # 14. Add slots, the slot names are regenerated from initArguments
+        if class_info.get('slots'):
+            seedContent += f"piValue {className}.piBody:piClassGC:slots True\n"
 
-        # 14. Add strCode (will be added by sync function)
-        # 15. Add jsonCode (will be added by sync function)
-        # 16. Add classDefCode (class methods)
+        # 15. Add strCode (will be added by sync function)
+        # 16. Add jsonCode (will be added by sync function)
+        # 17. Add classDefCode (class methods)
         if class_info.get('class_methods'):
             classDefCode = f"piStructA00 {className}.piBody:piClassGC:classDefCode\n"
             methodContent = ''
@@ -244,7 +256,7 @@ def createNewPiClassGCSeedFile(className: str, pythonFile: Path, seed_file: Path
             seedContent += '\n'.join(methodNameContent) + '\n'
             seedContent += methodContent
         
-        # 17. Add globalCode - extract module-level functions
+        # 18. Add globalCode - extract module-level functions
         if globalFunctions:
             for func in globalFunctions:
                 isProperty, funcCode = extractMethodCode('global', pythonContent, func)
@@ -303,8 +315,7 @@ def analyzePythonClassFile(className: str, pythonFile: Path) -> Dict:
     """
     printIt('analyzePythonClassFile', showDefNames02)
     try:
-        with open(pythonFile, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = readPythonFile(pythonFile)
         contentList = content.split('\n')
         lenContent = len(contentList)
 
@@ -318,13 +329,14 @@ def analyzePythonClassFile(className: str, pythonFile: Path) -> Dict:
             'init_body': [],
             'init_preSupe': [],
             'init_postSuper': [],
-            'class_methods': {}
+            'class_methods': {},
+            'slots': False
         }
         # Extract headers from content
         codeLines, _ = extractCodeDocStr(contentList)
         info['headers'].extend(codeLines)
 
-        tree = ast.parse(content)
+        tree = parsePythonFile(pythonFile)
         # Extract imports and classes
         for node in tree.body:
             if isinstance(node, ast.Import):
@@ -361,6 +373,7 @@ def analyzePythonClassFile(className: str, pythonFile: Path) -> Dict:
                 startline = node.lineno
                 codeLines, _ = extractCodeDocStr(contentList,startline)
                 info['classComment'].extend(codeLines)
+                info['slots'] = classHasSlots(node)
 
                 # Extract all methods from the class
                 class_methods = {}
@@ -615,6 +628,7 @@ def analyzePythonClassFile(className: str, pythonFile: Path) -> Dict:
         printIt(f"Error analyzing Python class file {pythonFile}: {e}", label.ERROR)
         return {}
 
+@profileDef("sync", "piClassGC")
 def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | None = None) -> List[str]:
     """
     Sync changes from Python class file back to piClassGC piSeed file.
@@ -627,17 +641,16 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
 
     try:
         # Read the Python file and extract method/function bodies
-        with open(pythonFile, 'r', encoding='utf-8') as f:
-            pythonContent = f.read()
+        pythonContent = readPythonFile(pythonFile)
 
         # Read the piSeed file
         with open(piSeedFile, 'r', encoding='utf-8') as f:
-            seedContent = f.read()
-        #hprint('seedContent00', seedContent)
+            seedDoc = PiSeedDocument(f.read())
+        #hprint('seedContent00', seedDoc.text)
         # Parse Python file to extract methods and code elements
 
         try:
-            tree = ast.parse(pythonContent)
+            tree = parsePythonFile(pythonFile)
         except SyntaxError as e:
             printIt(
                 f"WARN: Syntax error in {pythonFile.name}: {e}. Skipping sync.", label.WARN)
@@ -670,7 +683,12 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
                     # Include both regular assignments and annotated assignments (baseRealms: dict = {...})
                     moduleAssignments.append(node)
 
+            # from json import dumps added by genCode for its default __str__
+            genStrImport = False
             if classNode:
+                # __slots__ is regenerated from the seed, only its flag is synced
+                if updateSeedSlots(seedDoc, className, classHasSlots(classNode)):
+                    changes.append("slots")
                 # Process each method in the class
                 for item in classNode.body:
                     if isinstance(item, ast.FunctionDef):
@@ -678,11 +696,11 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
                         if methodName == '__init__':
                             # Special handling for __init__ method - compare with expected method from piSeed
                             initCodeElements = extractInitCodeWithComparison(
-                                pythonContent, item, className, seedContent)
+                                pythonContent, item, className, seedDoc.text)
 
                             for codeType, codeLines in initCodeElements.items():
                                 # IMPROVED LOGIC: Use intelligent pattern detection instead of force flag
-                                if shouldPreserveElegantPattern(seedContent, className, codeType, codeLines, options):
+                                if shouldPreserveElegantPattern(seedDoc.text, className, codeType, codeLines, options):
                                     if options.get('stats', False):
                                         printIt(
                                             f"PRESERVE: Skipping {codeType} for {className} - preserving elegant pattern", label.DEBUG)
@@ -690,52 +708,50 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
 
                                 # Real changes detected - sync them
                                 if codeLines:
-                                    newSeedContent, changed = updateSeedCodeElement(
-                                        seedContent, className, codeType, codeLines
+                                    changed = updateSeedCodeElement(
+                                        seedDoc, className, codeType, codeLines
                                     )
                                     if changed:
-                                        seedContent = newSeedContent
                                         changes.append(f"{codeType}")
 
                             # Extract and sync initArguments only if no elegant references exist
                             initArgs = extractInitArguments(item)
-                            if initArgs and not hasElegantValueReferences(seedContent, className):
-                                newSeedContent, changed = updateSeedInitArguments(seedContent, className, initArgs)
+                            if initArgs and not hasElegantValueReferences(seedDoc.text, className):
+                                changed = updateSeedInitArguments(seedDoc, className, initArgs)
                                 if changed:
-                                    seedContent = newSeedContent
                                     changes.append("initArguments")
                         elif methodName == '__str__':
                             # IMPROVED LOGIC: Always extract and check for real changes
                             isPropertry, methodCode = extractMethodCode(methodName, pythonContent, item)
+                            genStrImport = isExactDefaultStrCode(methodCode, className) and \
+                                f'{className}.piBody:piClassGC:strCode' not in seedDoc.text
                             if methodCode:
                                 # Use intelligent pattern detection
-                                if shouldPreserveElegantPattern(seedContent, className, 'strCode', methodCode, options):
+                                if shouldPreserveElegantPattern(seedDoc.text, className, 'strCode', methodCode, options):
                                     if options.get('stats', False):
                                         printIt(
                                             f"PRESERVE: strCode for {className} - preserving default pattern", label.DEBUG)
                                 else:
                                     # Real changes detected - sync them
                                     strCodeLines = extractStrCodeWithComparison(
-                                        pythonContent, item, className, seedContent)
+                                        pythonContent, item, className, seedDoc.text)
                                     if strCodeLines:
-                                        newSeedContent, changed = updateSeedCodeElement(
-                                            seedContent, className, 'strCode', strCodeLines
+                                        changed = updateSeedCodeElement(
+                                            seedDoc, className, 'strCode', strCodeLines
                                         )
                                         if changed:
-                                            seedContent = newSeedContent
                                             changes.append("strCode (__str__)")
                         elif methodName == 'json':
                             # Special handling for json method - compare with expected default method from piGenCode
                             jsonCodeLines = extractJsonCodeWithComparison(
-                                pythonContent, item, className, seedContent)
+                                pythonContent, item, className, seedDoc.text, str(pythonFile.parent))
 
                             # Only sync if there are actual custom jsonCode lines (not default)
                             if jsonCodeLines:
-                                newSeedContent, changed = updateSeedCodeElement(
-                                    seedContent, className, 'jsonCode', jsonCodeLines
+                                changed = updateSeedCodeElement(
+                                    seedDoc, className, 'jsonCode', jsonCodeLines
                                 )
                                 if changed:
-                                    seedContent = newSeedContent
                                     changes.append("jsonCode (json)")
                         else:
                             # Map Python method names to piSeed code element names
@@ -744,7 +760,7 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
                                 isPropertry, methodCode = extractMethodCode(codeElementName, pythonContent, item)
 
                                 # IMPROVED LOGIC: Use intelligent pattern detection for all methods
-                                if shouldPreserveElegantPattern(seedContent, className, codeElementName, methodCode, options):
+                                if shouldPreserveElegantPattern(seedDoc.text, className, codeElementName, methodCode, options):
                                     if options.get('stats', False):
                                         printIt(
                                             f"PRESERVE: {codeElementName} for {className} - preserving pattern", label.DEBUG)
@@ -753,16 +769,15 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
                                 if methodCode:
                                     if codeElementName == 'classDefCode':
                                         # Special handling for classDefCode - it's a dictionary of methods
-                                        newSeedContent, changed = updateSeedClassDefCode(
-                                            seedContent, className, methodName, methodCode
+                                        changed = updateSeedClassDefCode(
+                                            seedDoc, className, methodName, methodCode
                                         )
                                     else:
                                         # Regular code elements (strCode, jsonCode, etc.)
-                                        newSeedContent, changed = updateSeedCodeElement(
-                                            seedContent, className, codeElementName, methodCode
+                                        changed = updateSeedCodeElement(
+                                            seedDoc, className, codeElementName, methodCode
                                         )
                                     if changed:
-                                        seedContent = newSeedContent
                                         changes.append(
                                             f"{codeElementName} ({methodName})")
 
@@ -774,7 +789,11 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
                 if fromImports:
                     # IMPROVED LOGIC: Filter out Pi class imports that are already handled by initArguments
                     piClassTypes = extractPiClassTypesFromInitArgs(
-                        seedContent, className)
+                        seedDoc.text, className)
+                    # genCode also imports the Pi classes it inherits from
+                    piClassTypes.update(inheritClass for inheritClass in
+                                        extractInheritanceFromSeed(seedDoc.text, className)
+                                        if inheritClass.startswith('Pi'))
 
                     # Filter out Pi class imports that genCode will automatically generate
                     filteredFromImports = {}
@@ -782,6 +801,16 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
                         from_part = import_info.get('from', '')
                         import_part = import_info.get('import', '')
 
+                        # genCode adds dumps again for the default __str__
+                        if genStrImport and from_part == 'json':
+                            importNames = [name.strip() for name in import_part.split(',')]
+                            if 'dumps' in importNames:
+                                importNames.remove('dumps')
+                                if not importNames:
+                                    continue
+                                import_part = ', '.join(importNames)
+                                import_info = {**import_info, 'import': import_part}
+
                         # Check if this is a Pi class import that's already in initArguments
                         shouldSkip = False
                         if import_part in piClassTypes or module_name in piClassTypes:
@@ -816,28 +845,26 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
                                 importLines.append(
                                     f"from {from_part} import {import_part}")
 
-                        if shouldPreserveElegantPattern(seedContent, className, 'fromImports', importLines, options):
+                        if shouldPreserveElegantPattern(seedDoc.text, className, 'fromImports', importLines, options):
                             if options.get('stats', False):
                                 printIt(
                                     f"PRESERVE: fromImports for {className} - preserving auto-generated imports", label.DEBUG)
                         else:
                             # Real changes detected - sync them
-                            newSeedContent, changed = updateSeedFromImports(
-                                seedContent, className, filteredFromImports
+                            changed = updateSeedFromImports(
+                                seedDoc, className, filteredFromImports
                             )
                             if changed:
-                                seedContent = newSeedContent
                                 changes.append("fromImports")
                     elif options.get('stats', False):
                         printIt(
                             f"SKIP: All fromImports for {className} filtered out - handled by initArguments", label.DEBUG)
 
                 if regularImports:
-                    newSeedContent, changed = updateSeedImports(
-                        seedContent, className, regularImports
+                    changed = updateSeedImports(
+                        seedDoc, className, regularImports
                     )
                     if changed:
-                        seedContent = newSeedContent
                         changes.append("imports")
 
             # Handle global functions and code
@@ -870,11 +897,10 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
 
                 # Update globals section if we have module assignments
                 if moduleGlobals:
-                    newSeedContent, changed = updateSeedGlobals(
-                        seedContent, className, moduleGlobals
+                    changed = updateSeedGlobals(
+                        seedDoc, className, moduleGlobals
                     )
                     if changed:
-                        seedContent = newSeedContent
                         changes.append("globals")
 
                 # Update globalCode section if we have global functions
@@ -882,18 +908,17 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
                     # Remove trailing blank lines more robustly
                     globalCode = removeTrailingBlankLines(globalCode)
 
-                    newSeedContent, changed = updateSeedCodeElement(
-                        seedContent, className, 'globalCode', globalCode
+                    changed = updateSeedCodeElement(
+                        seedDoc, className, 'globalCode', globalCode
                     )
                     if changed:
-                        seedContent = newSeedContent
                         changes.append("globalCode")
 
             # Write updated piSeed file if changes were made
             # if changes:
             #     # Rebuild the piSeed file in the correct order
             #     seedContent = rebuildPiSeedInCorrectOrder(
-            #         seedContent, className)
+            #         seedDoc.text, className)
 
             #     with open(piSeedFile, 'w', encoding='utf-8') as f:
             #         f.write(seedContent)
@@ -910,130 +935,119 @@ def syncPythonClassToSeed(pythonFile: Path, piSeedFile: Path, options: dict | No
 
     return changes
 
-def updateSeedClassDefCode(seedContent: str, className: str, methodName: str, methodCode: List[str]) -> Tuple[str, bool]:
+def checkSyncRoundTrip(codeFiles) -> dict[str, List[str]]:
+    """
+    Sync freshly generated files back to their piClassGC piSeed files
+    without writing them; files without one are skipped. Unedited genCode
+    output should change nothing, so every change is a round trip error.
+    Returns {fileName: changes}.
     """
-    Update classDefCode in the piSeed file content.
+    printIt('checkSyncRoundTrip', showDefNames)
+    roundTripChanges = {}
+    for codeFile in codeFiles:
+        pythonFile = Path(codeFile)
+        piSeedFile = findPiClassGCSeedFile(pythonFile)
+        if not piSeedFile: continue
+        changes = syncPythonClassToSeed(pythonFile, piSeedFile)
+        if changes:
+            roundTripChanges[pythonFile.name] = changes
+            printIt(f'{pythonFile.name} syncs back changed: {", ".join(changes)}', label.WARN)
+    return roundTripChanges
+
+@profileDef("sync element", "classDefCode")
+def updateSeedClassDefCode(seedDoc: PiSeedDocument, className: str, methodName: str, methodCode: List[str]) -> bool:
+    """
+    Update classDefCode in the piSeed document.
     classDefCode should be structured as:
     piStructA00 className.piBody:piClassGC:classDefCode
     piStructL01 methodName 'Method description'
     piValueA className.piBody:piClassGC:classDefCode:methodName "code line 1"
     piValueA className.piBody:piClassGC:classDefCode:methodName "code line 2"
-    Returns (updated_content, was_changed)
+    Returns was_changed
     """
     printIt('updateSeedClassDefCode', showDefNames03)
     try:
-        lines = seedContent.split('\n')
-        newLines = []
+        lines = seedDoc.lines
         changed = False
 
         # Check if classDefCode structure exists
-        structPattern = rf'^piStructA00\s+{re.escape(className)}\.piBody:piClassGC:classDefCode\s*$'
-        methodStructPattern = rf'^piStructL01\s+{re.escape(methodName)}\s+'
-        methodValuePattern = rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:classDefCode:{re.escape(methodName)}\s+'
-
-        hasStructure = False
-        hasMethod = False
+        structTitle = f'{className}.piBody:piClassGC:classDefCode'
+        methodTitle = f'{structTitle}:{methodName}'
+        oldStylePattern = rf'^piValueA\s+{re.escape(structTitle)}\s+".*def {re.escape(methodName)}\('
+        oldStyleValuePattern = rf'^piValueA\s+{re.escape(structTitle)}\s+'
+
+        hasStructure = bool(seedDoc.findStructs('piStructA00', structTitle))
+        methodLineNos = seedDoc.findValues('piStructL01', methodName)
+        hasMethod = bool(methodLineNos)
+
+        # New method code lines
+        methodLines = []
+        for codeLine in methodCode:
+            escapedCode = escapeQuotesForPiSeed(codeLine)
+            methodLines.append(f'piValueA {methodTitle} "{escapedCode}"')
+
+        # Method structures get the new method code and old-style classDefCode
+        # entries (without method name) for this method are removed
+        elementSplices = []
+        elementLineNos = sorted(methodLineNos + [lineNo for lineNo in
+            seedDoc.findValues('piValueA', structTitle)
+            if re.match(oldStylePattern, lines[lineNo])])
         i = 0
-
-        while i < len(lines):
-            line = lines[i]
-
-            # Check for classDefCode structure
-            if re.match(structPattern, line):
-                hasStructure = True
-                newLines.append(line)
-                i += 1
+        for lineNo in elementLineNos:
+            if lineNo < i:
                 continue
-
-            # Check for method structure
-            elif re.match(methodStructPattern, line):
-                hasMethod = True
-                newLines.append(line)
-                i += 1
-
+            if lineNo in methodLineNos:
                 # Skip existing method code lines
-                while i < len(lines) and re.match(methodValuePattern, lines[i]):
+                i = lineNo + 1
+                while i < len(lines) and re.match(rf'^piValueA\s+{re.escape(methodTitle)}\s+', lines[i]):
                     i += 1
-
-                # Add new method code
-                for codeLine in methodCode:
-                    escapedCode = escapeQuotesForPiSeed(codeLine)
-                    newLines.append(
-                        f'piValueA {className}.piBody:piClassGC:classDefCode:{methodName} "{escapedCode}"')
-                changed = True
-                continue
-
-            # Skip old-style classDefCode entries (without method name)
-            elif re.match(rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:classDefCode\s+".*def {re.escape(methodName)}\(', line):
+                elementSplices.append((lineNo + 1, i, methodLines))
+            else:
                 # Skip all lines for this method in old format
-                while i < len(lines) and re.match(rf'^piValueA\s+{re.escape(className)}\.piBody:piClassGC:classDefCode\s+', lines[i]):
+                i = lineNo
+                while i < len(lines) and re.match(oldStyleValuePattern, lines[i]):
                     nextLine = lines[i]
                     # Check if this is the start of a different method
                     if 'def ' in nextLine and f'def {methodName}(' not in nextLine:
                         break
                     i += 1
-                changed = True
-                continue
+                elementSplices.append((lineNo, i, []))
+            changed = True
 
-            else:
-                newLines.append(line)
-                i += 1
+        for startLineNo, endLineNo, newLines in reversed(elementSplices):
+            seedDoc.splice(startLineNo, endLineNo, newLines)
 
         # If structure doesn't exist, add it
         if not hasStructure:
             # Find a good place to insert (after piClassName)
-            insertIndex = len(newLines)
-            classNamePattern = rf'^piValue\s+{re.escape(className)}\.piBody:piClassGC:piClassName\s+'
-
-            for idx in range(len(newLines)):
-                if re.match(classNamePattern, newLines[idx]):
-                    insertIndex = idx + 1
-                    break
-
-            # Add structure
-            newLines.insert(
-                insertIndex, f'piStructA00 {className}.piBody:piClassGC:classDefCode')
-            insertIndex += 1
-            newLines.insert(
-                insertIndex, f'piStructL01 {methodName} \'Custom method {methodName}\'')
-            insertIndex += 1
-
-            # Add method code
-            for codeLine in methodCode:
-                escapedCode = escapeQuotesForPiSeed(codeLine)
-                newLines.insert(
-                    insertIndex, f'piValueA {className}.piBody:piClassGC:classDefCode:{methodName} "{escapedCode}"')
-                insertIndex += 1
-
+            insertIndex = len(lines)
+            classNameLineNos = seedDoc.findValues(
+                'piValue', f'{className}.piBody:piClassGC:piClassName')
+            if classNameLineNos:
+                insertIndex = classNameLineNos[0] + 1
+
+            # Add structure and method code
+            seedDoc.splice(insertIndex, insertIndex, [
+                f'piStructA00 {structTitle}',
+                f'piStructL01 {methodName} \'Custom method {methodName}\''] + methodLines)
             changed = True
 
         # If structure exists but method doesn't, add method
         elif hasStructure and not hasMethod:
             # Find where to insert the method (after piStructA00 line)
-            insertIndex = len(newLines)
-            for idx in range(len(newLines)):
-                if re.match(structPattern, newLines[idx]):
-                    insertIndex = idx + 1
-                    break
+            structLineNos = seedDoc.findStructs('piStructA00', structTitle)
+            insertIndex = structLineNos[0] + 1 if structLineNos else len(lines)
 
             # Add method structure and code
-            newLines.insert(
-                insertIndex, f'piStructL01 {methodName} \'Custom method {methodName}\'')
-            insertIndex += 1
-
-            for codeLine in methodCode:
-                escapedCode = escapeQuotesForPiSeed(codeLine)
-                newLines.insert(
-                    insertIndex, f'piValueA {className}.piBody:piClassGC:classDefCode:{methodName} "{escapedCode}"')
-                insertIndex += 1
-
+            seedDoc.splice(insertIndex, insertIndex, [
+                f'piStructL01 {methodName} \'Custom method {methodName}\''] + methodLines)
             changed = True
 
-        return '\n'.join(newLines), changed
+        return changed
 
     except Exception as e:
         printIt(f"Error updating seed classDefCode: {e}", label.ERROR)
-        return seedContent, False
+        return False
 
 def rebuildPiSeedInCorrectOrder(seedContent: str, className: str) -> str:
     """
@@ -1062,6 +1076,7 @@ def rebuildPiSeedInCorrectOrder(seedContent: str, className: str) -> str:
             'postSuperInitCode': [],
             'initAppendCode': [],
             'genProps': '',
+            'slots': [],
             'strCode': [],
             'jsonCode': [],
             'classDefCode': {},
@@ -1207,6 +1222,9 @@ def rebuildPiSeedInCorrectOrder(seedContent: str, className: str) -> str:
             # genProps
             elif f'{className}.piBody:piClassGC:genProps' in line:
                 sections['genProps'].append(line)
+            # slots
+            elif f'{className}.piBody:piClassGC:slots' in line:
+                sections['slots'].append(line)
             # strCode
             elif f'{className}.piBody:piClassGC:strCode' in line:
                 sections['strCode'].append(line)
@@ -1332,11 +1350,13 @@ def rebuildPiSeedInCorrectOrder(seedContent: str, className: str) -> str:
         result.extend(sections['initAppendCode'])
         # 17. genProps
         result.extend(sections['genProps'])
-        # 18. strCode
+        # 18. slots
+        result.extend(sections['slots'])
+        # 19. strCode
         result.extend(sections['strCode'])
-        # 19. jsonCode
+        # 20. jsonCode
         result.extend(sections['jsonCode'])
-        # 20. classDefCode
+        # 21. classDefCode
         capturedLines = []
         classDefCode = sections['classDefCode']
         if classDefCode:
@@ -1348,7 +1368,7 @@ def rebuildPiSeedInCorrectOrder(seedContent: str, className: str) -> str:
                     result.extend(lines[:1])
                     capturedLines.extend(lines[1:])
             result.extend(capturedLines)
-        # 21. globalCode
+        # 22. globalCode
         #hprint("sections['globalCode']", sections['globalCode'])
         result.extend(sections['globalCode'])
         # i = 1
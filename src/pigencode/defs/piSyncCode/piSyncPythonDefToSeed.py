@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from ..logIt import printIt, label
 from ..getSeedPath import getSeedPath
+from ..piParseCache import readPythonFile, parsePythonFile
+from ..piProfile import profileDef
 from ...classes.piGenCode import PiGenCode
 from .piSyncCodeUtil import \
     getNextPiSeedNumber, \
@@ -29,6 +31,7 @@ showDefNames02 = label.ABORTPRT
 showDefNames03 = label.ABORTPRT
 # Intelligent pattern detection functions
 
+@profileDef("sync", "piDefGC")
 def createNewPiDefGCSeedFile(defName: str, pythonFile: Path, seed_file: Path | None = None, dest_dir: str | None = None) -> Optional[Path]:
     """Create a new piDefGC piSeed file for the given function definition file"""
     printIt(f'createNewPiDefGCSeedFile: {defName}', showDefNames)
@@ -117,10 +120,9 @@ def analyzePythonDefFile(pythonFile: Path) -> Dict:
     """
     printIt('analyzePythonDefFile', showDefNames02)
     try:
-        with open(pythonFile, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = readPythonFile(pythonFile)
 
-        tree = ast.parse(content)
+        tree = parsePythonFile(pythonFile)
 
         info = {
             'imports': [],
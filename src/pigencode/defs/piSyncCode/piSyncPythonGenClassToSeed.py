@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from ..logIt import printIt, label
 from ..getSeedPath import getSeedPath
+from ..piParseCache import readPythonFile, parsePythonFile
+from ..piProfile import profileDef
 from ...classes.piGenCode import PiGenCode
 from .piSyncCodeUtil import \
     getNextPiSeedNumber, \
@@ -36,10 +38,9 @@ def analyzeMultiClassFile(pythonFile: Path) -> Dict:
     """
     printIt(f'analyzeMultiClassFile: {str(pythonFile)}', showDefNames)
     try:
-        with open(pythonFile, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = readPythonFile(pythonFile)
         # print(content)
-        tree = ast.parse(content)
+        tree = parsePythonFile(pythonFile)
 
         info = {
             'imports': [],
@@ -130,6 +131,7 @@ def analyzeMultiClassFile(pythonFile: Path) -> Dict:
             f"Error analyzing multi-class file {pythonFile}: {e}", label.ERROR)
         return {}
 
+@profileDef("sync", "piGenClass")
 def createNewPiGenClassSeedFile(className: str, pythonFile: Path, seed_file: Path | None = None, dest_dir: str | None = None) -> Optional[Path]:
     """
     Create a new piGenClass piSeed file for handling multiple classes in a single file.
@@ -262,6 +264,7 @@ piValueA {className}.piBody:piGenClass:headers '# {className} classes - synced f
             f"Error creating new piGenClass piSeed file for {className}: {e}", label.ERROR)
         return None
 
+@profileDef("sync", "piGenClass")
 def syncPythonGenClassToSeed(pythonFile: Path, piSeedFile: Path) -> List[str]:
     """
     Sync changes from Python multi-class file back to piGenClass piSeed file.
@@ -273,8 +276,7 @@ def syncPythonGenClassToSeed(pythonFile: Path, piSeedFile: Path) -> List[str]:
     try:
 
         # Read the Python file
-        with open(pythonFile, 'r', encoding='utf-8') as f:
-            pythonContent = f.read()
+        pythonContent = readPythonFile(pythonFile)
 
         # Read the piSeed file
         with open(piSeedFile, 'r', encoding='utf-8') as f:
@@ -282,7 +284,7 @@ def syncPythonGenClassToSeed(pythonFile: Path, piSeedFile: Path) -> List[str]:
 
         # Parse Python file to extract elements
         try:
-            tree = ast.parse(pythonContent)
+            tree = parsePythonFile(pythonFile)
             className = pythonFile.stem
 
             # Extract different elements from the Python file
@@ -0,0 +1,193 @@
+import os, atexit
+from pathlib import Path
+from json import load, dump, JSONDecodeError
+from .logIt import logIt
+from .piCodeFile import writeCodeFile
+from .piGermManifest import getFileMD5
+
+# Tracking file styles:
+#   piclass - PiGenCode .piclass: header, sorted names, '#' lines dropped on read
+#   pidefs  - PiGenDefCode .pidefs: header, sorted names, every line kept on read
+#   append  - PiGenClassCode .piclass: no header, names kept in the order added
+trackingStyles = ("piclass", "pidefs", "append")
+
+# When deferred, updates are queued as (trackingFile, fileName, style, trackingDir)
+# and returned by popTrackingUpdates (parallel genCode workers).
+trackingDeferred = False
+pendingTrackingUpdates: list[tuple[str, str, str, str]] = []
+
+# Otherwise updates are applied to the lines of each tracking file held in memory
+# and written once per file by flushTrackingFiles.
+trackingFileLines: dict[str, list[str]] = {}
+
+# Root registry of the directories holding tracking files, kept in the cwd so
+# rmGC finds them without walking the project tree:
+#   {trackingFileName: [trackingDir, ...]}
+trackingRegistryFileName = ".piTrackedDirs.json"
+
+# Root manifest of every generated file and tracking file with the md5 of the
+# content genCode wrote, so rmGC removes exactly these files and keeps the ones
+# edited by hand since:
+#   {"version": 1, "outputs": {outputFile: md5}}
+outputManifestFileName = ".piGenManifest.json"
+outputManifestVersion = 1
+
+# Generated files added since the last flush, hashed when the manifest is updated.
+trackedOutputFiles: set[str] = set()
+
+def _readTrackingLines(trackingFile: str) -> list[str]:
+    trackingLines = []
+    if os.path.isfile(trackingFile):
+        try:
+            with open(trackingFile, 'r', encoding='utf-8') as f:
+                trackingLines = [line.strip() for line in f]
+        except Exception as e:
+            logIt(f'Warning: Could not read tracking file {trackingFile}: {e}')
+    return trackingLines
+
+def _applyTrackingUpdate(trackingLines: list[str], fileName: str, style: str, trackingDir: str) -> list[str]:
+    if style == "append":
+        if fileName not in trackingLines:
+            trackingLines = trackingLines + [fileName]
+        return trackingLines
+    generatedFiles = set(line for line in trackingLines if line)
+    if style == "piclass":
+        generatedFiles = set(line for line in generatedFiles if not line.startswith('#'))
+    generatedFiles.add(fileName)
+    return [f"# piGenCode tracking file for directory: {trackingDir}",
+            "# Generated files in this directory:"] + sorted(generatedFiles)
+
+def _writeTrackingLines(trackingFile: str, trackingLines: list[str]):
+    '''Write trackingLines, leaving the file untouched when they are unchanged.'''
+    try:
+        writeCodeFile(trackingFile, "".join(f"{trackingLine}\n" for trackingLine in trackingLines),
+                      encoding='utf-8')
+    except Exception as e:
+        logIt(f'Warning: Could not update tracking file {trackingFile}: {e}')
+
+def updateTrackingFile(trackingFile: str, fileName: str, style: str, trackingDir=""):
+    '''Add fileName (base name of a generated file) to trackingFile.'''
+    if trackingDeferred:
+        pendingTrackingUpdates.append((str(trackingFile), fileName, style, str(trackingDir)))
+        return
+    trackingFile = str(trackingFile)
+    trackedOutputFiles.add(os.path.join(os.path.dirname(trackingFile), fileName))
+    if trackingFile not in trackingFileLines:
+        trackingFileLines[trackingFile] = _readTrackingLines(trackingFile)
+    trackingFileLines[trackingFile] = _applyTrackingUpdate(
+        trackingFileLines[trackingFile], fileName, style, str(trackingDir))
+
+def deferTrackingUpdates(defer=True):
+    global trackingDeferred
+    trackingDeferred = defer
+
+def popTrackingUpdates() -> list[tuple[str, str, str, str]]:
+    trackingUpdates = list(pendingTrackingUpdates)
+    pendingTrackingUpdates.clear()
+    return trackingUpdates
+
+def mergeTrackingUpdates(trackingUpdates: list[tuple[str, str, str, str]]):
+    '''Apply queued updates in order, reading and writing each tracking file once.'''
+    for trackingFile, fileName, style, trackingDir in trackingUpdates:
+        updateTrackingFile(trackingFile, fileName, style, trackingDir)
+    flushTrackingFiles()
+
+def flushTrackingFiles():
+    '''Write every updated tracking file once, register its directory and
+       record the generated files in the output manifest.'''
+    if not trackingFileLines: return
+    trackedDirs: dict[str, set[str]] = {}
+    for trackingFile, trackingLines in trackingFileLines.items():
+        _writeTrackingLines(trackingFile, trackingLines)
+        trackingDir, trackingFileName = os.path.split(trackingFile)
+        trackedDirs.setdefault(trackingFileName, set()).add(_getCwdPath(trackingDir))
+        trackedOutputFiles.add(trackingFile)
+    trackingFileLines.clear()
+    registerTrackedDirs(trackedDirs)
+    recordOutputFiles(trackedOutputFiles)
+    trackedOutputFiles.clear()
+
+atexit.register(flushTrackingFiles)
+
+def _getCwdPath(filePath: str) -> str:
+    '''filePath relative to the cwd when below it, absolute otherwise.'''
+    absPath = Path(filePath).absolute()
+    try:
+        return str(absPath.relative_to(Path.cwd()))
+    except ValueError:
+        return str(absPath)
+
+def readTrackedDirs() -> dict[str, list[str]] | None:
+    '''Registered tracking directories, or None when no registry exists.'''
+    registryFile = Path.cwd().joinpath(trackingRegistryFileName)
+    if not registryFile.is_file(): return None
+    try:
+        with open(registryFile, 'r') as rf:
+            return load(rf)
+    except (JSONDecodeError, OSError) as e:
+        logIt(f'Warning: Could not read tracking registry {registryFile}: {e}')
+        return None
+
+def writeTrackedDirs(trackedDirs: dict[str, list[str]]):
+    '''Replace the registry; an empty registry removes the file.'''
+    registryFile = Path.cwd().joinpath(trackingRegistryFileName)
+    trackedDirs = {trackingFileName: dirs for trackingFileName, dirs in trackedDirs.items() if dirs}
+    try:
+        if trackedDirs:
+            with open(registryFile, 'w') as wf:
+                dump(trackedDirs, wf, indent=2)
+        elif registryFile.is_file():
+            registryFile.unlink()
+    except OSError as e:
+        logIt(f'Warning: Could not update tracking registry {registryFile}: {e}')
+
+def registerTrackedDirs(newTrackedDirs: dict[str, set[str]]):
+    trackedDirs = readTrackedDirs() or {}
+    changed = False
+    for trackingFileName, dirs in newTrackedDirs.items():
+        registeredDirs = trackedDirs.setdefault(trackingFileName, [])
+        for trackingDir in sorted(dirs - set(registeredDirs)):
+            registeredDirs.append(trackingDir)
+            changed = True
+    if changed:
+        writeTrackedDirs(trackedDirs)
+
+def readOutputManifest() -> dict[str, str] | None:
+    '''Recorded generated files with their md5, or None when no manifest exists.'''
+    manifestFile = Path.cwd().joinpath(outputManifestFileName)
+    if not manifestFile.is_file(): return None
+    try:
+        with open(manifestFile, 'r') as rf:
+            rawManifest = load(rf)
+        if rawManifest.get("version") == outputManifestVersion:
+            return rawManifest.get("outputs", {})
+    except (JSONDecodeError, OSError) as e:
+        logIt(f'Warning: Could not read output manifest {manifestFile}: {e}')
+    return None
+
+def writeOutputManifest(outputFiles: dict[str, str]):
+    '''Replace the manifest; an empty manifest removes the file.'''
+    manifestFile = Path.cwd().joinpath(outputManifestFileName)
+    try:
+        if outputFiles:
+            with open(manifestFile, 'w') as wf:
+                dump({"version": outputManifestVersion,
+                      "outputs": dict(sorted(outputFiles.items()))}, wf, indent=2)
+        elif manifestFile.is_file():
+            manifestFile.unlink()
+    except OSError as e:
+        logIt(f'Warning: Could not update output manifest {manifestFile}: {e}')
+
+def recordOutputFiles(newOutputFiles: set[str]):
+    '''Record the md5 of each file as genCode left it.'''
+    outputFiles = readOutputManifest() or {}
+    changed = False
+    for outputFile in newOutputFiles:
+        outputMD5 = getFileMD5(outputFile)
+        if not outputMD5: continue
+        outputKey = _getCwdPath(outputFile)
+        if outputFiles.get(outputKey) != outputMD5:
+            outputFiles[outputKey] = outputMD5
+            changed = True
+    if changed:
+        writeOutputManifest(outputFiles)
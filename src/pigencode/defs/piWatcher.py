@@ -0,0 +1,174 @@
+import os, sys, time, select, struct
+from .logIt import logIt, label
+
+class PiInotify():
+    '''
+        Minimal Linux inotify reader (through libc with ctypes) reporting the
+        paths of files created, written, moved or deleted in watched
+        directories. Raises OSError where inotify is not available.
+    '''
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    watchMask = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    eventHeader = struct.Struct('iIII')
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith('linux'):
+            raise OSError(f'inotify is not available on {sys.platform}')
+        import ctypes, ctypes.util
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.getErrno = ctypes.get_errno
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = self.getErrno()
+            raise OSError(errno, os.strerror(errno))
+        self.watchDirs: dict[int, str] = {}
+        self.overflowed = False
+
+    def addWatch(self, dirName: str):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirName), self.watchMask)
+        if wd < 0:
+            errno = self.getErrno()
+            raise OSError(errno, os.strerror(errno), dirName)
+        self.watchDirs[wd] = dirName
+
+    def read(self, timeout: float) -> set[str]:
+        '''Paths changed within timeout seconds; empty when none.'''
+        changedPaths = set()
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        while readable:
+            try:
+                eventData = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(eventData):
+                wd, mask, _, nameLen = self.eventHeader.unpack_from(eventData, offset)
+                offset += self.eventHeader.size
+                fileName = eventData[offset:offset + nameLen].rstrip(b'\0')
+                offset += nameLen
+                if mask & self.IN_Q_OVERFLOW:
+                    self.overflowed = True
+                elif wd in self.watchDirs and fileName:
+                    changedPaths.add(os.path.join(self.watchDirs[wd], os.fsdecode(fileName)))
+            readable, _, _ = select.select([self.fd], [], [], 0)
+        return changedPaths
+
+    def close(self):
+        os.close(self.fd)
+
+class PiWatcher():
+    '''
+        Keeps the (mtime, size) of every file in a set of directories and
+        reports which of them changed. Changes are seen through inotify when
+        available and by rescanning the directories every pollInterval
+        seconds otherwise.
+    '''
+    settleTime = 0.1    # seconds without events before changes are reported
+
+    def __init__(self, pollInterval: float = 0.5, usePolling: bool = False) -> None:
+        self.pollInterval = pollInterval
+        self.watchDirs: list[str] = []
+        self.fileStats: dict[str, tuple[int, int]] = {}
+        self.inotify: PiInotify | None = None
+        if not usePolling:
+            try:
+                self.inotify = PiInotify()
+            except (OSError, AttributeError) as e:
+                logIt(f'inotify not available, polling every {pollInterval}s: {e}', label.INFO)
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self.inotify else "polling"
+
+    def addDir(self, dirName):
+        dirName = os.path.abspath(dirName)
+        if dirName in self.watchDirs or not os.path.isdir(dirName): return
+        if self.inotify:
+            try:
+                self.inotify.addWatch(dirName)
+            except OSError as e:
+                logIt(f'inotify watch failed, polling every {self.pollInterval}s: {e}', label.WARN)
+                self.inotify.close()
+                self.inotify = None
+        self.watchDirs.append(dirName)
+        self.fileStats.update(self._scanDir(dirName))
+
+    def _scanDir(self, dirName: str) -> dict[str, tuple[int, int]]:
+        fileStats = {}
+        try:
+            with os.scandir(dirName) as dirEntries:
+                for dirEntry in dirEntries:
+                    if dirEntry.is_file():
+                        entryStat = dirEntry.stat()
+                        fileStats[dirEntry.path] = (entryStat.st_mtime_ns, entryStat.st_size)
+        except OSError:
+            pass
+        return fileStats
+
+    def markSeen(self, filePaths):
+        '''Take the current state of filePaths, files written in reaction to a
+           change, as unchanged. Other changes stay pending.'''
+        for filePath in filePaths:
+            filePath = os.path.abspath(filePath)
+            try:
+                fileStatResult = os.stat(filePath)
+                self.fileStats[filePath] = (fileStatResult.st_mtime_ns, fileStatResult.st_size)
+            except OSError:
+                self.fileStats.pop(filePath, None)
+
+    def _getChanges(self, candidatePaths) -> set[str]:
+        changedPaths = set()
+        for filePath in candidatePaths:
+            try:
+                fileStatResult = os.stat(filePath)
+                fileStat = (fileStatResult.st_mtime_ns, fileStatResult.st_size)
+            except OSError:
+                fileStat = None
+            if fileStat != self.fileStats.get(filePath):
+                changedPaths.add(filePath)
+                if fileStat is None:
+                    self.fileStats.pop(filePath, None)
+                else:
+                    self.fileStats[filePath] = fileStat
+        return changedPaths
+
+    def _getCandidates(self, timeout: float) -> set[str]:
+        if self.inotify:
+            candidatePaths = self.inotify.read(timeout)
+            if self.inotify.overflowed:
+                # events were dropped, compare every file
+                self.inotify.overflowed = False
+                candidatePaths |= self._getAllPaths()
+            return candidatePaths
+        time.sleep(timeout)
+        return self._getAllPaths()
+
+    def _getAllPaths(self) -> set[str]:
+        allPaths = set(self.fileStats)
+        for dirName in self.watchDirs:
+            allPaths.update(self._scanDir(dirName))
+        return allPaths
+
+    def wait(self) -> set[str]:
+        '''Block until files change and return their paths.'''
+        while True:
+            timeout = self.pollInterval if not self.inotify else None
+            candidatePaths = self._getCandidates(timeout)
+            # let a burst of writes (an editor save, a genCode run) settle
+            while candidatePaths:
+                moreCandidates = self._getCandidates(self.settleTime) if self.inotify else set()
+                if not moreCandidates: break
+                candidatePaths |= moreCandidates
+            changedPaths = self._getChanges(candidatePaths)
+            if changedPaths:
+                return changedPaths
+
+    def close(self):
+        if self.inotify:
+            self.inotify.close()
+            self.inotify = None